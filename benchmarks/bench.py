@@ -0,0 +1,249 @@
+"""
+Benchmarks for the dataframe validators at scale.
+
+Every expectation, and the full `validate_members` flow from
+validate/validator.py, is timed against synthetic member datasets for each
+validator and evaluation mode. Each case runs in a fresh process so its peak
+memory can be measured. Results are written as JSON to compare between runs.
+
+    python bench.py run --rows 1e5 1e6 --output results/baseline.json
+    python bench.py compare results/baseline.json results/branch.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable
+
+import polars as pl
+from dataframe_validator import PolarsDataFrameValidator, ValidatorDataFrame
+from dataframe_validator.metrics import Measurement
+
+from datasets import members_path
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "validate"))
+from validator import validate_members  # noqa: E402
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+EXPECTATIONS: dict[str, Callable] = {
+    "column_to_exist": lambda v: v.expect_column_to_exist("Member ID"),
+    "column_to_contain_unique_values": lambda v: (
+        v.expect_column_to_contain_unique_values("Nino")
+    ),
+    "column_to_contain_approximately_unique_values": lambda v: (
+        v.expect_column_to_contain_approximately_unique_values("Nino", 0.001)
+    ),
+    "column_value_greater_than": lambda v: v.expect_column_value_greater_than(
+        "Member ID", 0
+    ),
+    "column_a_greater_than_column_b": lambda v: v.expect_column_a_greater_than_column_b(
+        "Joining Date", "Date Of Birth"
+    ),
+    "column_value_to_be_in_set": lambda v: v.expect_column_value_to_be_in_set(
+        "Status", ["Active", "Retired", "Deferred"]
+    ),
+    "column_value_length_greater_than": lambda v: (
+        v.expect_column_value_length_greater_than("Nino", 8)
+    ),
+    "column_value_to_match_regex": lambda v: v.expect_column_value_to_match_regex(
+        "Nino", r"^[A-Z]{2}\d{6}[A-D]$"
+    ),
+    "column_value_to_be_between": lambda v: v.expect_column_value_to_be_between(
+        "Date Of Birth", date(1900, 1, 1), date(2025, 1, 1)
+    ),
+    "column_to_be_of_type": lambda v: v.expect_column_to_be_of_type(
+        "Member ID", pl.Int64
+    ),
+}
+
+# How each validator under test is built from the loaded frame
+VALIDATORS: dict[str, Callable] = {
+    "PolarsDataFrameValidator/eager": PolarsDataFrameValidator,
+    "PolarsDataFrameValidator/deferred": lambda df: PolarsDataFrameValidator(
+        df, deferred=True
+    ),
+    "PolarsDataFrameValidator/lazy": PolarsDataFrameValidator,
+    "ValidatorDataFrame/eager": ValidatorDataFrame,
+    "ValidatorDataFrame/deferred": lambda df: ValidatorDataFrame(df, deferred=True),
+}
+
+
+@dataclass
+class Case:
+    rows: int
+    profile: str
+    validator: str
+    expectation: str
+
+    @property
+    def lazy(self) -> bool:
+        return self.validator.endswith("/lazy")
+
+    @property
+    def name(self) -> str:
+        return f"{self.rows}/{self.profile}/{self.validator}/{self.expectation}"
+
+
+def run_case(case: Case, path: Path, repeat: int) -> dict:
+    """Time a case `repeat` times, run in a fresh process by `run`"""
+    lf = pl.scan_parquet(path / "*.parquet")
+    frame = lf if case.lazy else lf.collect()
+    seconds, fails_seconds, peak_memory = [], [], [0]
+    for _ in range(repeat):
+        with Measurement(interval=0.001) as memory:
+            start = time.perf_counter()
+            if case.expectation == "validate_members":
+                fail_rows = None
+                validate_members(frame, show_results=False)
+            else:
+                validator = EXPECTATIONS[case.expectation](
+                    VALIDATORS[case.validator](frame)
+                )
+                fail_rows = validator.validation_results[-1].fail_rows
+            seconds.append(time.perf_counter() - start)
+            if case.expectation != "validate_members":
+                start = time.perf_counter()
+                _ = validator.validation_fails
+                fails_seconds.append(time.perf_counter() - start)
+        peak_memory.append(memory.peak_memory_bytes or 0)
+
+    return {
+        **asdict(case),
+        "seconds_min": min(seconds),
+        "seconds_median": statistics.median(seconds),
+        "fails_seconds_min": min(fails_seconds) if fails_seconds else None,
+        "peak_memory_mb": max(peak_memory) / 2**20,
+        "fail_rows": fail_rows,
+    }
+
+
+def cases(rows: list[int], profiles: list[str], match: str | None) -> list[Case]:
+    """Every expectation for every validator, then the full flow"""
+    all_cases = []
+    for n in rows:
+        for profile in profiles:
+            for validator in VALIDATORS:
+                for expectation in EXPECTATIONS:
+                    all_cases.append(Case(n, profile, validator, expectation))
+            for validator in [
+                "PolarsDataFrameValidator/eager",
+                "PolarsDataFrameValidator/lazy",
+            ]:
+                all_cases.append(Case(n, profile, validator, "validate_members"))
+    return [case for case in all_cases if match is None or match in case.name]
+
+
+def run(args: argparse.Namespace):
+    rows = [int(float(n)) for n in args.rows]
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=1,
+    ) as pool:
+        for case in cases(rows, args.profile, args.match):
+            path = members_path(case.rows, case.profile, args.seed)
+            result = pool.submit(run_case, case, path, args.repeat).result()
+            print(
+                f"{case.name:<100} {result['seconds_median']:>9.3f}s"
+                f" {result['peak_memory_mb']:>9.1f}MiB"
+            )
+            results.append(result)
+
+    output = Path(args.output or RESULTS_DIR / f"{datetime.now():%Y%m%dT%H%M%S}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {
+                "metadata": {
+                    "created": datetime.now().isoformat(),
+                    "python": platform.python_version(),
+                    "polars": pl.__version__,
+                    "platform": platform.platform(),
+                    "cpu_count": multiprocessing.cpu_count(),
+                    "repeat": args.repeat,
+                    "seed": args.seed,
+                },
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+    print(f"Results written to {output}")
+
+
+def compare(args: argparse.Namespace) -> int:
+    """Print the change in median time and memory per case, returning 1 if
+    any case slowed down by more than `threshold` and `min_seconds`"""
+    baseline, current = (
+        pl.DataFrame(json.loads(Path(path).read_text())["results"])
+        for path in (args.baseline, args.current)
+    )
+    keys = ["rows", "profile", "validator", "expectation"]
+    compared = (
+        baseline.join(current, on=keys, suffix="_current")
+        .select(
+            *keys,
+            pl.col("seconds_median").alias("seconds"),
+            pl.col("seconds_median_current").alias("seconds_current"),
+            (pl.col("seconds_median_current") / pl.col("seconds_median")).alias(
+                "time_ratio"
+            ),
+            (pl.col("peak_memory_mb_current") - pl.col("peak_memory_mb")).alias(
+                "memory_change_mb"
+            ),
+        )
+        .with_columns(
+            # Ignore noise in cases that only take a few milliseconds
+            regressed=(pl.col("time_ratio") > 1 + args.threshold)
+            & (pl.col("seconds_current") - pl.col("seconds") > args.min_seconds)
+        )
+        .sort("time_ratio", descending=True)
+    )
+    with pl.Config(
+        tbl_rows=len(compared), tbl_cols=-1, tbl_width_chars=200, fmt_str_lengths=60
+    ):
+        print(compared)
+    regressions = compared["regressed"].sum()
+    print(f"{regressions} case(s) slower by more than {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("--rows", nargs="+", default=["1e5", "1e6"])
+    run_parser.add_argument(
+        "--profile", nargs="+", choices=["clean", "fails"], default=["clean", "fails"]
+    )
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--match", help="Only run cases whose name contains this")
+    run_parser.add_argument("--output", help="JSON file, defaults to results/")
+
+    compare_parser = commands.add_parser("compare", help="Compare two runs")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    compare_parser.add_argument("--min-seconds", type=float, default=0.01)
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+        return 0
+    return compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""
+Seeded synthetic member datasets for the benchmarks, generated by
+synthetic_datagen/generate_members_fast.py.
+
+Datasets are written once as chunked Parquet under `data/` and reused.
+"""
+
+import sys
+from dataclasses import fields
+from datetime import date
+from pathlib import Path
+from typing import Literal
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "synthetic_datagen"))
+from generate_members_fast import ErrorRates, write_members  # noqa: E402
+
+DATA_DIR = Path(__file__).parent / "data"
+# Fixed so that datasets don't change from one day to the next
+AS_OF = date(2025, 1, 1)
+
+Profile = Literal["clean", "fails"]
+
+# Rate of each kind of bad data in the "fails" profile
+FAIL_RATE = 0.01
+
+ERRORS: dict[Profile, ErrorRates] = {
+    "clean": ErrorRates.none(),
+    "fails": ErrorRates(**{field.name: FAIL_RATE for field in fields(ErrorRates)}),
+}
+
+
+def members_path(rows: int, profile: Profile, seed: int = 0) -> Path:
+    """Directory of Parquet chunks holding the dataset, generated if missing"""
+    path = DATA_DIR / f"members-{rows}-{profile}-{seed}"
+    if not path.exists():
+        tmp_path = path.with_suffix(".tmp")
+        write_members(tmp_path, rows, seed=seed, errors=ERRORS[profile], as_of=AS_OF)
+        tmp_path.rename(path)
+    return path
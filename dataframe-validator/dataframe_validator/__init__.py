@@ -1,9 +1,32 @@
 from .polars_validator import PolarsDataFrameValidator
 from .polars_validator_frame import ValidatorDataFrame
+from .polars_batch_validator import PolarsBatchValidator
+from .polars_partitioned_validator import PolarsPartitionedValidator
 from .exceptions import DataValidationError
+from .sketches import HyperLogLog
+from .metrics import ExpectationMetrics
+from .expectations import SchemaDiff
+from .suite import ExpectationSuite, CompiledSuite
+from .tables import validate_tables, validate_tables_async
+from .cache import ResultCache, file_fingerprint
+from .history import ValidationHistory
+from .quarantine import QuarantineManifest
 
 __all__ = [
     "PolarsDataFrameValidator",
     "ValidatorDataFrame",
+    "PolarsBatchValidator",
+    "PolarsPartitionedValidator",
     "DataValidationError",
+    "HyperLogLog",
+    "ExpectationMetrics",
+    "SchemaDiff",
+    "ExpectationSuite",
+    "CompiledSuite",
+    "validate_tables",
+    "validate_tables_async",
+    "ResultCache",
+    "file_fingerprint",
+    "ValidationHistory",
+    "QuarantineManifest",
 ]
@@ -0,0 +1,1055 @@
+import hashlib
+import json
+import polars as pl
+import polars.selectors as cs
+import shutil
+from pathlib import Path
+from typing import Any, Literal, Self
+from datetime import date, datetime
+from . import expectations
+from .cache import ResultCache, content_hash
+from .expectations import (
+    AggregateResult,
+    Expectation,
+    ResolvedPass,
+    ValidationResult,
+)
+from .exceptions import DataValidationError
+from .history import KEY, ValidationHistory, encode_keys
+from .metrics import ExpectationMetrics, Measurement, MetricsHook
+from .parquet_statistics import RowGroup, read_row_groups
+from .results import PASS_SCHEMA, RESULT_SCHEMA, SKIPPED, ResultTable
+from .quarantine import (
+    MANIFEST,
+    QuarantinedExpectation,
+    QuarantineFormat,
+    QuarantineManifest,
+    sink_part,
+    write_part,
+)
+
+ROW_INDEX = "__row_index"
+ROWS_SCANNED = "__rows_scanned"
+ROW_GROUP = "__row_group"
+
+
+def project(frame: pl.DataFrame | pl.LazyFrame, columns: list[str]):
+    """Select `columns` from a frame, skipping any it doesn't have"""
+    return frame.select(cs.by_name(columns, require_all=False))
+
+
+class BaseValidator:
+    """Expectation methods shared by the Polars validators.
+
+    Every `expect_*` method records an `Expectation`. In eager mode it is
+    evaluated straight away, in deferred mode recorded expectations are only
+    compiled into a single query plan the first time results are requested.
+    """
+
+    def _init_validator(
+        self,
+        deferred: bool = False,
+        streaming: bool = False,
+        max_fail_rows: int | None = None,
+        max_total_fail_rows: int | None = None,
+        fail_sample: Literal["head", "random"] = "head",
+        key_columns: list[str] | None = None,
+    ):
+        self.deferred = deferred
+        self.streaming = streaming
+        self.max_fail_rows = max_fail_rows
+        self.max_total_fail_rows = max_total_fail_rows
+        self.fail_sample = fail_sample
+        self.key_columns = key_columns
+        self._pending: list[Expectation] = []
+        self._expectations: list[Expectation] = []
+        self._results = ResultTable()
+        self._fail_indices: dict[int, pl.Series] = {}
+        self._observed: dict[int, Any] = {}
+        self._validation_fails: pl.DataFrame | None = None
+        self._metrics_hooks: list[MetricsHook] = []
+        self._passes = 0
+        self._cache: ResultCache | None = None
+        self._fingerprint: str | None = None
+        self._history: ValidationHistory | None = None
+        self._parquet_files: list[str] | None = None
+        self._row_groups: list[RowGroup] | None = None
+        self._max_failures: int | None = None
+        # Positions of expectations reported as skipped without evaluating them
+        self._unavailable: set[int] = set()
+
+    def _frame(self) -> pl.DataFrame | pl.LazyFrame:
+        """The frame being validated"""
+        raise NotImplementedError
+
+    def _schema(self) -> pl.Schema:
+        return self._frame().collect_schema()
+
+    @property
+    def projection(self) -> list[str] | None:
+        """Columns to read when `key_columns` is set, the key columns and those
+        of every recorded expectation, otherwise None to read every column"""
+        if self.key_columns is None:
+            return None
+        return list(
+            dict.fromkeys(
+                [
+                    *self.key_columns,
+                    *(
+                        column
+                        for expectation in [*self._expectations, *self._pending]
+                        for column in expectation.columns()
+                    ),
+                ]
+            )
+        )
+
+    def _project(self, frame: pl.DataFrame | pl.LazyFrame):
+        """The columns of `projection` in the frame, if set"""
+        projection = self.projection
+        return frame if projection is None else project(frame, projection)
+
+    def _collect(self, lf: pl.LazyFrame) -> pl.DataFrame:
+        """Execute a query plan, using the streaming engine if enabled"""
+        return lf.collect(engine="streaming" if self.streaming else "auto")
+
+    def _record(self, *expectations: Expectation) -> Self:
+        """Record expectations, evaluating them now unless deferred"""
+        if any(expectation.precondition for expectation in expectations):
+            schema = self._schema()
+            for expectation in expectations:
+                if expectation.precondition is not None:
+                    expectation.precondition(schema)
+        self._pending.extend(expectations)
+        if not self.deferred:
+            self._resolve()
+        return self
+
+    def _resolve(self):
+        """Evaluate all pending expectations in a single pass over the frame
+
+        In fail-fast mode, see `with_fail_fast`, they are evaluated in passes
+        of increasing cost instead, and once the failure threshold is reached
+        the rest are skipped.
+
+        Only the indices of failing rows are kept, see `validation_fails`.
+        """
+        if not self._pending:
+            return
+        pending = self._pending
+        start = len(self._results)
+        failures = (~self._results.frame["result"]).sum()
+        evaluated: dict[int, dict[str, Any]] = {}
+        for group in self._pass_groups(pending):
+            if self._max_failures is not None and failures >= self._max_failures:
+                break
+            self._passes += 1
+            with Measurement() as measurement:
+                resolved, cache_hit = self._resolve_pass([pending[i] for i in group])
+            for j, (i, row) in enumerate(
+                zip(group, resolved.results.iter_rows(named=True))
+            ):
+                evaluated[i] = {
+                    **row,
+                    "pass_id": self._passes,
+                    "pass_expectations": len(group),
+                    "wall_seconds": measurement.wall_seconds,
+                    "cpu_seconds": measurement.cpu_seconds,
+                    "peak_memory_bytes": measurement.peak_memory_bytes,
+                    "cache_hit": cache_hit,
+                }
+                if j in resolved.observed:
+                    self._observed[start + i] = resolved.observed[j]
+                indices = resolved.fail_indices.get(j)
+                if indices is not None and len(indices):
+                    self._fail_indices[start + i] = indices.alias(ROW_INDEX)
+                    self._validation_fails = None
+            failures += (~resolved.results["result"]).sum()
+        # Only cleared once evaluated, so `projection` includes the pending
+        self._pending = []
+
+        self._results.append(
+            pl.DataFrame(
+                [
+                    {
+                        "position": start + i,
+                        "column_name": expectation.column_name,
+                        "expectation_name": expectation.expectation_name,
+                        "expectation_args": expectation.result_args(),
+                        **evaluated.get(i, SKIPPED),
+                    }
+                    for i, expectation in enumerate(pending)
+                ],
+                schema=RESULT_SCHEMA,
+            )
+        )
+        self._expectations.extend(pending)
+        if self._metrics_hooks:
+            for metrics in self._results.metrics()[start:]:
+                if metrics.pass_id is not None:
+                    for hook in self._metrics_hooks:
+                        hook(metrics)
+
+    def _pass_groups(self, pending: list[Expectation]) -> list[list[int]]:
+        """Positions of the pending expectations evaluated in each pass, one
+        pass for all of them unless failing fast"""
+        start = len(self._results)
+        available = [
+            i for i in range(len(pending)) if start + i not in self._unavailable
+        ]
+        if not available:
+            return []
+        if self._max_failures is None:
+            return [available]
+        costs = {i: pending[i].cost() for i in available}
+        return [
+            [i for i in available if costs[i] == tier]
+            for tier in sorted(set(costs.values()))
+        ]
+
+    def _resolve_pass(self, pending: list[Expectation]) -> tuple[ResolvedPass, bool]:
+        """Results of one pass, from the result cache if there, and whether
+        they were"""
+        # Evaluating against a history stages the batch keys, so never skip it
+        key = (
+            self._cache_key(pending)
+            if self._cache is not None and self._history is None
+            else None
+        )
+        resolved = self._cache.get(key) if key is not None else None
+        if resolved is not None:
+            return resolved, True
+        resolved = self._evaluate_pending(pending)
+        if key is not None:
+            self._cache.put(key, resolved)
+        return resolved, False
+
+    def _evaluate_pending(self, pending: list[Expectation]) -> ResolvedPass:
+        """Results of the pending expectations, from one pass over the data"""
+        schema = self._schema()
+        checks = {
+            str(i): expectation
+            for i, expectation in enumerate(pending)
+            if expectation.fail_expr is not None
+            or expectation.aggregate_expr is not None
+            or expectation.reference is not None
+        }
+        reference_checks = {
+            key: expectation
+            for key, expectation in checks.items()
+            if expectation.reference is not None
+        }
+        history_checks = {
+            key: expectation
+            for key, expectation in checks.items()
+            if self._history is not None and expectation.unique_by
+        }
+        statistics_checks = {
+            key: expectation
+            for key, expectation in checks.items()
+            if expectation.statistics_check is not None and self._read_row_groups()
+        }
+        scan_checks = {
+            key: expectation
+            for key, expectation in checks.items()
+            if key not in history_checks
+            and key not in statistics_checks
+            and key not in reference_checks
+        }
+        limit = self._fail_row_limit()
+        evaluated = self._evaluate(scan_checks, limit) if scan_checks else {}
+        scanned = dict.fromkeys(scan_checks, evaluated.get(ROWS_SCANNED, 0))
+        for evaluate, subset in (
+            (self._evaluate_history, history_checks),
+            (self._evaluate_statistics, statistics_checks),
+            (self._evaluate_references, reference_checks),
+        ):
+            if subset:
+                subset_evaluated = evaluate(subset, limit)
+                scanned.update(dict.fromkeys(subset, subset_evaluated[ROWS_SCANNED]))
+                evaluated.update(subset_evaluated)
+
+        results, fail_indices, observations = [], {}, {}
+        retained = 0
+        for i, expectation in enumerate(pending):
+            if expectation.fail_expr is None and expectation.reference is None:
+                aggregate = AggregateResult(result=True)
+                if expectation.aggregate_expr is not None:
+                    aggregate = expectation.aggregate_check(evaluated[str(i)])
+                if expectation.schema_check is not None:
+                    aggregate = aggregate.merge(expectation.schema_check(schema))
+                result, fail_rows = aggregate.result, aggregate.fail_rows
+                if aggregate.observed is not None:
+                    observations[i] = aggregate.observed
+            else:
+                fail_rows, indices = evaluated[str(i)]
+                result = fail_rows == 0
+                limit = self._fail_row_limit(retained)
+                if limit is not None:
+                    indices = self._sample_indices(indices, limit)
+                retained += len(indices)
+                fail_indices[i] = indices
+            results.append((result, fail_rows, scanned.get(str(i), 0)))
+        return ResolvedPass(
+            results=pl.DataFrame(results, schema=PASS_SCHEMA, orient="row"),
+            fail_indices=fail_indices,
+            observed=observations,
+        )
+
+    def _evaluate_history(
+        self, checks: dict[str, Expectation], limit: int | None
+    ) -> dict[str, Any]:
+        """Evaluate uniqueness expectations against the batch and its history,
+        staging the batch keys in the history"""
+        evaluated = {}
+        for key, expectation in checks.items():
+            keys = self._key_frame(expectation.unique_by)
+            fails = keys[KEY].is_duplicated() | self._history.contains(
+                expectation.unique_by, keys[KEY]
+            )
+            self._history.stage(expectation.unique_by, keys[KEY], len(keys))
+            failing = keys[ROW_INDEX].filter(fails)
+            evaluated[key] = (len(failing), self._sample_indices(failing, limit))
+            evaluated[ROWS_SCANNED] = len(keys)
+        return evaluated
+
+    def _evaluate_references(
+        self, checks: dict[str, Expectation], limit: int | None
+    ) -> dict[str, Any]:
+        """Evaluate referential integrity expectations with an anti-join of the
+        keys against each reference, all in one streaming query"""
+        lf = self._frame().lazy().with_row_index(ROW_INDEX)
+        orphans = [
+            lf.select(*expectation.column_names, ROW_INDEX)
+            .drop_nulls(expectation.column_names)
+            .join(
+                expectation.reference.select(expectation.reference_columns),
+                left_on=expectation.column_names,
+                right_on=expectation.reference_columns,
+                how="anti",
+            )
+            .select(ROW_INDEX)
+            for expectation in checks.values()
+        ]
+        *orphans, rows = pl.collect_all(
+            [*orphans, lf.select(pl.len())],
+            engine="streaming" if self.streaming else "auto",
+        )
+        evaluated = {ROWS_SCANNED: rows.item()}
+        for key, orphan in zip(checks, orphans):
+            failing = orphan.to_series()
+            evaluated[key] = (len(failing), self._sample_indices(failing, limit))
+        return evaluated
+
+    def _read_row_groups(self) -> list[RowGroup] | None:
+        """Row groups of the Parquet files being validated, if known"""
+        if self._row_groups is None and self._parquet_files:
+            self._row_groups = read_row_groups(self._parquet_files)
+        return self._row_groups
+
+    def _evaluate_statistics(
+        self, checks: dict[str, Expectation], limit: int | None
+    ) -> dict[str, Any]:
+        """Evaluate expectations from Parquet row group statistics, reading
+        only the row groups the statistics can't decide"""
+        row_groups = self._read_row_groups()
+        index_type = pl.get_index_type()
+        ambiguous, failed, read = {}, {}, set()
+        for key, expectation in checks.items():
+            decisions = []
+            for row_group in row_groups:
+                statistics = row_group.statistics.get(expectation.column_name)
+                decisions.append(
+                    None
+                    if statistics is None
+                    else expectation.statistics_check(statistics)
+                )
+            ambiguous[key] = [i for i, d in enumerate(decisions) if d is None]
+            failed[key] = [row_groups[i] for i, d in enumerate(decisions) if d is False]
+            read.update(ambiguous[key])
+
+        evaluated = {ROWS_SCANNED: 0}
+        if read:
+            # Slices of the scan only decode the row groups they cover
+            indexed = self._frame().lazy().with_row_index(ROW_INDEX)
+            lf = pl.concat(
+                indexed.slice(row_groups[i].offset, row_groups[i].rows).with_columns(
+                    pl.lit(i).alias(ROW_GROUP)
+                )
+                for i in sorted(read)
+            )
+            evaluated = self._evaluate_indexed(
+                lf,
+                {
+                    key: expectation.model_copy(
+                        update={
+                            "fail_expr": expectation.fail_expr
+                            & pl.col(ROW_GROUP).is_in(ambiguous[key])
+                        }
+                    )
+                    for key, expectation in checks.items()
+                },
+                limit,
+            )
+        for key in checks:
+            count, indices = evaluated.get(key, (0, pl.Series([], dtype=index_type)))
+            count += sum(row_group.rows for row_group in failed[key])
+            indices = pl.concat(
+                [
+                    indices,
+                    *(
+                        pl.int_range(
+                            row_group.offset,
+                            row_group.offset + row_group.rows,
+                            dtype=index_type,
+                            eager=True,
+                        )
+                        for row_group in failed[key]
+                    ),
+                ]
+            )
+            evaluated[key] = (count, self._sample_indices(indices, limit))
+        return evaluated
+
+    def _key_frame(self, columns: list[str]) -> pl.DataFrame:
+        """Encoded key of every row, see `encode_keys`, with its row index"""
+        return self._collect(
+            self._frame()
+            .lazy()
+            .with_row_index(ROW_INDEX)
+            .select(encode_keys(columns), ROW_INDEX)
+        )
+
+    def _cache_key(self, pending: list[Expectation]) -> str:
+        """Key of the pending expectations' results in the result cache"""
+        if self._fingerprint is None:
+            self._fingerprint = self._data_fingerprint()
+        return hashlib.sha256(
+            json.dumps(
+                {
+                    "polars": pl.__version__,
+                    "data": self._fingerprint,
+                    "fail_row_limit": self._fail_row_limit(),
+                    "fail_sample": self.fail_sample,
+                    "expectations": [
+                        [
+                            e.expectation_name,
+                            e.column_name,
+                            e.result_args(),
+                            # The arguments only preview large value sets
+                            hashlib.sha256(e.fail_expr.meta.serialize()).hexdigest()
+                            if e.fail_expr is not None
+                            else None,
+                            *self._reference_fingerprint(e),
+                        ]
+                        for e in pending
+                    ],
+                }
+            ).encode()
+        ).hexdigest()
+
+    def _reference_fingerprint(self, expectation: Expectation) -> list[int]:
+        """Hash of the keys of a reference frame, which aren't in its arguments"""
+        if expectation.reference is None:
+            return []
+        reference = expectation.reference.select(expectation.reference_columns)
+        hashes = self._collect(
+            reference.with_row_index(ROW_INDEX).select(content_hash())
+        )
+        return list(hashes.row(0))
+
+    def _data_fingerprint(self) -> str:
+        """Fingerprint of the data, from a hash of every row and its position"""
+        lf = self._frame().lazy()
+        hashes = self._collect(lf.with_row_index(ROW_INDEX).select(content_hash()))
+        return f"{lf.collect_schema()}{hashes.row(0)}"
+
+    def _evaluate(
+        self, checks: dict[str, Expectation], limit: int | None
+    ) -> dict[str, Any]:
+        """Evaluate expectations that need a pass over the data
+
+        Row level expectations map to their fail count and failing row indices,
+        aggregate expectations to the list of their aggregate values, and
+        `__rows_scanned` to the number of rows read.
+        """
+        return self._evaluate_indexed(
+            self._frame().lazy().with_row_index(ROW_INDEX), checks, limit
+        )
+
+    def _evaluate_indexed(
+        self, lf: pl.LazyFrame, checks: dict[str, Expectation], limit: int | None
+    ) -> dict[str, Any]:
+        """`_evaluate` for a frame that already has a `__row_index` column"""
+        evaluated = self._collect(self._plan(lf, checks, limit))
+        return {
+            ROWS_SCANNED: evaluated[ROWS_SCANNED][0],
+            **{
+                key: [evaluated[f"aggregate_{key}"][0]]
+                if expectation.aggregate_expr is not None
+                else (
+                    evaluated[f"count_{key}"][0],
+                    evaluated[f"index_{key}"][0].alias(ROW_INDEX),
+                )
+                for key, expectation in checks.items()
+            },
+        }
+
+    def _plan(
+        self,
+        frame: pl.DataFrame | pl.LazyFrame,
+        checks: dict[str, Expectation],
+        limit: int | None,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """Aggregations evaluating every expectation in one select
+
+        The fail mask of each row level expectation is computed once, as a
+        column, then both counted and used to filter the failing row indices.
+        """
+        masks, exprs = [], [pl.len().alias(ROWS_SCANNED)]
+        for key, expectation in checks.items():
+            if expectation.aggregate_expr is not None:
+                exprs.append(expectation.aggregate_expr.alias(f"aggregate_{key}"))
+            else:
+                mask = pl.col(f"fail_{key}")
+                masks.append(expectation.fail_expr.alias(f"fail_{key}"))
+                exprs.append(mask.sum().alias(f"count_{key}"))
+                exprs.append(
+                    self._sample_fails(mask, limit).implode().alias(f"index_{key}")
+                )
+        return frame.with_columns(masks).select(exprs)
+
+    def _fail_row_limit(self, pending_retained: int = 0) -> int | None:
+        """Number of failing rows that may still be kept for an expectation,
+        after `pending_retained` kept for expectations not yet recorded"""
+        limits = [self.max_fail_rows]
+        if self.max_total_fail_rows is not None:
+            retained = pending_retained + sum(
+                len(index) for index in self._fail_indices.values()
+            )
+            limits.append(max(self.max_total_fail_rows - retained, 0))
+        limits = [limit for limit in limits if limit is not None]
+        return min(limits) if limits else None
+
+    def _sample_fails(self, fail_expr: pl.Expr, limit: int | None) -> pl.Expr:
+        """Indices of at most `limit` failing rows, the first or a random sample"""
+        failing = pl.col(ROW_INDEX).filter(fail_expr)
+        if limit is None:
+            return failing
+        if self.fail_sample == "random":
+            # Keeping the rows with the smallest hashes is a uniform sample that
+            # only ever holds `limit` indices, like reservoir sampling
+            priority = pl.col(ROW_INDEX).hash(seed=0).filter(fail_expr)
+            return failing.bottom_k_by(priority, limit).sort()
+        return failing.head(limit)
+
+    def _sample_indices(self, indices: pl.Series, limit: int | None) -> pl.Series:
+        """Sorted row indices, trimmed to `limit` in the same way as `_sample_fails`"""
+        return (
+            indices.sort()
+            .to_frame(ROW_INDEX)
+            .select(self._sample_fails(pl.lit(True), limit))
+            .to_series()
+        )
+
+    def _gather_fails(self) -> pl.DataFrame:
+        """Materialise the failing rows with a single gather from the frame"""
+        if not self._fail_indices:
+            return pl.DataFrame()
+        failed = [self._expectations[i] for i in self._fail_indices]
+        indices = list(self._fail_indices.values())
+        context = pl.DataFrame(
+            {
+                "expectation_name": [e.expectation_name for e in failed],
+                "expectation_args": [e.fail_args() for e in failed],
+            }
+        )[
+            pl.concat(
+                pl.repeat(i, len(index), dtype=pl.UInt32, eager=True)
+                for i, index in enumerate(indices)
+            )
+        ]
+        rows = self._gather_rows(pl.concat(indices))
+        return pl.concat([context, rows], how="horizontal")
+
+    def _gather_rows(
+        self, row_index: pl.Series, columns: list[str] | None = None
+    ) -> pl.DataFrame:
+        """Rows of the frame at `row_index`, in that order, only `columns` if given"""
+        frame = self._project(self._frame())
+        if columns is not None:
+            frame = frame.select(columns)
+        if isinstance(frame, pl.DataFrame):
+            return frame[row_index]
+        return self._collect(
+            row_index.to_frame()
+            .lazy()
+            .join(
+                frame.with_row_index(ROW_INDEX).join(
+                    row_index.unique().to_frame().lazy(), on=ROW_INDEX, how="semi"
+                ),
+                on=ROW_INDEX,
+                how="left",
+                maintain_order="left",
+            )
+            .drop(ROW_INDEX)
+        )
+
+    @property
+    def validation_results(self) -> list[ValidationResult]:
+        """Results for every recorded expectation"""
+        self._resolve()
+        return self._results.validation_results()
+
+    @property
+    def results(self) -> pl.DataFrame:
+        """Results and metrics of every recorded expectation as a frame, a row
+        per expectation in the order recorded"""
+        self._resolve()
+        return self._results.frame
+
+    @property
+    def fail_indices(self) -> dict[int, pl.Series]:
+        """Indices of the failing rows, keyed by position in `validation_results`"""
+        self._resolve()
+        return self._fail_indices
+
+    @property
+    def observed(self) -> dict[int, Any]:
+        """Observations of aggregate expectations, eg the `HyperLogLog` sketch of
+        an approximate uniqueness check, keyed by position in `validation_results`
+        """
+        self._resolve()
+        return self._observed
+
+    @property
+    def validation_fails(self) -> pl.DataFrame:
+        """Rows failing validation, prefixed with the expectation that failed
+
+        Materialised from `fail_indices` on first access.
+        """
+        self._resolve()
+        if self._validation_fails is None:
+            self._validation_fails = self._gather_fails()
+        return self._validation_fails
+
+    def duplicate_groups(self, position: int) -> pl.DataFrame:
+        """Duplicated keys of the uniqueness expectation at `position` in
+        `validation_results`, a row per key with its number of rows and their
+        `__row_index`, without copying the other columns of the rows
+
+        Groups are built from the failing rows kept, so with `max_fail_rows` or
+        `max_total_fail_rows` set they may be incomplete, `fail_rows` is always
+        the exact number of duplicate rows.
+        """
+        self._resolve()
+        columns = self._expectations[position].unique_by
+        if not columns:
+            raise ValueError(f"Expectation {position} is not a uniqueness expectation")
+        return self._failing_keys(position, columns)
+
+    def orphaned_keys(self, position: int) -> pl.DataFrame:
+        """Keys missing from the reference of the referential integrity
+        expectation at `position` in `validation_results`, a row per key with
+        its number of rows and their `__row_index`
+
+        Built from the failing rows kept, as for `duplicate_groups`.
+        """
+        self._resolve()
+        expectation = self._expectations[position]
+        if expectation.reference is None:
+            raise ValueError(f"Expectation {position} has no reference")
+        return self._failing_keys(position, expectation.column_names)
+
+    def _failing_keys(self, position: int, columns: list[str]) -> pl.DataFrame:
+        """Distinct `columns` of the failing rows of an expectation, with the
+        number of rows and row indices of each"""
+        indices = self._fail_indices.get(
+            position, pl.Series(ROW_INDEX, [], dtype=pl.get_index_type())
+        )
+        return (
+            self._gather_rows(indices, columns)
+            .with_columns(indices)
+            .group_by(columns, maintain_order=True)
+            .agg(pl.len().alias("count"), pl.col(ROW_INDEX))
+        )
+
+    def write_quarantine(
+        self, directory: str | Path, file_format: QuarantineFormat = "parquet"
+    ) -> QuarantineManifest:
+        """Write the failing rows of each failed expectation to its own
+        directory of Parquet or Arrow IPC files under `directory`
+
+        Rows are streamed from the source into the files instead of being
+        concatenated in memory as for `validation_fails`. The expectation
+        arguments are written once, to the `QuarantineManifest` and the
+        Parquet footers, rather than on every row.
+
+        Validation only keeps the indices of failing rows, so the rows are
+        read again from the source here, after validation. For a lazy or
+        batched source that is a second scan of the data, doubling its I/O,
+        in exchange for nothing being written for expectations that pass or
+        for validators that are never quarantined.
+        """
+        self._resolve()
+        directory = Path(directory)
+        if (directory / MANIFEST).exists():
+            for previous in QuarantineManifest.read(directory).expectations:
+                shutil.rmtree(directory / previous.path, ignore_errors=True)
+        manifest = QuarantineManifest(file_format=file_format)
+        fail_rows = self._results.frame["fail_rows"]
+        for position, indices in self._fail_indices.items():
+            expectation = self._expectations[position]
+            quarantined = QuarantinedExpectation(
+                position=position,
+                expectation_name=expectation.expectation_name,
+                column_name=expectation.column_name,
+                expectation_args=expectation.result_args(),
+                fail_rows=fail_rows[position],
+                rows=len(indices),
+                path=f"{position:04}_{expectation.expectation_name}",
+            )
+            (directory / quarantined.path).mkdir(parents=True, exist_ok=True)
+            manifest.expectations.append(quarantined)
+        self._write_fails(directory, manifest)
+        manifest.write(directory)
+        return manifest
+
+    def _write_fails(self, directory: Path, manifest: QuarantineManifest):
+        """Write the failing rows of every quarantined expectation, sinking
+        them all from a lazy frame in one streaming query"""
+        frame = self._project(self._frame())
+        file_format = manifest.file_format
+        if isinstance(frame, pl.DataFrame):
+            for quarantined in manifest.expectations:
+                indices = self._fail_indices[quarantined.position]
+                write_part(
+                    frame[indices].insert_column(0, indices),
+                    directory / quarantined.path / f"part-00000.{file_format}",
+                    file_format,
+                    quarantined,
+                )
+            return
+        lf = frame.with_row_index(ROW_INDEX)
+        pl.collect_all(
+            [
+                sink_part(
+                    lf.join(
+                        self._fail_indices[quarantined.position].to_frame().lazy(),
+                        on=ROW_INDEX,
+                        how="semi",
+                        maintain_order="left",
+                    ),
+                    directory / quarantined.path / f"part-00000.{file_format}",
+                    file_format,
+                    quarantined,
+                )
+                for quarantined in manifest.expectations
+            ],
+            engine="streaming",
+        )
+
+    @property
+    def metrics(self) -> list[ExpectationMetrics]:
+        """Time, memory and rows scanned for every recorded expectation"""
+        self._resolve()
+        return self._results.metrics()
+
+    def add_metrics_hook(self, hook: MetricsHook) -> Self:
+        """Call `hook` with the `ExpectationMetrics` of each expectation once it
+        has been evaluated, eg to send them to a metrics collector"""
+        self._metrics_hooks.append(hook)
+        return self
+
+    def with_cache(self, cache: ResultCache, fingerprint: str | None = None) -> Self:
+        """Reuse results stored in `cache` for the same data and expectations
+
+        The data is identified by `fingerprint` if given, eg from
+        `file_fingerprint`, otherwise by a hash of its content.
+        """
+        self._cache = cache
+        self._fingerprint = fingerprint
+        return self
+
+    def with_history(self, history: ValidationHistory) -> Self:
+        """Check uniqueness expectations against the keys of earlier batches
+        committed to `history` as well as within this batch
+
+        The keys of this batch are staged, `history.commit()` adds them once
+        the batch is accepted.
+        """
+        self._history = history
+        return self
+
+    def with_fail_fast(self, max_failures: int = 1) -> Self:
+        """Stop evaluating expectations once `max_failures` have failed
+
+        Recorded expectations are evaluated in passes of increasing cost:
+        schema checks, then row level predicates, aggregates, and last hash
+        based uniqueness and reference joins. Expectations left once the
+        threshold is reached are skipped, see `skipped`.
+
+        Ordering needs the expectations recorded first, so this switches an
+        eager validator to deferred mode. Expectations chained before the call
+        have already been evaluated and are not reordered.
+        """
+        if max_failures < 1:
+            raise ValueError("max_failures must be at least 1")
+        self._max_failures = max_failures
+        self.deferred = True
+        return self
+
+    @property
+    def skipped(self) -> list[int]:
+        """Positions in `validation_results` of the expectations skipped by
+        `with_fail_fast`, or carried over by a `ValidatorDataFrame`
+        transformation that dropped their columns. Their `result` is None"""
+        return self.results.filter(pl.col("result").is_null())["position"].to_list()
+
+    @property
+    def is_valid(self):
+        """Return True if all validation expectations are met"""
+        return self.results["result"].all()
+
+    def expect_column_to_exist(
+        self,
+        column_name: str,
+    ) -> Self:
+        """Expect a column to exist in the DataFrame"""
+        return self._record(expectations.column_to_exist(column_name))
+
+    def expect_columns_to_exist(self, column_names: list[str]) -> Self:
+        """Expect every column in `column_names` to exist in the DataFrame
+
+        Checked with one lookup per column in the frame schema and reported as
+        a single result, `fail_rows` is the number of missing columns and the
+        `SchemaDiff` in `observed` lists them.
+        """
+        return self._record(expectations.columns_to_exist(column_names))
+
+    def expect_schema(
+        self,
+        schema: dict[str, pl.DataType | type | str | None] | pl.Schema,
+        strict_order: bool = False,
+        allow_extra_columns: bool = True,
+        not_null: list[str] | bool = False,
+    ) -> Self:
+        """Expect the DataFrame to have the columns and data types of `schema`,
+        a data type of None matches any type
+
+        Set `strict_order` to expect the columns in the order of `schema`,
+        `allow_extra_columns=False` to reject columns not in `schema` and
+        `not_null` to the columns that mustn't contain nulls, or True for all
+        of them. Names, types and order are checked against the frame schema,
+        only null counts need a pass over the data.
+
+        Reported as a single result, `fail_rows` is the number of columns that
+        don't match and the `SchemaDiff` in `observed` describes them.
+        """
+        return self._record(
+            expectations.schema(schema, strict_order, allow_extra_columns, not_null)
+        )
+
+    def expect_column_to_contain_unique_values(
+        self,
+        column_name: str,
+    ) -> Self:
+        """Expect all values in a column to be unique"""
+        return self._record(expectations.column_to_contain_unique_values(column_name))
+
+    def expect_compound_columns_to_be_unique(self, column_names: list[str]) -> Self:
+        """Expect the combination of values in `column_names` to be unique
+        across rows, eg a key of ("Scheme ID", "Member ID", "Effective Date")
+
+        Duplicated keys, their number of rows and row indices are reported by
+        `duplicate_groups`. Batched and partitioned validators hash partition
+        the keys so they stay within their memory budget.
+        """
+        return self._record(expectations.compound_columns_to_be_unique(column_names))
+
+    def expect_column_to_contain_approximately_unique_values(
+        self,
+        column_name: str,
+        max_duplicate_rate: float = 0.0,
+        precision: int = 14,
+    ) -> Self:
+        """Expect the duplicate rate of a column to be at most `max_duplicate_rate`
+
+        Estimated with a `HyperLogLog` sketch of `2**precision` bytes instead of
+        an exact hash of the column. Fails only when the lower bound of the
+        estimated duplicate rate exceeds `max_duplicate_rate`, `fail_rows` is the
+        estimated number of duplicate rows. The sketch is kept in `observed`.
+        """
+        return self._record(
+            expectations.column_to_contain_approximately_unique_values(
+                column_name, max_duplicate_rate, precision
+            )
+        )
+
+    def expect_column_value_greater_than(
+        self,
+        column_name: str,
+        value: int | float | date | datetime,
+        allow_nulls: bool = False,  # Not implemented
+    ) -> Self:
+        """Expect all values in a column to be greater than a given value"""
+        return self._record(
+            expectations.column_value_greater_than(column_name, value, allow_nulls)
+        )
+
+    def expect_column_value_to_be_between(
+        self,
+        column_name: str | list[str],
+        low_value: int | float | date | datetime,
+        high_value: int | float | date | datetime,
+    ) -> Self:
+        """Expect all values in a column to be between `low_value` and
+        `high_value` inclusive
+
+        Pass a list of column names to expect the same of each column, all
+        are checked in the same pass.
+        """
+        return self._record(
+            *expectations.per_column(
+                expectations.column_value_to_be_between,
+                column_name,
+                low_value,
+                high_value,
+            )
+        )
+
+    def expect_column_a_greater_than_column_b(
+        self, column_a: str, column_b: str
+    ) -> Self:
+        """Expect all values in column a to be greater than those in column b"""
+        return self._record(
+            expectations.column_a_greater_than_column_b(column_a, column_b)
+        )
+
+    def expect_column_value_to_match_regex(
+        self, column_name: str | list[str], pattern: str
+    ) -> Self:
+        """Expect all values in a string column to contain a match of the
+        regular expression `pattern`, anchor it with `^` and `$` to match the
+        whole value
+
+        Pass a list of column names to expect the same of each column, all
+        are checked in the same pass.
+        """
+        return self._record(
+            *expectations.per_column(
+                expectations.column_value_to_match_regex, column_name, pattern
+            )
+        )
+
+    def expect_column_value_to_be_in_set(
+        self, column_name: str, values: list | set | frozenset | pl.Series
+    ) -> Self:
+        """Return True if all values in a column are in a given set
+
+        `values` can be a list, set or `pl.Series`. The set is built once when
+        the expectation is recorded, so a compiled suite reuses it for every
+        frame it validates. Membership of Categorical and Enum columns is
+        checked on their integer codes rather than their strings.
+        """
+        return self._record(expectations.column_value_to_be_in_set(column_name, values))
+
+    def expect_column_value_to_be_in_reference(
+        self,
+        columns: str | list[str],
+        reference: pl.DataFrame | pl.LazyFrame | str | Path,
+        reference_columns: str | list[str] | None = None,
+    ) -> Self:
+        """Expect every value of a column, or combination of values of several
+        columns, to exist in `reference`, like a foreign key
+
+        The reference is a frame, a lazy frame or the path of a Parquet, CSV or
+        IPC file, and its key columns are `reference_columns`, by default the
+        same names as `columns`. Keys are looked up with an anti-join streamed
+        from the reference instead of a list of values, rows with a null key
+        are skipped. `orphaned_keys` reports the missing keys and their counts.
+        """
+        return self._record(
+            expectations.column_value_to_be_in_reference(
+                columns, reference, reference_columns
+            )
+        )
+
+    def expect_column_to_be_of_type(
+        self, column_name: str | list[str], column_type: pl.DataType | type | str
+    ) -> Self:
+        """Expect a column to have the data type `column_type`, a Polars data
+        type such as `pl.Int64`, a Python type such as `int` or the name of a
+        Polars data type such as "Int64"
+
+        Data types without parameters match any parameters, eg `pl.Datetime`
+        matches every time unit and time zone. Pass a list of column names to
+        expect the same of each column.
+        """
+        return self._record(
+            *expectations.per_column(
+                expectations.column_to_be_of_type, column_name, column_type
+            )
+        )
+
+    def expect_column_value_length_greater_than(
+        self,
+        column_name: str,
+        length: int | float | date | datetime,
+    ) -> Self:
+        """Expect column values to be strings of length greater than a given value"""
+        return self._record(
+            expectations.column_value_length_greater_than(column_name, length)
+        )
+
+    def show_results(self, profile: bool = False):
+        """Print the results table, with the metrics of each expectation if
+        `profile` is True"""
+        columns = [
+            "column_name",
+            "expectation_name",
+            "expectation_args",
+            pl.when(pl.col("result").is_null())
+            .then(pl.lit("⏭️"))
+            .when("result")
+            .then(pl.lit("✅"))
+            .otherwise(pl.lit("❌"))
+            .alias("result"),
+            pl.col("fail_rows").cast(pl.String).fill_null(""),
+        ]
+        if profile:
+            columns += [
+                pl.col("wall_seconds", "cpu_seconds").round(4),
+                (pl.col("peak_memory_bytes") / 2**20).round(1).alias("peak_memory_mb"),
+                "rows_scanned",
+                "pass_id",
+            ]
+        results = self.results.sort("column_name", maintain_order=True).select(columns)
+        with pl.Config(
+            tbl_hide_column_data_types=True,
+            tbl_hide_dataframe_shape=True,
+            fmt_str_lengths=1000,
+            tbl_rows=len(results),
+            tbl_cols=-1,
+        ):
+            print(results)
+        return self
+
+    def show_failures(self):
+        with pl.Config(
+            tbl_hide_column_data_types=True,
+            tbl_hide_dataframe_shape=True,
+            fmt_str_lengths=1000,
+            tbl_cols=1000,
+        ):
+            print(self.validation_fails)
+        return self
+
+    def throw_error_if_invalid(self):
+        """Throw an error if any validation results are False"""
+        validation_failures = (~self.results["result"]).sum()
+        if validation_failures:
+            err_msg = f"Validation failed for {validation_failures} expectations"
+            if skipped := self.results["result"].null_count():
+                err_msg += f", {skipped} skipped"
+            raise DataValidationError(err_msg)
@@ -0,0 +1,144 @@
+import hashlib
+import os
+import polars as pl
+import threading
+from pathlib import Path
+from typing import Iterable
+from .expectations import ResolvedPass, SchemaDiff
+from .results import PASS_SCHEMA
+from .sketches import HyperLogLog
+
+# Observations kept in the cache, by class name
+OBSERVED_TYPES = {"HyperLogLog": HyperLogLog, "SchemaDiff": SchemaDiff}
+
+
+class ResultCache:
+    """Validation results on local disk, keyed by a fingerprint of the data and
+    the expectations evaluated, so unchanged data is not validated again.
+
+    Each entry is a Parquet file of the results, failing row indices and
+    sketches of one pass. Once the entries take more than `max_bytes` the least
+    recently used are evicted.
+
+    Example usage:
+    --------------
+    >>> cache = ResultCache(".validation_cache", max_bytes=2**30)
+    >>> PolarsDataFrameValidator(pl.scan_parquet("members.parquet")) \\
+        .with_cache(cache, fingerprint=file_fingerprint("members.parquet")) \\
+        .expect_column_to_contain_unique_values("Member ID") \\
+        .show_results()
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = 2**30):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.parquet"
+
+    def get(self, key: str) -> ResolvedPass | None:
+        """Stored results for `key`, or None on a miss"""
+        path = self._path(key)
+        try:
+            entry = pl.read_parquet(path)
+            results = entry.select(
+                "result", "fail_rows", pl.lit(0).alias("rows_scanned")
+            ).cast(PASS_SCHEMA)
+            # Entries written by older versions lack columns and are misses
+            fail_indices = entry["fail_indices"]
+            observed = entry.select("observed", "observed_type").rows()
+            os.utime(path)
+        except (OSError, pl.exceptions.PolarsError):
+            return None
+        return ResolvedPass(
+            results=results,
+            fail_indices={
+                i: indices
+                for i, indices in enumerate(fail_indices)
+                if indices is not None
+            },
+            observed={
+                i: OBSERVED_TYPES[observed_type].model_validate_json(observation)
+                for i, (observation, observed_type) in enumerate(observed)
+                if observation is not None
+            },
+        )
+
+    def put(self, key: str, resolved: ResolvedPass):
+        """Store results for `key` then evict old entries"""
+        passed = range(resolved.results.height)
+        entry = resolved.results.select("result", "fail_rows").with_columns(
+            pl.Series(
+                "observed",
+                [
+                    resolved.observed[i].model_dump_json()
+                    if type(resolved.observed.get(i)).__name__ in OBSERVED_TYPES
+                    else None
+                    for i in passed
+                ],
+                dtype=pl.String,
+            ),
+            pl.Series(
+                "observed_type",
+                [type(resolved.observed.get(i)).__name__ for i in passed],
+                dtype=pl.String,
+            ),
+            pl.Series(
+                "fail_indices",
+                [resolved.fail_indices.get(i) for i in passed],
+                dtype=pl.List(pl.get_index_type()),
+            ),
+        )
+        # Unique per thread, as threads of one process may store the same key
+        tmp_path = self._path(key).with_suffix(
+            f".{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        entry.write_parquet(tmp_path)
+        os.replace(tmp_path, self._path(key))
+        self._evict()
+
+    def _evict(self):
+        """Remove the least recently used entries beyond `max_bytes`"""
+        entries = sorted(
+            (entry.stat().st_mtime_ns, entry.stat().st_size, entry)
+            for entry in self.directory.glob("*.parquet")
+        )
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        """Remove every entry"""
+        for entry in self.directory.glob("*.parquet"):
+            entry.unlink(missing_ok=True)
+
+
+def file_fingerprint(paths: str | Path | Iterable[str | Path]) -> str:
+    """Fingerprint of files from their path, size and modification time, much
+    cheaper than hashing their content"""
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+    stats = []
+    for path in sorted(Path(path).resolve() for path in paths):
+        stat = path.stat()
+        stats.append(f"{path}:{stat.st_size}:{stat.st_mtime_ns}")
+    return hashlib.sha256("\n".join(stats).encode()).hexdigest()
+
+
+def content_hash() -> list[pl.Expr]:
+    """Aggregations fingerprinting the content of a frame with a row index
+
+    Sums the high and low halves of every row hash separately. Past 2**32 rows
+    the sums wrap around modulo 2**64, which gives the same fingerprint whether
+    a frame is summed at once or batch by batch.
+    """
+    hashed = pl.struct(pl.all()).hash(seed=0)
+    return [
+        pl.len().alias("rows"),
+        (hashed // 2**32).sum().alias("high"),
+        (hashed % 2**32).sum().alias("low"),
+    ]
@@ -0,0 +1,568 @@
+import polars as pl
+import polars.selectors as cs
+from polars.datatypes import parse_into_dtype
+from typing import Any, Callable
+from functools import partial, reduce
+from pydantic import BaseModel, ConfigDict
+from datetime import date, datetime
+from pathlib import Path
+from .sketches import HyperLogLog
+from .exceptions import DataValidationError
+
+# Row count field of the null counts of `expect_schema`
+ROWS = "__rows"
+
+
+class ValidationResult(BaseModel):
+    """Validation result for a single expectation, `result` is None if it was
+    skipped by a fail-fast validator"""
+
+    column_name: str
+    expectation_name: str
+    expectation_args: str | None = ""
+    result: bool | None
+    fail_rows: int | None = None
+
+
+class ResolvedPass(BaseModel):
+    """Everything kept from evaluating the expectations of one pass
+
+    `results` has the `result`, `fail_rows` and `rows_scanned` of each
+    expectation, in order, failing row indices and observations are keyed by
+    position in the pass.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    results: pl.DataFrame
+    fail_indices: dict[int, pl.Series] = {}
+    observed: dict[int, Any] = {}
+
+
+class AggregateResult(BaseModel):
+    """Outcome of an aggregate expectation"""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    result: bool
+    fail_rows: int | None = None
+    observed: Any = None
+
+    def merge(self, other: "AggregateResult | bool") -> "AggregateResult":
+        """Outcome of an expectation checked against both the schema and the data"""
+        if isinstance(other, bool):
+            other = AggregateResult(result=other)
+        fail_rows = [n for n in (self.fail_rows, other.fail_rows) if n is not None]
+        observed = self.observed if other.observed is None else other.observed
+        if self.observed is not None and other.observed is not None:
+            observed = self.observed.merge(other.observed)
+        return AggregateResult(
+            result=self.result and other.result,
+            fail_rows=sum(fail_rows) if fail_rows else None,
+            observed=observed,
+        )
+
+
+class SchemaDiff(BaseModel):
+    """Columns of a frame that don't match the expected schema, with the
+    actual data type of columns of the wrong type and the number of nulls in
+    columns that shouldn't contain any"""
+
+    missing: list[str] = []
+    unexpected: list[str] = []
+    mismatched_types: dict[str, str] = {}
+    out_of_order: bool = False
+    null_counts: dict[str, int] = {}
+
+    @property
+    def failing_columns(self) -> int:
+        return (
+            len(self.missing)
+            + len(self.unexpected)
+            + len(self.mismatched_types)
+            + len(self.null_counts)
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.failing_columns and not self.out_of_order
+
+    def merge(self, other: "SchemaDiff") -> "SchemaDiff":
+        return SchemaDiff(
+            missing=[*self.missing, *other.missing],
+            unexpected=[*self.unexpected, *other.unexpected],
+            mismatched_types={**self.mismatched_types, **other.mismatched_types},
+            out_of_order=self.out_of_order or other.out_of_order,
+            null_counts={**self.null_counts, **other.null_counts},
+        )
+
+
+class ColumnStatistics(BaseModel):
+    """Statistics of a column in one Parquet row group, from the file footer"""
+
+    rows: int
+    null_count: int | None = None
+    min: Any = None
+    max: Any = None
+
+
+class Expectation(BaseModel):
+    """A recorded expectation, ready to be compiled into a query plan.
+
+    Row level expectations carry a boolean `fail_expr` that is True for every
+    failing row. Schema level expectations carry a `schema_check` instead and are
+    answered from the frame schema without scanning any data. A schema check
+    returns either a bool or an `AggregateResult`.
+
+    Uniqueness expectations also name the key columns in `unique_by`, so they
+    can be checked exactly when the frame is only seen one batch at a time.
+
+    Aggregate expectations carry an `aggregate_expr` evaluated in the same
+    single pass and an `aggregate_check` that turns the list of its values, one
+    per batch or partition, into an `AggregateResult`.
+
+    Expectations that can be decided from Parquet row group statistics carry a
+    `statistics_check`. It returns True if every row of the row group passes,
+    False if every row fails and None if the rows have to be read.
+
+    A `precondition` is checked against the frame schema when the expectation
+    is recorded and raises `DataValidationError` if it can't be evaluated.
+
+    Expectations of many columns name them all in `column_names`, the
+    `column_name` is then only a label for the results table.
+
+    Referential integrity expectations carry a `reference` frame instead of a
+    `fail_expr`, rows fail when their `column_names` match no row of its
+    `reference_columns`.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    expectation_name: str
+    column_name: str
+    expectation_args: dict[str, Any] = {}
+    fail_expr: pl.Expr | None = None
+    schema_check: Callable[[pl.Schema], bool | AggregateResult] | None = None
+    unique_by: list[str] | None = None
+    aggregate_expr: pl.Expr | None = None
+    aggregate_check: Callable[[list[Any]], AggregateResult] | None = None
+    precondition: Callable[[pl.Schema], None] | None = None
+    statistics_check: Callable[[ColumnStatistics], bool | None] | None = None
+    column_names: list[str] | None = None
+    reference: pl.LazyFrame | None = None
+    reference_columns: list[str] | None = None
+
+    def columns(self) -> list[str]:
+        """Names of the columns the expectation reads"""
+        columns = (
+            [self.column_name] if self.column_names is None else [*self.column_names]
+        )
+        columns.extend(self.unique_by or [])
+        for expr in (self.fail_expr, self.aggregate_expr):
+            if expr is not None:
+                columns.extend(expr.meta.root_names())
+        return list(dict.fromkeys(columns))
+
+    def cost(self) -> int:
+        """Rough cost of evaluating the expectation, to order fail-fast passes:
+        0 for schema checks, 1 for row level predicates, 2 for aggregates and
+        3 for hash based uniqueness and reference joins"""
+        if self.unique_by or self.reference is not None:
+            return 3
+        if self.aggregate_expr is not None:
+            return 2
+        if self.fail_expr is not None:
+            return 1
+        return 0
+
+    def result_args(self) -> str:
+        """Format the expectation arguments for the results table"""
+        return ", ".join(f"{k}={v!r}" for k, v in self.expectation_args.items())
+
+    def fail_args(self) -> str:
+        """Format the expectation arguments for the failing rows"""
+        return str({"column_name": self.column_name, **self.expectation_args})
+
+
+def per_column(
+    builder: Callable[..., Expectation], column_name: str | list[str], *args, **kwargs
+) -> list[Expectation]:
+    """One expectation per column for a column name or list of column names"""
+    columns = [column_name] if isinstance(column_name, str) else column_name
+    return [builder(column, *args, **kwargs) for column in columns]
+
+
+def _has_column(column_name: str, schema: pl.Schema) -> bool:
+    return column_name in schema
+
+
+def column_to_exist(column_name: str) -> Expectation:
+    return Expectation(
+        expectation_name="expect_column_to_exist",
+        column_name=column_name,
+        schema_check=partial(_has_column, column_name),
+    )
+
+
+def _columns_label(column_names: list[str]) -> str:
+    """Column name shown for expectations of many columns"""
+    if len(column_names) == 1:
+        return column_names[0]
+    return f"{len(column_names)} columns"
+
+
+def _has_columns(column_names: list[str], schema: pl.Schema) -> AggregateResult:
+    missing = [column for column in column_names if column not in schema]
+    return AggregateResult(
+        result=not missing,
+        fail_rows=len(missing),
+        observed=SchemaDiff(missing=missing),
+    )
+
+
+def columns_to_exist(column_names: list[str]) -> Expectation:
+    return Expectation(
+        expectation_name="expect_columns_to_exist",
+        column_name=_columns_label(column_names),
+        expectation_args={"column_names": column_names},
+        schema_check=partial(_has_columns, list(column_names)),
+        column_names=list(column_names),
+    )
+
+
+def _check_schema(
+    expected: dict[str, pl.DataType | None],
+    strict_order: bool,
+    allow_extra_columns: bool,
+    schema: pl.Schema,
+) -> AggregateResult:
+    present = [column for column in schema if column in expected]
+    diff = SchemaDiff(
+        missing=[column for column in expected if column not in schema],
+        unexpected=[]
+        if allow_extra_columns
+        else [column for column in schema if column not in expected],
+        mismatched_types={
+            column: str(schema[column])
+            for column in present
+            if expected[column] is not None and not schema[column] == expected[column]
+        },
+        out_of_order=strict_order
+        and present != [column for column in expected if column in schema],
+    )
+    return AggregateResult(
+        result=diff.is_empty, fail_rows=diff.failing_columns, observed=diff
+    )
+
+
+def _check_not_null(partials: list[dict[str, int]]) -> AggregateResult:
+    null_counts: dict[str, int] = {}
+    for partial_counts in partials:
+        for column, nulls in partial_counts.items():
+            if column != ROWS and nulls:
+                null_counts[column] = null_counts.get(column, 0) + nulls
+    return AggregateResult(
+        result=not null_counts,
+        fail_rows=len(null_counts),
+        observed=SchemaDiff(null_counts=null_counts),
+    )
+
+
+def schema(
+    schema: dict[str, Any] | pl.Schema,
+    strict_order: bool = False,
+    allow_extra_columns: bool = True,
+    not_null: list[str] | bool = False,
+) -> Expectation:
+    expected = {
+        column: None if dtype is None else _parse_dtype(dtype)
+        for column, dtype in schema.items()
+    }
+    if not_null is True:
+        not_null = list(expected)
+    not_null = list(not_null or [])
+    return Expectation(
+        expectation_name="expect_schema",
+        column_name=_columns_label(list(expected)),
+        expectation_args={
+            "schema": expected,
+            "strict_order": strict_order,
+            "allow_extra_columns": allow_extra_columns,
+            "not_null": not_null,
+        },
+        schema_check=partial(
+            _check_schema, expected, strict_order, allow_extra_columns
+        ),
+        # Missing columns are reported by the schema check, not the null counts
+        aggregate_expr=pl.struct(
+            pl.len().alias(ROWS),
+            cs.by_name(not_null, require_all=False).null_count(),
+        )
+        if not_null
+        else None,
+        aggregate_check=_check_not_null if not_null else None,
+        column_names=list(expected),
+    )
+
+
+def column_to_contain_unique_values(column_name: str) -> Expectation:
+    return Expectation(
+        expectation_name="expect_column_to_contain_unique_values",
+        column_name=column_name,
+        fail_expr=pl.col(column_name).is_duplicated(),
+        unique_by=[column_name],
+    )
+
+
+def compound_columns_to_be_unique(column_names: list[str]) -> Expectation:
+    return Expectation(
+        expectation_name="expect_compound_columns_to_be_unique",
+        column_name=", ".join(column_names),
+        expectation_args={"column_names": column_names},
+        fail_expr=pl.struct(column_names).is_duplicated(),
+        unique_by=list(column_names),
+        column_names=list(column_names),
+    )
+
+
+def _check_approximately_unique(
+    max_duplicate_rate: float, precision: int, partials: list[dict]
+) -> AggregateResult:
+    sketch = reduce(
+        HyperLogLog.merge,
+        (HyperLogLog.from_partial(partial, precision) for partial in partials),
+        HyperLogLog(precision=precision),
+    )
+    lower, duplicate_rate, _ = sketch.duplicate_rate()
+    return AggregateResult(
+        result=lower <= max_duplicate_rate,
+        fail_rows=round(duplicate_rate * sketch.rows),
+        observed=sketch,
+    )
+
+
+def column_to_contain_approximately_unique_values(
+    column_name: str,
+    max_duplicate_rate: float = 0.0,
+    precision: int = 14,
+) -> Expectation:
+    return Expectation(
+        expectation_name="expect_column_to_contain_approximately_unique_values",
+        column_name=column_name,
+        expectation_args={
+            "max_duplicate_rate": max_duplicate_rate,
+            "precision": precision,
+        },
+        aggregate_expr=HyperLogLog.expr(column_name, precision),
+        aggregate_check=partial(
+            _check_approximately_unique, max_duplicate_rate, precision
+        ),
+    )
+
+
+def _greater_than_statistics(value: Any, statistics: ColumnStatistics) -> bool | None:
+    if statistics.null_count == statistics.rows:
+        return True
+    if statistics.min is None or statistics.max is None:
+        return None
+    try:
+        if statistics.min > value:
+            return True
+        if statistics.max <= value and statistics.null_count == 0:
+            return False
+    except TypeError:
+        pass
+    return None
+
+
+def column_value_greater_than(
+    column_name: str,
+    value: int | float | date | datetime,
+    allow_nulls: bool = False,
+) -> Expectation:
+    return Expectation(
+        expectation_name="expect_column_value_greater_than",
+        column_name=column_name,
+        expectation_args={"value": value, "allow_nulls": allow_nulls},
+        fail_expr=pl.col(column_name).le(value),
+        statistics_check=partial(_greater_than_statistics, value),
+    )
+
+
+def _between_statistics(
+    low_value: Any, high_value: Any, statistics: ColumnStatistics
+) -> bool | None:
+    if statistics.null_count == statistics.rows:
+        return True
+    if statistics.min is None or statistics.max is None:
+        return None
+    try:
+        if low_value <= statistics.min and statistics.max <= high_value:
+            return True
+        if statistics.null_count == 0 and (
+            statistics.max < low_value or statistics.min > high_value
+        ):
+            return False
+    except TypeError:
+        pass
+    return None
+
+
+def column_value_to_be_between(
+    column_name: str,
+    low_value: int | float | date | datetime,
+    high_value: int | float | date | datetime,
+) -> Expectation:
+    return Expectation(
+        expectation_name="expect_column_value_to_be_between",
+        column_name=column_name,
+        expectation_args={"low_value": low_value, "high_value": high_value},
+        fail_expr=pl.col(column_name).is_between(low_value, high_value).not_(),
+        statistics_check=partial(_between_statistics, low_value, high_value),
+    )
+
+
+def column_a_greater_than_column_b(column_a: str, column_b: str) -> Expectation:
+    return Expectation(
+        expectation_name="expect_column_a_greater_than_column_b",
+        column_name=column_a,
+        expectation_args={"column_a": column_a, "column_b": column_b},
+        fail_expr=pl.col(column_a).le(pl.col(column_b)),
+    )
+
+
+MAX_PREVIEW_VALUES = 10
+
+
+def _value_set(values: list | set | frozenset | pl.Series) -> pl.Series:
+    """Distinct allowed values, built once when the expectation is recorded"""
+    if isinstance(values, (set, frozenset)):
+        # Sorted by Polars, so the order doesn't depend on hashing and a null
+        # member sorts last instead of failing to compare
+        return pl.Series("values", list(values)).sort(nulls_last=True)
+    return pl.Series("values", values).unique(maintain_order=True)
+
+
+def _value_set_args(value_set: pl.Series) -> dict[str, Any]:
+    """The values for the results table, a preview and count of large sets"""
+    if len(value_set) <= MAX_PREVIEW_VALUES:
+        return {"values": value_set.to_list()}
+    return {
+        "values_preview": value_set.head(MAX_PREVIEW_VALUES).to_list(),
+        "value_count": len(value_set),
+    }
+
+
+def column_value_to_be_in_set(
+    column_name: str, values: list | set | frozenset | pl.Series
+) -> Expectation:
+    value_set = _value_set(values)
+    return Expectation(
+        expectation_name="expect_column_value_to_be_in_set",
+        column_name=column_name,
+        expectation_args=_value_set_args(value_set),
+        # Categorical and Enum columns are matched on their integer codes
+        fail_expr=pl.col(column_name).is_in(value_set.implode()).not_(),
+    )
+
+
+REFERENCE_SCANNERS = {
+    ".parquet": pl.scan_parquet,
+    ".csv": pl.scan_csv,
+    ".ipc": pl.scan_ipc,
+    ".arrow": pl.scan_ipc,
+    ".feather": pl.scan_ipc,
+}
+
+
+def scan_file(source: pl.DataFrame | pl.LazyFrame | str | Path) -> pl.LazyFrame:
+    """A frame, or a file scanned by its suffix, see `REFERENCE_SCANNERS`"""
+    if isinstance(source, (str, Path)):
+        scan = REFERENCE_SCANNERS.get(Path(source).suffix.lower())
+        if scan is None:
+            raise ValueError(f"Unknown file format '{source}'")
+        return scan(source)
+    return source.lazy()
+
+
+def column_value_to_be_in_reference(
+    columns: str | list[str],
+    reference: pl.DataFrame | pl.LazyFrame | str | Path,
+    reference_columns: str | list[str] | None = None,
+) -> Expectation:
+    columns = [columns] if isinstance(columns, str) else list(columns)
+    if reference_columns is None:
+        reference_columns = columns
+    elif isinstance(reference_columns, str):
+        reference_columns = [reference_columns]
+    if len(reference_columns) != len(columns):
+        raise ValueError("Expected as many reference columns as columns")
+    return Expectation(
+        expectation_name="expect_column_value_to_be_in_reference",
+        column_name=", ".join(columns),
+        expectation_args={
+            "reference": str(reference)
+            if isinstance(reference, (str, Path))
+            else type(reference).__name__,
+            "reference_columns": list(reference_columns),
+        },
+        reference=scan_file(reference),
+        reference_columns=list(reference_columns),
+        column_names=columns,
+    )
+
+
+def _require_string(column_name: str, schema: pl.Schema):
+    if column_name not in schema:
+        raise pl.exceptions.ColumnNotFoundError(
+            f'unable to find column "{column_name}"; valid columns: {schema.names()}'
+        )
+    if schema[column_name] != pl.String:
+        raise DataValidationError(f"Column '{column_name}' is not of string type")
+
+
+def column_value_to_match_regex(column_name: str, pattern: str) -> Expectation:
+    return Expectation(
+        expectation_name="expect_column_value_to_match_regex",
+        column_name=column_name,
+        expectation_args={"pattern": pattern},
+        fail_expr=pl.col(column_name).str.contains(pattern).not_(),
+        precondition=partial(_require_string, column_name),
+    )
+
+
+def _parse_dtype(column_type: Any) -> pl.DataType:
+    """A Polars data type from a data type, Python type or data type name"""
+    if isinstance(column_type, str):
+        dtype = getattr(pl, column_type, None)
+        if not (isinstance(dtype, type) and issubclass(dtype, pl.DataType)):
+            raise ValueError(f"Unknown data type '{column_type}'")
+        return dtype
+    return parse_into_dtype(column_type)
+
+
+def _has_type(column_name: str, dtype: pl.DataType, schema: pl.Schema) -> bool:
+    return schema.get(column_name) == dtype
+
+
+def column_to_be_of_type(column_name: str, column_type: Any) -> Expectation:
+    dtype = _parse_dtype(column_type)
+    return Expectation(
+        expectation_name="expect_column_to_be_of_type",
+        column_name=column_name,
+        expectation_args={"column_type": dtype},
+        schema_check=partial(_has_type, column_name, dtype),
+    )
+
+
+def column_value_length_greater_than(
+    column_name: str,
+    length: int | float | date | datetime,
+) -> Expectation:
+    return Expectation(
+        expectation_name="expect_column_value_length_greater_than",
+        column_name=column_name,
+        expectation_args={"length": length},
+        fail_expr=pl.col(column_name).str.len_chars().le(length),
+        precondition=partial(_require_string, column_name),
+    )
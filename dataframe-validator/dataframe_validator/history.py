@@ -0,0 +1,166 @@
+import os
+import polars as pl
+import uuid
+from pathlib import Path
+from pydantic import BaseModel
+
+MANIFEST = "state.json"
+KEY = "__key"
+# Separates the columns of a composite key, nulls are encoded as NULL_KEY
+KEY_SEPARATOR = "\x1f"
+NULL_KEY = "\x00"
+
+
+def encode_keys(columns: list[str]) -> pl.Expr:
+    """Key columns encoded as one string, stable across runs and Polars versions"""
+    return pl.concat_str(
+        [pl.col(column).cast(pl.String).fill_null(NULL_KEY) for column in columns],
+        separator=KEY_SEPARATOR,
+    ).alias(KEY)
+
+
+class KeyRun(BaseModel):
+    """A sorted file of distinct keys, appended by one commit"""
+
+    file: str
+    rows: int
+    min: str
+    max: str
+
+
+class HistoryKeySet(BaseModel):
+    columns: list[str]
+    runs: list[KeyRun] = []
+
+
+class HistoryManifest(BaseModel):
+    generation: int = 0
+    rows: int = 0
+    key_sets: list[HistoryKeySet] = []
+
+
+def _key_set(manifest: HistoryManifest, columns: list[str]) -> HistoryKeySet:
+    """The key set of `columns`, added to the manifest if missing"""
+    for key_set in manifest.key_sets:
+        if key_set.columns == columns:
+            return key_set
+    manifest.key_sets.append(HistoryKeySet(columns=columns))
+    return manifest.key_sets[-1]
+
+
+class ValidationHistory:
+    """Persisted state of an append-only table, so that each new batch is
+    validated against the history in time proportional to the batch.
+
+    The distinct keys of uniqueness expectations are kept in `directory` as
+    sorted, uncompressed Arrow files along with their min and max. A batch key
+    is looked up by binary search only in files whose range overlaps the batch,
+    so increasing keys such as member IDs usually read no history at all.
+
+    Keys of a validated batch are staged, then added to the history by `commit`
+    if the batch is accepted or discarded by `rollback` if it is rejected.
+    Once a key set has more than `max_runs` files they are merged into one.
+
+    Example usage:
+    --------------
+    >>> history = ValidationHistory("state/members")
+    >>> validator = PolarsDataFrameValidator(daily_batch) \\
+        .with_history(history) \\
+        .expect_column_to_contain_unique_values("Member ID")
+    >>> history.commit() if validator.is_valid else history.rollback()
+    """
+
+    def __init__(self, directory: str | Path, max_runs: int = 16):
+        self.directory = Path(directory)
+        self.max_runs = max_runs
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._staged: dict[tuple[str, ...], pl.Series] = {}
+        self._staged_rows = 0
+        path = self.directory / MANIFEST
+        self.manifest = (
+            HistoryManifest.model_validate_json(path.read_text())
+            if path.exists()
+            else HistoryManifest()
+        )
+
+    @property
+    def rows(self) -> int:
+        """Number of rows committed to the history"""
+        return self.manifest.rows
+
+    def fingerprint(self) -> str:
+        """Identifies the committed state"""
+        return f"{self.directory.resolve()}:{self.manifest.generation}"
+
+    def contains(self, columns: list[str], keys: pl.Series) -> pl.Series:
+        """Mask of the encoded `keys` already in the history"""
+        found = pl.Series(KEY, [False] * len(keys))
+        runs = [
+            run
+            for ks in self.manifest.key_sets
+            if ks.columns == columns
+            for run in ks.runs
+        ]
+        if not len(keys):
+            return found
+        low, high = keys.min(), keys.max()
+        for run in runs:
+            if run.max < low or run.min > high:
+                continue
+            history = pl.read_ipc(self.directory / run.file).to_series()
+            position = history.search_sorted(keys, side="left")
+            found |= history.gather(position.clip(upper_bound=run.rows - 1)) == keys
+        return found
+
+    def stage(self, columns: list[str], keys: pl.Series, rows: int):
+        """Stage the encoded keys of a batch of `rows` rows to be committed"""
+        self._staged[tuple(columns)] = keys
+        self._staged_rows = rows
+
+    def commit(self):
+        """Add the staged batch to the history"""
+        if not self._staged:
+            return
+        manifest = self.manifest.model_copy(deep=True)
+        for columns, keys in self._staged.items():
+            if not len(keys):
+                continue
+            key_set = _key_set(manifest, list(columns))
+            key_set.runs.append(self._write_run(keys.unique().sort()))
+            if len(key_set.runs) > self.max_runs:
+                key_set.runs = [self._merge_runs(key_set.runs)]
+        manifest.generation += 1
+        manifest.rows += self._staged_rows
+        self._write_manifest(manifest)
+        self.rollback()
+
+    def rollback(self):
+        """Discard the staged batch"""
+        self._staged.clear()
+        self._staged_rows = 0
+
+    def _write_run(self, keys: pl.Series) -> KeyRun:
+        """Write sorted distinct keys to a new file"""
+        file = f"keys-{uuid.uuid4().hex}.arrow"
+        keys.alias(KEY).to_frame().write_ipc(self.directory / file)
+        return KeyRun(file=file, rows=len(keys), min=keys[0], max=keys[-1])
+
+    def _merge_runs(self, runs: list[KeyRun]) -> KeyRun:
+        merged = (
+            pl.concat(pl.read_ipc(self.directory / run.file) for run in runs)
+            .to_series()
+            .unique()
+            .sort()
+        )
+        return self._write_run(merged)
+
+    def _write_manifest(self, manifest: HistoryManifest):
+        """Replace the manifest atomically then remove unreferenced key files"""
+        tmp_path = self.directory / f"{MANIFEST}.{os.getpid()}.tmp"
+        tmp_path.write_text(manifest.model_dump_json(indent=2))
+        os.replace(tmp_path, self.directory / MANIFEST)
+        self.manifest = manifest
+        referenced = {run.file for key_set in manifest.key_sets for run in key_set.runs}
+        for path in self.directory.glob("keys-*.arrow"):
+            if path.name not in referenced:
+                path.unlink(missing_ok=True)
@@ -0,0 +1,98 @@
+import polars as pl
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Iterator
+from .base import ROW_INDEX
+
+PARTITION = "__partition"
+
+
+class KeySet:
+    """Hash partitioned multiset of keys and the rows they were seen on.
+
+    Keys are added a batch at a time and buffered in memory, split into
+    `partitions` by hash. When the buffers grow past `memory_budget` bytes the
+    largest partition is spilled to a Parquet file, so finding the duplicated
+    keys exactly only ever needs one partition in memory at once.
+
+    Example usage:
+    --------------
+    >>> key_set = KeySet(["Member ID"], memory_budget=256 * 2**20)
+    >>> for batch in batches:
+    ...     key_set.add(batch.select("Member ID", "__row_index"))
+    >>> duplicates = pl.concat(key_set.duplicates())
+    """
+
+    def __init__(
+        self,
+        columns: list[str],
+        memory_budget: int = 256 * 2**20,
+        partitions: int = 64,
+        spill_dir: str | Path | None = None,
+    ):
+        self.columns = columns
+        self.memory_budget = memory_budget
+        self.partitions = partitions
+        self.spill_dir = spill_dir
+        self._tmp_dir: TemporaryDirectory | None = None
+        self._buffers: dict[int, list[pl.DataFrame]] = {}
+        self._buffer_sizes: dict[int, int] = {}
+        self._spilled: dict[int, list[Path]] = {}
+
+    @staticmethod
+    def partition_expr(columns: list[str], partitions: int) -> pl.Expr:
+        """Hash partition of the key columns, equal keys share a partition"""
+        return (pl.struct(columns).hash(seed=0) % partitions).alias(PARTITION)
+
+    def add(self, keys: pl.DataFrame):
+        """Add a batch of key columns along with their `__row_index` column"""
+        keys = keys.select(*self.columns, ROW_INDEX).with_columns(
+            self.partition_expr(self.columns, self.partitions)
+        )
+        for (partition,), part in keys.partition_by(
+            PARTITION, as_dict=True, include_key=False
+        ).items():
+            self._buffers.setdefault(partition, []).append(part)
+            self._buffer_sizes[partition] = (
+                self._buffer_sizes.get(partition, 0) + part.estimated_size()
+            )
+        while sum(self._buffer_sizes.values()) > self.memory_budget:
+            self._spill(max(self._buffer_sizes, key=self._buffer_sizes.__getitem__))
+
+    def _spill(self, partition: int):
+        """Write a partition buffer to disk"""
+        if self._tmp_dir is None:
+            self._tmp_dir = TemporaryDirectory(dir=self.spill_dir, prefix="keyset-")
+        spilled = self._spilled.setdefault(partition, [])
+        path = Path(self._tmp_dir.name) / f"part-{partition}-{len(spilled)}.parquet"
+        pl.concat(self._buffers.pop(partition)).write_parquet(path)
+        spilled.append(path)
+        del self._buffer_sizes[partition]
+
+    def duplicates(self) -> Iterator[pl.DataFrame]:
+        """Keys and row indices of every row whose key was seen more than once
+
+        Yields one frame per partition then releases the key set.
+        """
+        try:
+            for partition in sorted(self._buffers.keys() | self._spilled.keys()):
+                parts = [
+                    pl.scan_parquet(path) for path in self._spilled.get(partition, [])
+                ]
+                parts += [part.lazy() for part in self._buffers.pop(partition, [])]
+                yield (
+                    pl.concat(parts)
+                    .filter(pl.struct(self.columns).is_duplicated())
+                    .collect()
+                )
+        finally:
+            self.close()
+
+    def close(self):
+        """Drop buffered keys and remove any spilled files"""
+        self._buffers.clear()
+        self._buffer_sizes.clear()
+        self._spilled.clear()
+        if self._tmp_dir is not None:
+            self._tmp_dir.cleanup()
+            self._tmp_dir = None
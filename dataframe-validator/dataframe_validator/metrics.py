@@ -0,0 +1,74 @@
+import threading
+import time
+from typing import Callable
+from pydantic import BaseModel
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+class ExpectationMetrics(BaseModel):
+    """Cost of evaluating a single expectation.
+
+    Expectations evaluated together in one pass over the data, in deferred
+    mode, share the metrics of that pass. `pass_expectations` is the number of
+    expectations in the pass, evaluate eagerly to measure each one on its own.
+
+    `peak_memory_bytes` is the peak growth in resident memory of the process
+    during the pass, it needs the optional `psutil` dependency. Results read
+    from a `ResultCache` have `cache_hit` set and no rows scanned. Expectations
+    skipped by a fail-fast validator have no `pass_id`.
+    """
+
+    position: int
+    column_name: str
+    expectation_name: str
+    pass_id: int | None
+    pass_expectations: int
+    wall_seconds: float
+    cpu_seconds: float
+    peak_memory_bytes: int | None = None
+    rows_scanned: int = 0
+    cache_hit: bool = False
+
+
+MetricsHook = Callable[[ExpectationMetrics], None]
+
+
+class Measurement:
+    """Wall time, CPU time and peak memory growth of the code in its context
+
+    Polars allocates outside the Python heap, so memory is measured by
+    sampling the resident memory of the process from a background thread.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.peak_memory_bytes: int | None = None
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self._peak = max(self._peak, self._process.memory_info().rss)
+
+    def __enter__(self):
+        if psutil is not None:
+            self._process = psutil.Process()
+            self._start_rss = self._peak = self._process.memory_info().rss
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        self._wall, self._cpu = time.perf_counter(), time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.wall_seconds = time.perf_counter() - self._wall
+        self.cpu_seconds = time.process_time() - self._cpu
+        if psutil is not None:
+            self._stop.set()
+            self._thread.join()
+            self._peak = max(self._peak, self._process.memory_info().rss)
+            self.peak_memory_bytes = self._peak - self._start_rss
@@ -0,0 +1,56 @@
+from pathlib import Path
+from typing import Sequence
+from pydantic import BaseModel
+from .expectations import ColumnStatistics
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+
+class RowGroup(BaseModel):
+    """A row group of a Parquet file and the statistics of its columns"""
+
+    file: str
+    offset: int
+    rows: int
+    statistics: dict[str, ColumnStatistics] = {}
+
+
+def read_row_groups(files: Sequence[str | Path]) -> list[RowGroup] | None:
+    """Row groups of Parquet files, in order, read from the file footers only
+
+    `offset` is the position of the first row of the row group across all the
+    files. Returns None without the optional `pyarrow` dependency.
+    """
+    if pq is None:
+        return None
+    row_groups = []
+    offset = 0
+    for file in files:
+        metadata = pq.read_metadata(file)
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            statistics = {}
+            for j in range(row_group.num_columns):
+                column = row_group.column(j)
+                if column.statistics is None:
+                    continue
+                stats = column.statistics
+                statistics[column.path_in_schema] = ColumnStatistics(
+                    rows=row_group.num_rows,
+                    null_count=stats.null_count if stats.has_null_count else None,
+                    min=stats.min if stats.has_min_max else None,
+                    max=stats.max if stats.has_min_max else None,
+                )
+            row_groups.append(
+                RowGroup(
+                    file=str(file),
+                    offset=offset,
+                    rows=row_group.num_rows,
+                    statistics=statistics,
+                )
+            )
+            offset += row_group.num_rows
+    return row_groups
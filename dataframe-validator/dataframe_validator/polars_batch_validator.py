@@ -0,0 +1,279 @@
+import polars as pl
+from pathlib import Path
+from typing import Any, Callable, Iterable, Literal, Self
+from .base import BaseValidator, ROW_INDEX, ROWS_SCANNED
+from .cache import content_hash
+from .expectations import Expectation
+from .history import encode_keys
+from .key_set import KeySet
+from .quarantine import QuarantineManifest, write_part
+
+BatchSource = Callable[[], Iterable[pl.DataFrame]]
+
+
+class PolarsBatchValidator(BaseValidator):
+    """Validator for data read one batch at a time.
+
+    Expectations are recorded as in deferred mode, then evaluated by streaming
+    every batch from `batches` once and merging the per batch results.
+    Uniqueness expectations stay exact across batches, keys are collected in a
+    `KeySet` that spills to disk once it outgrows `memory_budget` bytes.
+
+    `batches` is a callable returning a fresh iterable of DataFrames. It is
+    called again only when `validation_fails` has to gather the failing rows.
+    With `key_columns` set, batches from `from_csv` and `from_parquet` are read
+    with only the key columns and those the expectations reference.
+
+    Example usage:
+    --------------
+    >>> PolarsBatchValidator.from_csv("members.csv", batch_size=100_000) \\
+        .expect_column_to_contain_unique_values("Member ID") \\
+        .expect_column_to_contain_unique_values("Nino") \\
+        .show_results()
+    """
+
+    def __init__(
+        self,
+        batches: BatchSource,
+        schema: pl.Schema | None = None,
+        memory_budget: int = 2**30,
+        spill_dir: str | Path | None = None,
+        max_fail_rows: int | None = None,
+        max_total_fail_rows: int | None = None,
+        fail_sample: Literal["head", "random"] = "head",
+        key_columns: list[str] | None = None,
+    ):
+        self.batches = batches
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
+        self._batch_schema = schema
+        self._scan: pl.LazyFrame | None = None
+        self._batch_size: int | None = None
+        self._init_validator(
+            deferred=True,
+            max_fail_rows=max_fail_rows,
+            max_total_fail_rows=max_total_fail_rows,
+            fail_sample=fail_sample,
+            key_columns=key_columns,
+        )
+
+    @classmethod
+    def from_csv(
+        cls,
+        source: str | Path,
+        batch_size: int = 100_000,
+        scan_options: dict | None = None,
+        **kwargs,
+    ) -> Self:
+        """Validate a CSV file in batches of `batch_size` rows
+
+        `scan_options` are passed to `pl.scan_csv`, other keyword arguments to
+        the validator.
+        """
+        return cls._from_scan(
+            pl.scan_csv(source, **(scan_options or {})), batch_size, **kwargs
+        )
+
+    @classmethod
+    def from_parquet(
+        cls,
+        source: str | Path,
+        batch_size: int = 100_000,
+        scan_options: dict | None = None,
+        **kwargs,
+    ) -> Self:
+        """Validate Parquet files in batches of `batch_size` rows
+
+        `scan_options` are passed to `pl.scan_parquet`, other keyword arguments
+        to the validator.
+        """
+        return cls._from_scan(
+            pl.scan_parquet(source, **(scan_options or {})), batch_size, **kwargs
+        )
+
+    @classmethod
+    def _from_scan(cls, lf: pl.LazyFrame, batch_size: int, **kwargs) -> Self:
+        validator = cls(
+            lambda: lf.collect_batches(chunk_size=batch_size),
+            schema=lf.collect_schema(),
+            **kwargs,
+        )
+        validator._scan, validator._batch_size = lf, batch_size
+        return validator
+
+    def _schema(self) -> pl.Schema:
+        if self._batch_schema is None:
+            batch = next(iter(self.batches()), None)
+            if batch is None:
+                raise ValueError("No batches to read the schema from, pass `schema`")
+            self._batch_schema = batch.schema
+        return self._batch_schema
+
+    def _read_batches(self, project: bool) -> Iterable[pl.DataFrame]:
+        """Batches from the source, only the columns of `projection` if `project`"""
+        if not project or self.projection is None:
+            return self.batches()
+        if self._scan is not None:
+            # Only decode the projected columns
+            return self._project(self._scan).collect_batches(
+                chunk_size=self._batch_size
+            )
+        return (self._project(batch) for batch in self.batches())
+
+    def _iter_batches(self, project: bool = True) -> Iterable[pl.DataFrame]:
+        """Batches with a global `__row_index` column"""
+        offset = 0
+        for batch in self._read_batches(project):
+            yield batch.with_row_index(ROW_INDEX, offset=offset)
+            offset += batch.height
+
+    def _evaluate(
+        self, checks: dict[str, Expectation], limit: int | None
+    ) -> dict[str, Any]:
+        """Merge the results of every batch"""
+        unique_checks = {k: e for k, e in checks.items() if e.unique_by}
+        batch_checks = {k: e for k, e in checks.items() if not e.unique_by}
+        key_sets = {
+            key: KeySet(
+                expectation.unique_by,
+                memory_budget=self.memory_budget // len(unique_checks),
+                spill_dir=self.spill_dir,
+            )
+            for key, expectation in unique_checks.items()
+        }
+        aggregates: dict[str, list[Any]] = {
+            key: [] for key, e in checks.items() if e.aggregate_expr is not None
+        }
+        rows_scanned = 0
+        counts = dict.fromkeys(checks, 0)
+        indices: dict[str, list[pl.Series]] = {key: [] for key in checks}
+
+        def add_fails(key: str, fail_count: int, fail_indices: pl.Series):
+            counts[key] += fail_count
+            indices[key].append(fail_indices)
+            if limit is not None:
+                indices[key] = [self._sample_indices(pl.concat(indices[key]), limit)]
+
+        try:
+            for batch in self._iter_batches():
+                rows_scanned += batch.height
+                if batch_checks:
+                    evaluated = self._plan(batch, batch_checks, limit)
+                    for key in batch_checks:
+                        if key in aggregates:
+                            aggregates[key].append(evaluated[f"aggregate_{key}"][0])
+                        else:
+                            add_fails(
+                                key,
+                                evaluated[f"count_{key}"][0],
+                                evaluated[f"index_{key}"][0],
+                            )
+                for key_set in key_sets.values():
+                    key_set.add(batch)
+
+            for key, key_set in key_sets.items():
+                for duplicates in key_set.duplicates():
+                    add_fails(key, len(duplicates), duplicates[ROW_INDEX])
+        finally:
+            for key_set in key_sets.values():
+                key_set.close()
+        return {
+            ROWS_SCANNED: rows_scanned,
+            **{
+                key: aggregates[key]
+                if key in aggregates
+                else (
+                    counts[key],
+                    self._sample_indices(pl.concat(indices[key]), limit)
+                    if indices[key]
+                    else pl.Series(ROW_INDEX, [], dtype=pl.get_index_type()),
+                )
+                for key in checks
+            },
+        }
+
+    def _evaluate_references(
+        self, checks: dict[str, Expectation], limit: int | None
+    ) -> dict[str, Any]:
+        """Anti-join every batch against the keys of each reference"""
+        references = {
+            key: expectation.reference.select(expectation.reference_columns)
+            .unique()
+            .collect()
+            for key, expectation in checks.items()
+        }
+        rows_scanned = 0
+        orphans: dict[str, list[pl.Series]] = {key: [] for key in checks}
+        for batch in self._iter_batches():
+            rows_scanned += batch.height
+            for key, expectation in checks.items():
+                orphans[key].append(
+                    batch.drop_nulls(expectation.column_names)
+                    .join(
+                        references[key],
+                        left_on=expectation.column_names,
+                        right_on=expectation.reference_columns,
+                        how="anti",
+                    )
+                    .get_column(ROW_INDEX)
+                )
+        evaluated = {ROWS_SCANNED: rows_scanned}
+        for key in checks:
+            failing = (
+                pl.concat(orphans[key])
+                if orphans[key]
+                else pl.Series(ROW_INDEX, [], dtype=pl.get_index_type())
+            )
+            evaluated[key] = (len(failing), self._sample_indices(failing, limit))
+        return evaluated
+
+    def _data_fingerprint(self) -> str:
+        """Fingerprint of the data, from a hash of every row and its position"""
+        hashes = pl.concat(
+            batch.select(content_hash()) for batch in self._iter_batches(project=False)
+        ).sum()
+        return f"{self._schema()}{hashes.row(0)}"
+
+    def _key_frame(self, columns: list[str]) -> pl.DataFrame:
+        return pl.concat(
+            batch.select(encode_keys(columns), ROW_INDEX)
+            for batch in self._iter_batches()
+        )
+
+    def _write_fails(self, directory: Path, manifest: QuarantineManifest):
+        """Write the failing rows of every batch as they are read, one file
+        per batch and quarantined expectation"""
+        file_format = manifest.file_format
+        wanted = {
+            quarantined.position: self._fail_indices[quarantined.position].to_frame()
+            for quarantined in manifest.expectations
+        }
+        for part, batch in enumerate(self._iter_batches()):
+            for quarantined in manifest.expectations:
+                fails = batch.join(
+                    wanted[quarantined.position], on=ROW_INDEX, how="semi"
+                )
+                if fails.height:
+                    write_part(
+                        fails,
+                        directory / quarantined.path / f"part-{part:05}.{file_format}",
+                        file_format,
+                        quarantined,
+                    )
+
+    def _gather_rows(
+        self, row_index: pl.Series, columns: list[str] | None = None
+    ) -> pl.DataFrame:
+        """Gather the failing rows with a second pass over the batches"""
+        wanted = row_index.unique().to_frame()
+        rows = pl.concat(
+            (batch if columns is None else batch.select(*columns, ROW_INDEX)).join(
+                wanted, on=ROW_INDEX, how="semi"
+            )
+            for batch in self._iter_batches()
+        )
+        return (
+            row_index.to_frame()
+            .join(rows, on=ROW_INDEX, how="left", maintain_order="left")
+            .drop(ROW_INDEX)
+        )
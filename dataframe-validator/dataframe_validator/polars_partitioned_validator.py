@@ -0,0 +1,256 @@
+import glob
+import multiprocessing
+import os
+import polars as pl
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from itertools import accumulate
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Iterator, Literal, Sequence
+from .base import BaseValidator, ROW_INDEX, ROWS_SCANNED
+from .cache import file_fingerprint
+from .expectations import Expectation
+from .key_set import KeySet, PARTITION
+from .polars_validator import PolarsDataFrameValidator
+
+FileFormat = Literal["parquet", "csv", "ipc"]
+
+SCANNERS = {"parquet": pl.scan_parquet, "csv": pl.scan_csv, "ipc": pl.scan_ipc}
+
+# Held while workers are spawned with POLARS_MAX_THREADS set for them
+_SPAWN_LOCK = threading.Lock()
+
+
+class PolarsPartitionedValidator(BaseValidator):
+    """Validator for a dataset split into many files, run on a process pool.
+
+    Expectations are recorded as in deferred mode. When results are requested
+    every file is validated in parallel by a pool of `max_workers` processes
+    and the per file results are merged into one report, fail counts summed
+    and a result passing only if it passed for every file.
+
+    Uniqueness expectations are checked across the whole dataset. Workers
+    hash partition the key columns into `shuffle_partitions` files under
+    `spill_dir`, then each hash partition is checked for duplicates by a worker.
+
+    Each file is scanned for only the columns its expectations reference, set
+    `key_columns` to also report failing rows with just those columns.
+
+    Workers are spawned processes that import the main module, so scripts must
+    validate under an `if __name__ == "__main__":` guard.
+
+    Example usage:
+    --------------
+    >>> if __name__ == "__main__":
+    ...     PolarsPartitionedValidator("members/*.parquet", max_workers=8) \\
+    ...         .expect_column_to_contain_unique_values("Member ID") \\
+    ...         .expect_column_value_to_be_in_set("Status", ["Active", "Retired"]) \\
+    ...         .show_results()
+    """
+
+    def __init__(
+        self,
+        source: str | Path | Sequence[str | Path],
+        file_format: FileFormat = "parquet",
+        max_workers: int | None = None,
+        shuffle_partitions: int = 64,
+        spill_dir: str | Path | None = None,
+        max_fail_rows: int | None = None,
+        max_total_fail_rows: int | None = None,
+        fail_sample: Literal["head", "random"] = "head",
+        key_columns: list[str] | None = None,
+    ):
+        self.files = _expand_source(source, file_format)
+        if not self.files:
+            raise FileNotFoundError(f"No {file_format} files found for {source}")
+        self.file_format = file_format
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shuffle_partitions = shuffle_partitions
+        self.spill_dir = spill_dir
+        self._init_validator(
+            deferred=True,
+            streaming=True,
+            max_fail_rows=max_fail_rows,
+            max_total_fail_rows=max_total_fail_rows,
+            fail_sample=fail_sample,
+            key_columns=key_columns,
+        )
+        if file_format == "parquet":
+            self._parquet_files = self.files
+
+    def _frame(self) -> pl.LazyFrame:
+        return SCANNERS[self.file_format](self.files)
+
+    @contextmanager
+    def _pool(self) -> Iterator[ProcessPoolExecutor]:
+        """A pool of spawned workers, each limiting its Polars thread pool to a
+        share of the cores so they don't oversubscribe them.
+
+        Polars reads `POLARS_MAX_THREADS` when imported, which a spawned worker
+        may do before any initializer runs, when it imports the main module.
+        So the variable is passed in the environment the workers inherit: it is
+        set only while every worker is started, under a lock so concurrent
+        validators don't see each other's value, then restored.
+        """
+        threads = max((os.cpu_count() or 1) // self.max_workers, 1)
+        with _SPAWN_LOCK:
+            previous = os.environ.get("POLARS_MAX_THREADS")
+            os.environ["POLARS_MAX_THREADS"] = str(threads)
+            try:
+                pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                # Spawned workers are started on submit, while none are idle
+                for _ in range(self.max_workers):
+                    pool.submit(os.getpid)
+            finally:
+                if previous is None:
+                    del os.environ["POLARS_MAX_THREADS"]
+                else:
+                    os.environ["POLARS_MAX_THREADS"] = previous
+        with pool:
+            yield pool
+
+    def _evaluate(
+        self, checks: dict[str, Expectation], limit: int | None
+    ) -> dict[str, Any]:
+        """Validate every file on the process pool and merge the results"""
+        unique_checks = {k: e for k, e in checks.items() if e.unique_by}
+        file_checks = {k: e for k, e in checks.items() if not e.unique_by}
+        sampling = {"max_fail_rows": limit, "fail_sample": self.fail_sample}
+
+        with (
+            self._pool() as pool,
+            TemporaryDirectory(dir=self.spill_dir, prefix="shuffle-") as shuffle_dir,
+        ):
+            heights = list(
+                pool.map(_count_rows, [self.file_format] * len(self.files), self.files)
+            )
+            offsets = [0, *accumulate(heights)][:-1]
+            partitions = list(
+                pool.map(
+                    partial(
+                        _validate_file,
+                        self.file_format,
+                        checks=file_checks,
+                        unique_checks=unique_checks,
+                        sampling=sampling,
+                        shuffle_dir=shuffle_dir,
+                        shuffle_partitions=self.shuffle_partitions,
+                    ),
+                    self.files,
+                    offsets,
+                )
+            )
+            duplicates = [
+                pool.submit(
+                    _find_duplicates,
+                    expectation.unique_by,
+                    sampling,
+                    Path(shuffle_dir) / key / str(partition),
+                )
+                for key, expectation in unique_checks.items()
+                for partition in range(self.shuffle_partitions)
+            ]
+            duplicates = [future.result() for future in duplicates]
+
+        evaluated = {ROWS_SCANNED: sum(heights)}
+        for key, expectation in file_checks.items():
+            if expectation.aggregate_expr is not None:
+                evaluated[key] = [v for partition in partitions for v in partition[key]]
+            else:
+                evaluated[key] = self._merge_fails(
+                    [partition[key] for partition in partitions], limit
+                )
+        for i, key in enumerate(unique_checks):
+            first = i * self.shuffle_partitions
+            evaluated[key] = self._merge_fails(
+                duplicates[first : first + self.shuffle_partitions], limit
+            )
+        return evaluated
+
+    def _data_fingerprint(self) -> str:
+        return file_fingerprint(self.files)
+
+    def _merge_fails(
+        self, fails: list[tuple[int, pl.Series]], limit: int | None
+    ) -> tuple[int, pl.Series]:
+        """Sum fail counts and sample the failing row indices of all partitions"""
+        indices = [index for _, index in fails if len(index)]
+        return (
+            sum(count for count, _ in fails),
+            self._sample_indices(pl.concat(indices), limit)
+            if indices
+            else pl.Series(ROW_INDEX, [], dtype=pl.get_index_type()),
+        )
+
+
+def _expand_source(
+    source: str | Path | Sequence[str | Path], file_format: FileFormat
+) -> list[str]:
+    """Sorted list of files from a directory, glob pattern or list of paths"""
+    if isinstance(source, (str, Path)):
+        if Path(source).is_dir():
+            return sorted(str(path) for path in Path(source).glob(f"*.{file_format}"))
+        return sorted(glob.glob(str(source)))
+    return [str(path) for path in source]
+
+
+def _count_rows(file_format: FileFormat, path: str) -> int:
+    return SCANNERS[file_format](path).select(pl.len()).collect().item()
+
+
+def _validate_file(
+    file_format: FileFormat,
+    path: str,
+    offset: int,
+    checks: dict[str, Expectation],
+    unique_checks: dict[str, Expectation],
+    sampling: dict,
+    shuffle_dir: str,
+    shuffle_partitions: int,
+) -> dict[str, Any]:
+    """Evaluate the expectations of one file and shuffle its uniqueness keys"""
+    lf = SCANNERS[file_format](path).with_row_index(ROW_INDEX, offset=offset)
+    validator = PolarsDataFrameValidator(lf, **sampling)
+    evaluated = (
+        validator._evaluate_indexed(lf, checks, sampling["max_fail_rows"])
+        if checks
+        else {}
+    )
+    for key, expectation in unique_checks.items():
+        keys = validator._collect(
+            lf.select(*expectation.unique_by, ROW_INDEX).with_columns(
+                KeySet.partition_expr(expectation.unique_by, shuffle_partitions)
+            )
+        )
+        for (partition,), part in keys.partition_by(
+            PARTITION, as_dict=True, include_key=False
+        ).items():
+            part_dir = Path(shuffle_dir) / key / str(partition)
+            part_dir.mkdir(parents=True, exist_ok=True)
+            part.write_parquet(part_dir / f"{offset}.parquet")
+    return evaluated
+
+
+def _find_duplicates(
+    columns: list[str], sampling: dict, part_dir: Path
+) -> tuple[int, pl.Series]:
+    """Fail count and failing rows of a uniqueness check in one hash partition"""
+    if not part_dir.exists():
+        return 0, pl.Series(ROW_INDEX, [], dtype=pl.get_index_type())
+    duplicates = (
+        pl.scan_parquet(part_dir / "*.parquet")
+        .filter(pl.struct(columns).is_duplicated())
+        .select(ROW_INDEX)
+        .collect()
+        .to_series()
+    )
+    validator = PolarsDataFrameValidator(pl.DataFrame(), **sampling)
+    return len(duplicates), validator._sample_indices(
+        duplicates, sampling["max_fail_rows"]
+    )
@@ -1,22 +1,69 @@
+import functools
+import inspect
 import polars as pl
-from typing import Self
-from pydantic import BaseModel
-from datetime import date, datetime
+from typing import Literal, Self
 from polars._typing import FrameInitTypes, SchemaDefinition, SchemaDict, Orientation
 from polars.datatypes.constants import N_INFER_DEFAULT
+from .base import BaseValidator
+from .expectations import ValidationResult
 from .exceptions import DataValidationError
 
-class ValidationResult(BaseModel):
-    """Validation result for a single expectation"""
-
-    column_name: str
-    expectation_name: str
-    expectation_args: str | None = ""
-    result: bool
-    fail_rows: int | None = None
-
-
-class ValidatorDataFrame(pl.DataFrame):
+__all__ = ["ValidatorDataFrame", "ValidationResult", "DataValidationError"]
+
+# Polars methods returning a new frame that keep the validator, see
+# `ValidatorDataFrame._derive`. Other methods return a plain `pl.DataFrame`,
+# and methods changing the frame in place return the frame itself. Versions of
+# Polars without a method skip it.
+TRANSFORMATIONS = (
+    "filter",
+    "remove",
+    "with_columns",
+    "with_columns_seq",
+    "map_columns",
+    "with_row_index",
+    "select",
+    "select_seq",
+    "drop",
+    "rename",
+    "cast",
+    "match_to_schema",
+    "fill_null",
+    "fill_nan",
+    "drop_nulls",
+    "drop_nans",
+    "interpolate",
+    "unique",
+    "sort",
+    "set_sorted",
+    "top_k",
+    "bottom_k",
+    "head",
+    "tail",
+    "limit",
+    "slice",
+    "sample",
+    "gather",
+    "gather_every",
+    "shift",
+    "reverse",
+    "explode",
+    "unnest",
+    "upsample",
+    "clone",
+    "clear",
+    "rechunk",
+    "shrink_to_fit",
+    "vstack",
+    "hstack",
+    "join",
+    "join_asof",
+    "join_where",
+    "merge_sorted",
+    "update",
+)
+
+
+class ValidatorDataFrame(BaseValidator, pl.DataFrame):
     """
     An extended Polars DataFrame with data validation expectation methods.
 
@@ -26,6 +73,27 @@ class ValidatorDataFrame(pl.DataFrame):
         .expect_column_to_exist("Customer Id") \\
         .expect_column_to_contain_unique_values("Index") \\
         .show_results()
+
+    Pass `deferred=True` to only record the chained expectations and evaluate
+    them together, in a single pass, when results are first requested.
+
+    A `pl.LazyFrame` passed as `data` is collected with the streaming engine.
+
+    `max_fail_rows`, `max_total_fail_rows` and `fail_sample` bound the failing
+    rows kept for `validation_fails` and `key_columns` narrows their columns,
+    see `PolarsDataFrameValidator`.
+
+    A DataFrame or Arrow table, see `from_arrow`, is wrapped without copying
+    its columns.
+    Polars transformations such as `filter`, `with_columns` or `head`, see
+    `TRANSFORMATIONS`, return a `ValidatorDataFrame` with the same options and
+    expectations, evaluated against the new frame when its results are
+    requested. Other methods returning a frame, such as `describe`, `pivot` or
+    `transpose`, return a plain `pl.DataFrame`. Importing the package also
+    registers a `validate` namespace on Polars DataFrames:
+
+    >>> customers.validate.expect_column_to_exist("Customer Id")
+    >>> customers.validate.filter(pl.col("Index") > 0).show_results()
     """
 
     def __init__(
@@ -38,253 +106,129 @@ class ValidatorDataFrame(pl.DataFrame):
         orient: Orientation | None = None,
         infer_schema_length: int | None = N_INFER_DEFAULT,
         nan_to_null: bool = False,
+        deferred: bool = False,
+        max_fail_rows: int | None = None,
+        max_total_fail_rows: int | None = None,
+        fail_sample: Literal["head", "random"] = "head",
+        key_columns: list[str] | None = None,
     ):
-        super().__init__(
-            data=data,
-            schema=schema,
-            schema_overrides=schema_overrides,
-            strict=strict,
-            orient=orient,
-            infer_schema_length=infer_schema_length,
-            nan_to_null=nan_to_null,
-        )
-        self.validation_results: list[ValidationResult] = []
-        self.validation_fails = pl.DataFrame()
-        self._is_valid = True
-
-    def expect_column_to_exist(
-        self,
-        column_name: str,
-    ) -> Self:
-        """Expect a column to exist in the DataFrame"""
-        self.validation_results.append(
-            ValidationResult(
-                expectation_name="expect_column_to_exist",
-                column_name=column_name,
-                result=column_name in self.columns,
-            )
-        )
-        return self
-
-    def expect_column_to_contain_unique_values(
-        self,
-        column_name: str,
-    ) -> Self:
-        """Expect all values in a column to be unique"""
-        validation_result = self.select(column_name).n_unique() == len(self)
-        non_unique_rows = self.filter(self.select(column_name).is_unique().not_())
-
-        validation_fails = self.__add_validation_fail_columns(
-            non_unique_rows,
-            "expect_column_to_contain_unique_values",
-            column_name=column_name,
-        )
-
-        self._is_valid = False if not validation_result else self._is_valid
-        self.validation_fails = pl.concat([self.validation_fails, validation_fails])
-        self.validation_results.append(
-            ValidationResult(
-                expectation_name="expect_column_to_contain_unique_values",
-                column_name=column_name,
-                fail_rows=len(non_unique_rows),
-                result=validation_result,
-            )
-        )
-        return self
-
-    def expect_column_value_greater_than(
-        self,
-        column_name: str,
-        value: int | float | date | datetime,
-        allow_nulls: bool = False,  # Not implemented
-    ) -> Self:
-        """Expect all values in a column to be greater than a given value"""
-        validation_result = self[column_name].gt(value).all()
-        fail_rows = self.filter(pl.col(column_name).le(value))
-
-        self._is_valid = False if not validation_result else self._is_valid
-        validation_fails = self.__add_validation_fail_columns(
-            fail_rows,
-            "expect_column_value_greater_than",
-            column_name=column_name,
-            value=value,
-            allow_nulls=allow_nulls,
-        )
-
-        self.validation_fails = pl.concat([self.validation_fails, validation_fails])
-
-        self.validation_results.append(
-            ValidationResult(
-                expectation_name="expect_column_value_greater_than",
-                expectation_args=f"{value=}, {allow_nulls=}",
-                column_name=column_name,
-                fail_rows=len(fail_rows),
-                result=validation_result,
-            )
-        )
-        return self
-
-    def show_results(self):
-        with pl.Config(
-            tbl_hide_column_data_types=True,
-            tbl_hide_dataframe_shape=True,
-            fmt_str_lengths=1000,
-            tbl_rows=len(self.validation_results)
+        if isinstance(data, pl.LazyFrame):
+            data = data.collect(engine="streaming")
+        if (
+            isinstance(data, pl.DataFrame)
+            and schema is None
+            and schema_overrides is None
         ):
-            results = pl.DataFrame(
-                [
-                    result.model_dump()
-                    for result in sorted(
-                        self.validation_results, key=lambda x: x.column_name
-                    )
-                ]
-            ).with_columns(
-                pl.col("fail_rows").fill_null(""),
-                pl.col("result").map_elements(
-                    function=lambda x: "✅" if x else "❌", return_dtype=pl.Utf8
-                ),
-            )
-            print(results)
-        return self
-
-    def throw_error_if_invalid(self):
-        """Throw an error if any validation results are False"""
-        validation_failures = [
-            result for result in self.validation_results if not result.result
-        ]
-        if validation_failures:
-            err_msg = f"Validation failed for {len(validation_failures)} expectations"
-            raise DataValidationError(err_msg)
-
-    def expect_column_value_to_be_between(
-        self, column_name: str, low_value, high_value
-    ) -> Self:
-        """Not implemented"""
-        return self
-
-    def expect_column_a_greater_than_column_b(
-        self, column_a: str, column_b: str
-    ) -> Self:
-        """Not implemented"""
-        validation_result = len(self.filter(pl.col(column_a) <= pl.col(column_b))) == 0
-        fail_rows = self.filter(pl.col(column_a) <= pl.col(column_b))
-
-        self._is_valid = False if not validation_result else self._is_valid
-        validation_fails = self.__add_validation_fail_columns(
-            fail_rows,
-            "expect_column_a_greater_than_column_b",
-            column_a=column_a,
-            column_b=column_b,
-        )
-
-        self.validation_fails = pl.concat([self.validation_fails, validation_fails])
-
-        self.validation_results.append(
-            ValidationResult(
-                expectation_name="expect_column_value_greater_than",
-                expectation_args=f"{column_a=}, {column_b=}",
-                fail_rows=len(fail_rows),
-                result=validation_result,
-                column_name=column_a
+            # A shallow clone shares the column buffers, but not the frame, so
+            # in place methods such as `insert_column` leave `data` unchanged
+            self._df = data._df.clone()
+        else:
+            super().__init__(
+                data=data,
+                schema=schema,
+                schema_overrides=schema_overrides,
+                strict=strict,
+                orient=orient,
+                infer_schema_length=infer_schema_length,
+                nan_to_null=nan_to_null,
             )
+        self._init_validator(
+            deferred=deferred,
+            max_fail_rows=max_fail_rows,
+            max_total_fail_rows=max_total_fail_rows,
+            fail_sample=fail_sample,
+            key_columns=key_columns,
         )
-        return self
-
-    def expect_column_value_to_match_regex(
-        self, column_name: str, pattern: str
-    ) -> Self:
-        """Not implemented"""
-        return self
-
-    def expect_column_value_to_be_in_set(
-        self, column_name: str, values: list[str]
-    ) -> Self:
-        """Return True if all values in a column are in a given set"""
-        validation_result = self[column_name].is_in(values).all()
-        fail_rows = self.filter(pl.col(column_name).is_in(values).not_())
 
-        self._is_valid = False if not validation_result else self._is_valid
-        validation_fails = self.__add_validation_fail_columns(
-            fail_rows,
-            "expect_column_value_to_be_in_set",
-            column_name=column_name,
-            values=values,
-        )
+    @classmethod
+    def _from_pydf(cls, py_df) -> pl.DataFrame:
+        # Polars builds the frames its methods return with `_from_pydf`, which
+        # skips `__init__`, so they are plain frames unless `_derive`d
+        return pl.DataFrame._from_pydf(py_df)
 
-        self.validation_fails = pl.concat([self.validation_fails, validation_fails])
+    def _frame(self) -> pl.DataFrame:
+        # A plain view of the same columns, so evaluating expectations doesn't
+        # go through the transformations that keep the validator
+        return pl.DataFrame._from_pydf(self._df)
 
-        self.validation_results.append(
-            ValidationResult(
-                expectation_name="expect_column_value_to_be_in_set",
-                expectation_args=f"{values=}",
-                column_name=column_name,
-                fail_rows=len(fail_rows),
-                result=validation_result,
-            )
-        )
-        return self
-
-    def expect_column_to_be_of_type(self, column_name: str, column_type: type) -> Self:
-        """Not implemented"""
-        return self
-
-    def show_failures(self):
-        with pl.Config(
-            tbl_hide_column_data_types=True,
-            tbl_hide_dataframe_shape=True,
-            fmt_str_lengths=1000,
-            tbl_cols=1000,
-        ):
-            print(self.validation_fails)
-        return self
-
-    def __add_validation_fail_columns(
-        self, df: pl.DataFrame, expectation_name: str, **expectation_args
-    ) -> pl.DataFrame:
-        """Add expectation context columns to the failing rows."""
-        df = df.insert_column(
-            0,
-            pl.lit(expectation_name).alias("expectation_name"),
-        ).insert_column(
-            1,
-            pl.lit(f"{expectation_args}").alias("expectation_args"),
-        )
-        return df
+    @classmethod
+    def from_arrow(cls, data, **kwargs) -> Self:
+        """Wrap an Arrow table or record batch, without copying its buffers
+        where Polars supports the Arrow types. Keyword arguments are passed to
+        the validator."""
+        return cls(pl.from_arrow(data, rechunk=False), **kwargs)
 
     @property
-    def is_valid(self):
-        """Return True if all validation expectations are met"""
-        return self._is_valid
-
-    def expect_column_value_length_greater_than(
-        self,
-        column_name: str,
-        length: int | float | date | datetime,
-    ) -> Self:
-        """Expect column values to be strings of length greater than a given value"""
-        if self[column_name].dtype != pl.String:
-            raise DataValidationError(f"Column '{column_name}' is not of string type")
-
-        validation_result = self[column_name].str.len_chars().gt(length).all()
-        fail_rows = self.filter(pl.col(column_name).str.len_chars().le(length))
-
-        self._is_valid = False if not validation_result else self._is_valid
-        validation_fails = self.__add_validation_fail_columns(
-            fail_rows,
-            "expect_column_value_greater_than",
-            column_name=column_name,
-            length=length,
-        )
-
-        self.validation_fails = pl.concat([self.validation_fails, validation_fails])
+    def validate(self) -> Self:
+        """The frame itself, which is already a validator"""
+        return self
 
-        self.validation_results.append(
-            ValidationResult(
-                expectation_name="expect_column_value_length_greater_than",
-                expectation_args=f"{length=}",
-                column_name=column_name,
-                fail_rows=len(fail_rows),
-                result=validation_result,
-            )
+    def _derive(self, df: pl.DataFrame) -> "ValidatorDataFrame":
+        """A frame returned by a Polars transformation, validated with the same
+        options and expectations, which are evaluated against the new frame
+        when its results are requested.
+
+        Schema expectations are always evaluated, so a missing column still
+        fails them. Other expectations reading columns the new frame no longer
+        has are reported as skipped, see `skipped`."""
+        derived = type(self)(
+            df,
+            deferred=self.deferred,
+            max_fail_rows=self.max_fail_rows,
+            max_total_fail_rows=self.max_total_fail_rows,
+            fail_sample=self.fail_sample,
+            key_columns=self.key_columns,
         )
-        return self
+        derived._metrics_hooks = list(self._metrics_hooks)
+        derived._cache = self._cache
+        derived._max_failures = self._max_failures
+        schema = derived.schema
+        derived._pending = [*self._expectations, *self._pending]
+        derived._unavailable = {
+            position
+            for position, expectation in enumerate(derived._pending)
+            if expectation.cost()
+            and not all(column in schema for column in expectation.columns())
+        }
+        return derived
+
+
+def _keep_validator(name: str):
+    transform = getattr(pl.DataFrame, name)
+
+    @functools.wraps(transform)
+    def method(self: ValidatorDataFrame, *args, **kwargs) -> pl.DataFrame:
+        result = transform(self, *args, **kwargs)
+        if result is self:
+            # Changed in place, eg `vstack(..., in_place=True)`
+            return result
+        return self._derive(result)
+
+    return method
+
+
+def _plain_frame(name: str):
+    method_ = getattr(pl.DataFrame, name)
+
+    @functools.wraps(method_)
+    def method(self: ValidatorDataFrame, *args, **kwargs):
+        result = method_(self, *args, **kwargs)
+        if isinstance(result, ValidatorDataFrame) and result is not self:
+            # Built with a transformation, eg `product` selecting aggregates
+            return pl.DataFrame._from_pydf(result._df)
+        return result
+
+    return method
+
+
+for name, attribute in vars(pl.DataFrame).items():
+    if not inspect.isfunction(attribute) or name.startswith("_") or name == "pipe":
+        continue
+    if name in TRANSFORMATIONS:
+        setattr(ValidatorDataFrame, name, _keep_validator(name))
+    elif not hasattr(BaseValidator, name) and name not in vars(ValidatorDataFrame):
+        setattr(ValidatorDataFrame, name, _plain_frame(name))
+
+# `df.validate` on any Polars DataFrame, kept on the frame by Polars so the
+# expectations chained on it accumulate
+pl.api.register_dataframe_namespace("validate")(ValidatorDataFrame)
@@ -0,0 +1,93 @@
+import os
+import polars as pl
+from pathlib import Path
+from typing import Literal, Self
+from pydantic import BaseModel
+
+MANIFEST = "quarantine.json"
+# Key of the Parquet footer metadata describing the quarantined expectation
+METADATA_KEY = "dataframe_validator.expectation"
+
+QuarantineFormat = Literal["parquet", "ipc"]
+
+
+class QuarantinedExpectation(BaseModel):
+    """A failed expectation and the directory holding its failing rows"""
+
+    position: int
+    expectation_name: str
+    column_name: str
+    expectation_args: str
+    fail_rows: int | None
+    rows: int
+    path: str
+
+
+class QuarantineManifest(BaseModel):
+    """Index of a quarantine directory, written once alongside the failing rows
+    so the expectation arguments aren't repeated on every row.
+
+    The failing rows of each expectation are in their own directory of
+    Parquet or Arrow IPC files, with a `__row_index` column giving their
+    position in the validated frame.
+
+    Example usage:
+    --------------
+    >>> validator.write_quarantine("quarantine/members")
+    >>> manifest = QuarantineManifest.read("quarantine/members")
+    >>> for expectation in manifest.expectations:
+    ...     fails = manifest.scan("quarantine/members", expectation.position)
+    """
+
+    file_format: QuarantineFormat = "parquet"
+    expectations: list[QuarantinedExpectation] = []
+
+    @classmethod
+    def read(cls, directory: str | Path) -> Self:
+        return cls.model_validate_json((Path(directory) / MANIFEST).read_text())
+
+    def scan(self, directory: str | Path, position: int) -> pl.LazyFrame:
+        """Failing rows of the expectation at `position`"""
+        for expectation in self.expectations:
+            if expectation.position == position:
+                scan = pl.scan_parquet if self.file_format == "parquet" else pl.scan_ipc
+                return scan(
+                    Path(directory) / expectation.path / f"*.{self.file_format}"
+                )
+        raise KeyError(f"No failing rows quarantined for expectation {position}")
+
+    def write(self, directory: str | Path):
+        """Replace the manifest in `directory` atomically"""
+        path = Path(directory) / MANIFEST
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(self.model_dump_json(indent=2))
+        os.replace(tmp_path, path)
+
+
+def write_part(
+    df: pl.DataFrame,
+    path: Path,
+    file_format: QuarantineFormat,
+    expectation: QuarantinedExpectation,
+):
+    """Write one file of failing rows"""
+    if file_format == "parquet":
+        df.write_parquet(path, metadata={METADATA_KEY: expectation.model_dump_json()})
+    else:
+        df.write_ipc(path)
+
+
+def sink_part(
+    lf: pl.LazyFrame,
+    path: Path,
+    file_format: QuarantineFormat,
+    expectation: QuarantinedExpectation,
+) -> pl.LazyFrame:
+    """A sink of failing rows, to be run with the others by `pl.collect_all`"""
+    if file_format == "parquet":
+        return lf.sink_parquet(
+            path,
+            metadata={METADATA_KEY: expectation.model_dump_json()},
+            lazy=True,
+        )
+    return lf.sink_ipc(path, lazy=True)
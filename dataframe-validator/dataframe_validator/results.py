@@ -0,0 +1,93 @@
+import polars as pl
+from .expectations import ValidationResult
+from .metrics import ExpectationMetrics
+
+# Columns evaluated in a pass, see `ResolvedPass`
+PASS_SCHEMA = pl.Schema(
+    {"result": pl.Boolean, "fail_rows": pl.Int64, "rows_scanned": pl.Int64}
+)
+# A row per recorded expectation, the fields of `ValidationResult` and
+# `ExpectationMetrics`
+RESULT_SCHEMA = pl.Schema(
+    {
+        "position": pl.Int64,
+        "column_name": pl.String,
+        "expectation_name": pl.String,
+        "expectation_args": pl.String,
+        "result": pl.Boolean,
+        "fail_rows": pl.Int64,
+        "pass_id": pl.Int64,
+        "pass_expectations": pl.Int64,
+        "wall_seconds": pl.Float64,
+        "cpu_seconds": pl.Float64,
+        "peak_memory_bytes": pl.Int64,
+        "rows_scanned": pl.Int64,
+        "cache_hit": pl.Boolean,
+    }
+)
+# Result of an expectation skipped by a fail-fast validator
+SKIPPED = {
+    "result": None,
+    "fail_rows": None,
+    "pass_id": None,
+    "pass_expectations": 0,
+    "wall_seconds": 0.0,
+    "cpu_seconds": 0.0,
+    "peak_memory_bytes": None,
+    "rows_scanned": 0,
+    "cache_hit": False,
+}
+RESULT_FIELDS = list(ValidationResult.model_fields)
+METRICS_FIELDS = list(ExpectationMetrics.model_fields)
+
+
+class ResultTable:
+    """Results and metrics of every recorded expectation in one Polars frame,
+    a row per expectation, appended a pass at a time.
+
+    The `ValidationResult` and `ExpectationMetrics` models are only built when
+    they are asked for, reporting works on the frame directly.
+    """
+
+    def __init__(self):
+        self._frames: list[pl.DataFrame] = []
+        self._rows = 0
+        self._results: list[ValidationResult] = []
+        self._metrics: list[ExpectationMetrics] = []
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def append(self, results: pl.DataFrame):
+        """Add the results of a pass, with the columns of `RESULT_SCHEMA`"""
+        self._frames.append(results)
+        self._rows += results.height
+
+    @property
+    def frame(self) -> pl.DataFrame:
+        """Every result so far"""
+        if not self._frames:
+            return RESULT_SCHEMA.to_frame()
+        if len(self._frames) > 1:
+            self._frames = [pl.concat(self._frames, rechunk=True)]
+        return self._frames[0]
+
+    def validation_results(self) -> list[ValidationResult]:
+        """Every result as a model, only building those not built before"""
+        if len(self._results) < self._rows:
+            new = self.frame.slice(len(self._results)).select(RESULT_FIELDS)
+            self._results.extend(
+                ValidationResult.model_construct(**row)
+                for row in new.iter_rows(named=True)
+            )
+        return self._results
+
+    def metrics(self) -> list[ExpectationMetrics]:
+        """Every metrics record as a model, only building those not built before"""
+        if len(self._metrics) < self._rows:
+            new = self.frame.slice(len(self._metrics)).select(METRICS_FIELDS)
+            self._metrics.extend(
+                ExpectationMetrics.model_construct(**row)
+                for row in new.iter_rows(named=True)
+            )
+        return self._metrics
@@ -0,0 +1,108 @@
+import math
+import polars as pl
+from typing import Any, Self
+from pydantic import BaseModel, ConfigDict
+
+RANK_BITS = 64
+
+
+class HyperLogLog(BaseModel):
+    """HyperLogLog sketch estimating the number of distinct values in a column.
+
+    The sketch is `2**precision` one byte registers regardless of the number of
+    rows, with a relative standard error of `1.04 / sqrt(2**precision)`.
+    Sketches built from different partitions or runs of the same column can be
+    merged, the result is the sketch of the combined data.
+
+    Sketches are built from Polars hashes, which are only stable within a
+    Polars version, so only merge sketches built by the same version.
+
+    Example usage:
+    --------------
+    >>> sketch = HyperLogLog.from_series(members["Nino"])
+    >>> sketch.merge(HyperLogLog.from_series(new_members["Nino"])).estimate()
+    """
+
+    model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
+    precision: int = 14
+    registers: bytes = b""
+    rows: int = 0
+
+    def model_post_init(self, __context: Any):
+        if not self.registers:
+            self.registers = bytes(2**self.precision)
+
+    @staticmethod
+    def expr(column_name: str | list[str], precision: int = 14) -> pl.Expr:
+        """Aggregation computing the partial sketch of a column
+
+        Evaluates to a struct of the distinct `register * 64 + rank` codes and the
+        row count, small enough to be computed in a streaming select.
+        """
+        columns = [column_name] if isinstance(column_name, str) else column_name
+        hashed = pl.struct(columns).hash(seed=0)
+        register = hashed // pl.lit(2 ** (64 - precision), dtype=pl.UInt64)
+        remainder = hashed % pl.lit(2 ** (64 - precision), dtype=pl.UInt64)
+        rank = remainder.bitwise_leading_zeros() - precision + 1
+        return pl.struct(
+            codes=(register * RANK_BITS + rank).unique().implode(),
+            rows=pl.len(),
+        )
+
+    @classmethod
+    def from_partial(cls, partial: dict, precision: int = 14) -> Self:
+        """Build a sketch from the value of `HyperLogLog.expr`"""
+        registers = bytearray(2**precision)
+        for code in partial["codes"]:
+            register, rank = divmod(code, RANK_BITS)
+            registers[register] = max(registers[register], rank)
+        return cls(
+            precision=precision, registers=bytes(registers), rows=partial["rows"]
+        )
+
+    @classmethod
+    def from_series(cls, series: pl.Series, precision: int = 14) -> Self:
+        """Build a sketch of a Series"""
+        partial = series.to_frame().select(HyperLogLog.expr(series.name, precision))
+        return cls.from_partial(partial.item(), precision)
+
+    def merge(self, other: Self) -> Self:
+        """Sketch of the data seen by both sketches"""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches with different precision")
+        return type(self)(
+            precision=self.precision,
+            registers=bytes(map(max, self.registers, other.registers)),
+            rows=self.rows + other.rows,
+        )
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of `estimate`"""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def estimate(self) -> float:
+        """Estimated number of distinct values"""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0**-r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return estimate
+
+    def duplicate_rate(self, z: float = 3.0) -> tuple[float, float, float]:
+        """Estimated fraction of rows repeating an earlier value, with bounds
+
+        Returns (lower, estimate, upper), the bounds being `z` standard errors.
+        """
+        if not self.rows:
+            return 0.0, 0.0, 0.0
+        distinct = self.estimate()
+        spread = z * self.relative_error * distinct
+
+        def rate(distinct: float) -> float:
+            return min(max(1 - distinct / self.rows, 0.0), 1.0)
+
+        return rate(distinct + spread), rate(distinct), rate(distinct - spread)
@@ -0,0 +1,180 @@
+import inspect
+import json
+import polars as pl
+from pathlib import Path
+from typing import Any, Self, Sequence, TypeVar
+from pydantic import BaseModel, ConfigDict
+from . import expectations
+from .base import BaseValidator, project
+from .cache import ResultCache
+from .expectations import Expectation
+from .polars_validator import PolarsDataFrameValidator
+
+V = TypeVar("V", bound=BaseValidator)
+
+
+class ExpectationConfig(BaseModel):
+    """An expectation in a suite, the name of a validator `expect_*` method and
+    its arguments, eg `{"expectation": "expect_column_to_exist", "column_name": "Nino"}`
+    """
+
+    model_config = ConfigDict(extra="allow", frozen=True)
+
+    expectation: str
+
+    @property
+    def kwargs(self) -> dict[str, Any]:
+        return dict(self.model_extra)
+
+    def compile(self) -> list[Expectation]:
+        """Build the expectation, one per column if given a list of columns,
+        raising ValueError for unknown expectations or arguments that don't
+        match the `expect_*` method"""
+        name = self.expectation.removeprefix("expect_")
+        builder = getattr(expectations, name, None)
+        if getattr(BaseValidator, self.expectation, None) is None or builder is None:
+            raise ValueError(f"Unknown expectation '{self.expectation}'")
+        try:
+            arguments = inspect.signature(builder).bind(**self.kwargs).arguments
+            column_name = arguments.pop("column_name", None)
+            if isinstance(column_name, list):
+                return expectations.per_column(builder, column_name, **arguments)
+            return [builder(**self.kwargs)]
+        except (TypeError, ValueError) as err:
+            raise ValueError(
+                f"Invalid arguments for '{self.expectation}': {err}"
+            ) from err
+
+
+class ExpectationSuite(BaseModel):
+    """A reusable list of expectations, defined in Python or loaded from YAML or
+    JSON, compiled once then applied to any number of frames.
+
+    Example usage:
+    --------------
+    >>> suite = (
+    ...     ExpectationSuite(name="members")
+    ...     .add("expect_column_to_exist", "Member ID")
+    ...     .add("expect_column_to_contain_unique_values", "Member ID")
+    ...     .compile()
+    ... )
+    >>> for path in paths:
+    ...     suite.validate(pl.scan_parquet(path)).throw_error_if_invalid()
+
+    The same suite as YAML, loaded with `ExpectationSuite.from_yaml`:
+
+        name: members
+        expectations:
+          - expectation: expect_column_to_exist
+            column_name: Member ID
+          - expectation: expect_column_to_contain_unique_values
+            column_name: Member ID
+    """
+
+    name: str = ""
+    expectations: list[ExpectationConfig] = []
+
+    def add(self, expectation: str, *args, **kwargs) -> Self:
+        """Add an expectation, arguments as for the `expect_*` method"""
+        method = getattr(BaseValidator, expectation, None)
+        if method is None:
+            raise ValueError(f"Unknown expectation '{expectation}'")
+        try:
+            bound = inspect.signature(method).bind(None, *args, **kwargs)
+        except TypeError as err:
+            raise ValueError(f"Invalid arguments for '{expectation}': {err}") from err
+        arguments = dict(list(bound.arguments.items())[1:])
+        config = ExpectationConfig(expectation=expectation, **arguments)
+        config.compile()
+        self.expectations.append(config)
+        return self
+
+    @classmethod
+    def from_json(cls, source: str | Path) -> Self:
+        """Load a suite from a JSON file"""
+        return cls.model_validate(json.loads(Path(source).read_text()))
+
+    @classmethod
+    def from_yaml(cls, source: str | Path) -> Self:
+        """Load a suite from a YAML file, needs the optional `yaml` dependency"""
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError(
+                "Loading suites from YAML needs PyYAML, "
+                "install dataframe-validator[yaml]"
+            ) from None
+        return cls.model_validate(yaml.safe_load(Path(source).read_text()))
+
+    def compile(self) -> "CompiledSuite":
+        """Validate every expectation and build the plan to apply to frames"""
+        return CompiledSuite(
+            name=self.name,
+            expectations=tuple(
+                expectation
+                for config in self.expectations
+                for expectation in config.compile()
+            ),
+        )
+
+
+class CompiledSuite(BaseModel):
+    """Expectations of a suite built once, ready to be applied to frames"""
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str = ""
+    expectations: tuple[Expectation, ...] = ()
+
+    @property
+    def columns(self) -> list[str]:
+        """Names of the columns read by the suite's expectations"""
+        return list(
+            dict.fromkeys(
+                column
+                for expectation in self.expectations
+                for column in expectation.columns()
+            )
+        )
+
+    def project(
+        self, lf: pl.LazyFrame, key_columns: Sequence[str] = ()
+    ) -> pl.LazyFrame:
+        """Select only the key columns and those the suite reads, so a scan
+        decodes nothing else. Columns missing from the frame are skipped for
+        the suite to report."""
+        return project(lf, [*key_columns, *self.columns])
+
+    def apply(self, validator: V) -> V:
+        """Record the suite on a validator of any kind"""
+        return validator._record(*self.expectations)
+
+    def validate(
+        self,
+        df: pl.DataFrame | pl.LazyFrame | str | Path,
+        cache: ResultCache | None = None,
+        fingerprint: str | None = None,
+        max_failures: int | None = None,
+        **kwargs,
+    ) -> PolarsDataFrameValidator:
+        """Validate a frame, or a file scanned by its suffix, in a single pass,
+        reusing results stored in `cache` if given, see
+        `BaseValidator.with_cache`. Set `max_failures` to stop after that many
+        failures, evaluating the cheapest expectations first, see
+        `BaseValidator.with_fail_fast`. Other keyword arguments, eg
+        `key_columns`, are passed to `PolarsDataFrameValidator`"""
+        if isinstance(df, (str, Path)) and Path(df).suffix.lower() == ".parquet":
+            validator = PolarsDataFrameValidator.from_parquet(
+                df, deferred=True, **kwargs
+            )
+        else:
+            validator = PolarsDataFrameValidator(
+                expectations.scan_file(df) if isinstance(df, (str, Path)) else df,
+                deferred=True,
+                **kwargs,
+            )
+        if cache is not None:
+            validator.with_cache(cache, fingerprint)
+        if max_failures is not None:
+            validator.with_fail_fast(max_failures)
+        return self.apply(validator)
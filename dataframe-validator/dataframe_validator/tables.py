@@ -0,0 +1,152 @@
+import asyncio
+import glob
+import math
+import os
+import polars as pl
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Mapping
+from .polars_validator import PolarsDataFrameValidator
+from .suite import CompiledSuite
+
+Source = pl.DataFrame | pl.LazyFrame | str | Path
+
+
+def estimated_bytes(source: Source) -> int | None:
+    """Memory reserved for validating a table: the size of a DataFrame, the
+    size on disk of files, or None for a LazyFrame whose size is unknown"""
+    if isinstance(source, pl.DataFrame):
+        return source.estimated_size()
+    if isinstance(source, (str, Path)):
+        return sum(os.path.getsize(path) for path in glob.glob(str(source)))
+    return None
+
+
+class MemoryBudget:
+    """Bytes shared by tables validated at the same time. A table waits until
+    its estimate fits in what is left, unless no other table is running so a
+    table larger than the budget is still validated, on its own. A table of
+    unknown size, None, reserves the whole budget."""
+
+    def __init__(self, max_bytes: int | None = None):
+        self.max_bytes = max_bytes
+        self._reserved = 0
+        self._running = 0
+        self._changed = threading.Condition()
+
+    @contextmanager
+    def reserve(self, nbytes: int | None):
+        if nbytes is None:
+            nbytes = self.max_bytes or 0
+        with self._changed:
+            self._changed.wait_for(
+                lambda: (
+                    self.max_bytes is None
+                    or self._running == 0
+                    or self._reserved + nbytes <= self.max_bytes
+                )
+            )
+            self._reserved += nbytes
+            self._running += 1
+        try:
+            yield
+        finally:
+            with self._changed:
+                self._reserved -= nbytes
+                self._running -= 1
+                self._changed.notify_all()
+
+
+def _schedule(
+    tables: Mapping[str, tuple[Source, CompiledSuite]],
+    max_workers: int | None,
+    max_memory_bytes: int | None,
+    kwargs: dict,
+):
+    """The worker count, the names in the order to start them, largest first so
+    the slowest tables don't start last, and the function validating a table"""
+    sizes = {name: estimated_bytes(source) for name, (source, _) in tables.items()}
+    budget = MemoryBudget(max_memory_bytes)
+
+    def validate(name: str) -> PolarsDataFrameValidator:
+        source, suite = tables[name]
+        with budget.reserve(sizes[name]):
+            validator = suite.validate(source, **kwargs)
+            validator._resolve()
+        return validator
+
+    def largest_first(name: str) -> float:
+        return -math.inf if sizes[name] is None else -sizes[name]
+
+    workers = max_workers or min(len(tables), pl.thread_pool_size())
+    return max(workers, 1), sorted(tables, key=largest_first), validate
+
+
+def validate_tables(
+    tables: Mapping[str, tuple[Source, CompiledSuite]],
+    max_workers: int | None = None,
+    max_memory_bytes: int | None = None,
+    **kwargs,
+) -> dict[str, PolarsDataFrameValidator]:
+    """Validate many tables concurrently, each a frame or file with its suite,
+    returning the evaluated validators by table name.
+
+    Polars releases the GIL while it runs a query, so the tables are validated
+    on a pool of `max_workers` threads, by default one per Polars thread, all
+    sharing the Polars thread pool. `max_memory_bytes` bounds the summed
+    estimates, see `estimated_bytes`, of tables validated at the same time.
+    LazyFrames are of unknown size and are validated on their own under a
+    budget, pass file paths to validate files concurrently within it.
+
+    The `metrics` of each table measure CPU time and resident memory of the
+    whole process, so they include the work of tables running at the same
+    time. Validate a table on its own to measure it.
+    Other keyword arguments, eg `cache` or `max_failures`, are passed to
+    `CompiledSuite.validate`.
+
+    Example usage:
+    --------------
+    >>> validators = validate_tables(
+    ...     {
+    ...         "members": ("landing/members.parquet", members_suite),
+    ...         "payments": (pl.scan_csv("landing/payments.csv"), payments_suite),
+    ...     },
+    ...     max_memory_bytes=8 * 2**30,
+    ... )
+    >>> for name, validator in validators.items():
+    ...     validator.throw_error_if_invalid()
+    """
+    if not tables:
+        return {}
+    workers, order, validate = _schedule(tables, max_workers, max_memory_bytes, kwargs)
+    with ThreadPoolExecutor(workers, thread_name_prefix="validate") as pool:
+        futures = {name: pool.submit(validate, name) for name in order}
+        try:
+            return {name: futures[name].result() for name in tables}
+        except BaseException:
+            for future in futures.values():
+                future.cancel()
+            raise
+
+
+async def validate_tables_async(
+    tables: Mapping[str, tuple[Source, CompiledSuite]],
+    max_workers: int | None = None,
+    max_memory_bytes: int | None = None,
+    **kwargs,
+) -> dict[str, PolarsDataFrameValidator]:
+    """`validate_tables` without blocking the event loop"""
+    if not tables:
+        return {}
+    workers, order, validate = _schedule(tables, max_workers, max_memory_bytes, kwargs)
+    loop = asyncio.get_running_loop()
+    pool = ThreadPoolExecutor(workers, thread_name_prefix="validate")
+    try:
+        futures = {name: loop.run_in_executor(pool, validate, name) for name in order}
+        validators = await asyncio.gather(*futures.values())
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    by_name = dict(zip(futures, validators))
+    return {name: by_name[name] for name in tables}
@@ -0,0 +1,29 @@
+import polars as pl
+import pytest
+
+
+@pytest.fixture
+def keyed_frame() -> pl.DataFrame:
+    """Ids with duplicates and nulls, and statuses outside {"a", "b"}, spread
+    so that every batch or partition split has failures on both sides"""
+    return pl.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 5, 6, 7, 2, 9, None, None, 1],
+            "status": ["a", "a", "b", "c", "a", "a", "a", "a", "a", "a", "b", "a"],
+        }
+    )
+
+
+@pytest.fixture
+def expect_keys():
+    """Record the id and status expectations checked against `keyed_frame` by
+    validators that split it"""
+
+    def record(validator):
+        return (
+            validator.expect_column_to_exist("id")
+            .expect_column_to_contain_unique_values("id")
+            .expect_column_value_to_be_in_set("status", ["a", "b"])
+        )
+
+    return record
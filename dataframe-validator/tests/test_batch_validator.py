@@ -0,0 +1,78 @@
+import polars as pl
+from dataframe_validator import PolarsBatchValidator, PolarsDataFrameValidator
+from dataframe_validator.key_set import KeySet
+import pytest
+
+
+def batches(df: pl.DataFrame, size: int):
+    return lambda: df.iter_slices(size)
+
+
+@pytest.mark.parametrize("batch_size", [1, 5, 100])
+def test_batches_match_single_frame(batch_size, keyed_frame, expect_keys):
+    batched = expect_keys(PolarsBatchValidator(batches(keyed_frame, batch_size)))
+    expected = expect_keys(PolarsDataFrameValidator(keyed_frame))
+    assert batched.validation_results == expected.validation_results
+    assert batched.validation_fails.equals(expected.validation_fails)
+
+
+def test_all_batches_pass(keyed_frame, expect_keys):
+    df = keyed_frame.filter(pl.col("status") != "c").unique("id", keep="none")
+    validator = expect_keys(PolarsBatchValidator(batches(df, 2)))
+    assert validator.is_valid
+    assert validator.fail_indices == {}, "Expected no failing rows kept"
+
+
+def test_no_batches(expect_keys):
+    schema = {"id": pl.Int64, "status": pl.String}
+    validator = expect_keys(PolarsBatchValidator(lambda: iter([]), schema=schema))
+    fail_rows = [result.fail_rows for result in validator.validation_results]
+    assert fail_rows == [None, 0, 0], "Expected an empty source to pass"
+    assert validator.metrics[1].rows_scanned == 0
+    validator = PolarsBatchValidator(lambda: iter([])).expect_column_to_exist("id")
+    with pytest.raises(ValueError, match="pass `schema`"):
+        validator._resolve()
+
+
+def test_unique_values_across_batches_with_spill(tmp_path):
+    df = pl.DataFrame({"id": list(range(1000)) + [10, 500]})
+    validator = PolarsBatchValidator(
+        batches(df, 100), memory_budget=1000, spill_dir=tmp_path
+    ).expect_column_to_contain_unique_values("id")
+    assert validator.validation_results[0].fail_rows == 4
+    assert validator.fail_indices[0].to_list() == [10, 500, 1000, 1001]
+    assert list(tmp_path.iterdir()) == [], "Expected spilled keys to be removed"
+
+
+def test_max_fail_rows_across_batches():
+    df = pl.DataFrame({"id": [1] * 50})
+    validator = PolarsBatchValidator(
+        batches(df, 7), max_fail_rows=3
+    ).expect_column_to_contain_unique_values("id").expect_column_value_to_be_in_set("id", [2])
+    assert [result.fail_rows for result in validator.validation_results] == [50, 50]
+    assert validator.fail_indices[0].to_list() == [0, 1, 2]
+    assert validator.fail_indices[1].to_list() == [0, 1, 2]
+
+
+def test_from_csv_and_parquet(tmp_path, keyed_frame, expect_keys):
+    keyed_frame.write_csv(tmp_path / "data.csv")
+    keyed_frame.write_parquet(tmp_path / "data.parquet")
+    expected = expect_keys(PolarsDataFrameValidator(keyed_frame)).validation_results
+    for validator in (
+        PolarsBatchValidator.from_csv(tmp_path / "data.csv", batch_size=4),
+        PolarsBatchValidator.from_parquet(tmp_path / "data.parquet", batch_size=4),
+    ):
+        assert expect_keys(validator).validation_results == expected
+
+
+def test_key_set_spills_partitions(tmp_path):
+    key_set = KeySet(["id"], memory_budget=500, partitions=4, spill_dir=tmp_path)
+    for offset in range(0, 400, 100):
+        key_set.add(
+            pl.DataFrame({"id": [i % 300 for i in range(offset, offset + 100)]})
+            .with_row_index("__row_index", offset=offset)
+        )
+    assert any(tmp_path.iterdir()), "Expected keys to be spilled to disk"
+    duplicates = pl.concat(key_set.duplicates())
+    assert len(duplicates) == 200, "Expected 200 duplicated rows"
+    assert sorted(duplicates["id"].unique().to_list()) == list(range(100))
@@ -0,0 +1,70 @@
+import polars as pl
+from dataframe_validator import PolarsDataFrameValidator, ValidatorDataFrame
+import pytest
+
+SCHEMA = {"a": pl.Int64, "b": pl.Int64, "c": pl.String}
+
+
+def test_deferred_records_without_evaluating():
+    df = pl.DataFrame({"a": [1, 2, 2], "b": [4, 5, 6]})
+    validator = (
+        PolarsDataFrameValidator(df, deferred=True)
+        .expect_column_to_exist("a")
+        .expect_column_to_contain_unique_values("a")
+        .expect_column_value_greater_than("b", 4)
+    )
+    assert len(validator._pending) == 3, "Expected 3 pending expectations"
+    assert validator._passes == 0, "Expected nothing evaluated while recording"
+    assert not validator.is_valid
+    assert len(validator._pending) == 0, "Expected pending expectations to be resolved"
+    assert validator._passes == 1, "Expected a single pass over the frame"
+
+
+@pytest.mark.parametrize(
+    "data, fail_rows",
+    [
+        (
+            {"a": [1, 2, 2], "b": [4, 5, 6], "c": ["x", "y", "z"]},
+            [None, None, 2, 1, 1, 0],
+        ),
+        ({"a": [1, 2], "b": [5, 6], "c": ["x", "y"]}, [None, None, 0, 0, 0, 0]),
+        (
+            {"a": [None, None], "b": [None, 5], "c": [None, "x"]},
+            [None, None, 2, 0, 0, 0],
+        ),
+        ({"a": [], "b": [], "c": []}, [None, None, 0, 0, 0, 0]),
+    ],
+    ids=["fails", "passes", "nulls", "empty"],
+)
+def test_deferred_matches_eager(data, fail_rows):
+    df = pl.DataFrame(data, schema=SCHEMA)
+    eager, deferred = (
+        PolarsDataFrameValidator(df, deferred=is_deferred)
+        .expect_column_to_exist("a")
+        .expect_column_to_exist("d")
+        .expect_column_to_contain_unique_values("a")
+        .expect_column_value_greater_than("b", 4)
+        .expect_column_value_to_be_in_set("c", ["x", "y"])
+        .expect_column_value_length_greater_than("c", 0)
+        for is_deferred in [False, True]
+    )
+    assert deferred.validation_results == eager.validation_results
+    assert deferred.validation_fails.equals(eager.validation_fails)
+    assert [result.fail_rows for result in deferred.validation_results] == fail_rows
+
+
+def test_deferred_resolves_new_expectations():
+    validator = PolarsDataFrameValidator(pl.DataFrame({"a": [1, 1]}), deferred=True)
+    validator.expect_column_to_exist("a")
+    assert validator.is_valid
+    validator.expect_column_to_contain_unique_values("a")
+    assert not validator.is_valid
+    assert len(validator.validation_results) == 2, "Expected 2 validation results"
+
+
+def test_validator_frame_deferred_column_a_greater_than_column_b():
+    df = ValidatorDataFrame({"a": [2, 2, 3], "b": [1, 2, 4]}, deferred=True)
+    df.expect_column_a_greater_than_column_b("a", "b")
+    assert df.validation_results[0].fail_rows == 2, "Expected 2 failing rows"
+    assert not df.is_valid
+    assert len(df.validation_fails) == 2, "Expected 2 validation failure rows"
@@ -0,0 +1,36 @@
+import polars as pl
+import pytest
+from dataframe_validator import ExpectationSuite
+from dataframe_validator.polars_validator import PolarsDataFrameValidator
+
+DF = pl.DataFrame(
+    {"a": [1, 2], "b": ["x", "y"], "c": [1.5, 2.5]},
+    schema_overrides={"a": pl.Int32},
+).with_columns(ts=pl.lit(0).cast(pl.Datetime("ms", "UTC")))
+
+
+def test_expect_column_to_be_of_type_pass():
+    validator = (
+        PolarsDataFrameValidator(DF)
+        .expect_column_to_be_of_type("a", pl.Int32)
+        .expect_column_to_be_of_type("b", str)
+        .expect_column_to_be_of_type("c", "Float64")
+        .expect_column_to_be_of_type("ts", pl.Datetime)
+    )
+    assert validator.is_valid, "Expected every column to have its type"
+
+
+def test_expect_column_to_be_of_type_fail():
+    validator = (
+        PolarsDataFrameValidator(DF)
+        .expect_column_to_be_of_type(["a", "c"], pl.Int64)
+        .expect_column_to_be_of_type("ts", pl.Datetime("us"))
+        .expect_column_to_be_of_type("missing", int)
+    )
+    assert [r.result for r in validator.validation_results] == [False] * 4
+    assert validator.validation_results[0].expectation_args == "column_type=Int64"
+
+
+def test_expect_column_to_be_of_type_unknown():
+    with pytest.raises(ValueError):
+        ExpectationSuite().add("expect_column_to_be_of_type", "a", "Int65")
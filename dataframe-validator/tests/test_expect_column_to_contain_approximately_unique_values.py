@@ -0,0 +1,61 @@
+import polars as pl
+from dataframe_validator import PolarsBatchValidator, PolarsDataFrameValidator
+from dataframe_validator.sketches import HyperLogLog
+import pytest
+
+
+@pytest.mark.parametrize(
+    "values,max_duplicate_rate,result",
+    [
+        (list(range(100_000)), 0.0, True),
+        (list(range(50_000)) * 2, 0.0, False),
+        (list(range(50_000)) * 2, 0.6, True),
+        (list(range(90_000)) + list(range(10_000)), 0.05, False),
+    ],
+)
+def test_expect_column_to_contain_approximately_unique_values(
+    values, max_duplicate_rate, result
+):
+    validator = PolarsDataFrameValidator(
+        pl.DataFrame({"a": values})
+    ).expect_column_to_contain_approximately_unique_values("a", max_duplicate_rate)
+    assert validator.validation_results[0].result is result
+
+
+def test_estimated_duplicate_rate():
+    validator = PolarsDataFrameValidator(
+        pl.LazyFrame({"a": list(range(50_000)) * 2})
+    ).expect_column_to_contain_approximately_unique_values("a")
+    sketch = validator.observed[0]
+    lower, rate, upper = sketch.duplicate_rate()
+    assert lower <= 0.5 <= upper
+    assert validator.validation_results[0].fail_rows == pytest.approx(50_000, rel=0.03)
+    assert len(sketch.registers) == 2**14, "Expected a fixed size sketch"
+
+
+def test_sketches_merge_across_batches():
+    df = pl.DataFrame({"a": list(range(20_000)) * 3})
+    validator = PolarsBatchValidator(
+        lambda: df.iter_slices(7_000)
+    ).expect_column_to_contain_approximately_unique_values("a", precision=12)
+    sketch = validator.observed[0]
+    assert sketch.rows == 60_000
+    assert sketch.estimate() == pytest.approx(20_000, rel=0.05)
+    assert sketch == HyperLogLog.from_series(df["a"], precision=12)
+
+
+def test_merge_sketches():
+    first = HyperLogLog.from_series(pl.Series("a", range(0, 30_000)))
+    second = HyperLogLog.from_series(pl.Series("a", range(20_000, 50_000)))
+    merged = first.merge(second)
+    assert merged.rows == 60_000
+    assert merged.estimate() == pytest.approx(50_000, rel=0.03)
+    assert HyperLogLog.model_validate_json(merged.model_dump_json()) == merged
+
+
+def test_no_batches():
+    validator = PolarsBatchValidator(
+        lambda: iter([]), schema={"a": pl.Int64}
+    ).expect_column_to_contain_approximately_unique_values("a")
+    assert validator.is_valid, "Expected no rows to be unique"
+    assert validator.observed[0].rows == 0
@@ -0,0 +1,27 @@
+from datetime import date
+import polars as pl
+from dataframe_validator.polars_validator import PolarsDataFrameValidator
+
+
+def test_expect_column_value_to_be_between_pass():
+    df = pl.DataFrame({"a": [0, 5, 10, None]})
+    validator = PolarsDataFrameValidator(df)
+    validator.expect_column_value_to_be_between("a", 0, 10)
+    assert validator.is_valid, "Expected bounds to be inclusive and nulls to pass"
+
+
+def test_expect_column_value_to_be_between_fail_dates():
+    df = pl.DataFrame({"d": [date(1899, 12, 31), date(2000, 1, 1), date(2030, 1, 1)]})
+    validator = PolarsDataFrameValidator(df)
+    validator.expect_column_value_to_be_between("d", date(1900, 1, 1), date(2025, 1, 1))
+    assert not validator.is_valid, "Expected dates outside the range to fail"
+    assert validator.fail_indices[0].to_list() == [0, 2]
+
+
+def test_expect_column_value_to_be_between_many_columns():
+    df = pl.DataFrame({f"amount_{i}": [0.0, 1e9 * (i % 2) + i] for i in range(25)})
+    validator = PolarsDataFrameValidator(df)
+    validator.expect_column_value_to_be_between(list(df.columns), 0, 1e9)
+    assert [r.fail_rows for r in validator.validation_results] == [
+        i % 2 for i in range(25)
+    ], "Expected odd columns to exceed 1e9"
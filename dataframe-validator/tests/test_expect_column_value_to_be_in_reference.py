@@ -0,0 +1,82 @@
+import polars as pl
+import pytest
+from dataframe_validator import (
+    ExpectationSuite,
+    PolarsBatchValidator,
+    PolarsDataFrameValidator,
+    PolarsPartitionedValidator,
+    ResultCache,
+)
+
+SCHEMES = pl.DataFrame({"id": [1, 2, 3], "section": ["A", "A", "B"]})
+MEMBERS = pl.DataFrame(
+    {
+        "Scheme ID": [1, 4, 2, 4, None, 5],
+        "Section": ["A", "A", "B", "A", "A", "C"],
+    }
+)
+
+
+@pytest.mark.parametrize("reference", [SCHEMES, SCHEMES.lazy(), "parquet"])
+def test_orphaned_keys(reference, tmp_path):
+    if isinstance(reference, str):
+        reference = tmp_path / "schemes.parquet"
+        SCHEMES.write_parquet(reference)
+    validator = PolarsDataFrameValidator(
+        MEMBERS.lazy()
+    ).expect_column_value_to_be_in_reference("Scheme ID", reference, "id")
+    result = validator.validation_results[0]
+    assert not result.result, "Expected schemes 4 and 5 to be missing"
+    assert result.fail_rows == 3, "Expected null keys to be skipped"
+    assert validator.orphaned_keys(0).rows() == [(4, 2, [1, 3]), (5, 1, [5])]
+
+
+def test_composite_reference_key():
+    validator = PolarsDataFrameValidator(
+        MEMBERS
+    ).expect_column_value_to_be_in_reference(
+        ["Scheme ID", "Section"], SCHEMES, ["id", "section"]
+    )
+    assert validator.fail_indices[0].to_list() == [1, 2, 3, 5]
+    assert validator.orphaned_keys(0).columns == [
+        "Scheme ID",
+        "Section",
+        "count",
+        "__row_index",
+    ]
+    with pytest.raises(ValueError, match="as many reference columns"):
+        PolarsDataFrameValidator(MEMBERS).expect_column_value_to_be_in_reference(
+            ["Scheme ID", "Section"], SCHEMES, "id"
+        )
+
+
+def test_reference_batches_and_partitions(tmp_path):
+    batched = PolarsBatchValidator(
+        lambda: MEMBERS.iter_slices(2)
+    ).expect_column_value_to_be_in_reference("Scheme ID", SCHEMES.lazy(), "id")
+    assert batched.fail_indices[0].to_list() == [1, 3, 5]
+    assert batched.orphaned_keys(0)["count"].to_list() == [2, 1]
+    for i, part in enumerate(MEMBERS.iter_slices(3)):
+        part.write_parquet(tmp_path / f"part-{i}.parquet")
+    partitioned = PolarsPartitionedValidator(
+        tmp_path / "*.parquet"
+    ).expect_column_value_to_be_in_reference("Scheme ID", SCHEMES, "id")
+    assert partitioned.validation_results[0].fail_rows == 3
+
+
+def test_reference_content_in_cache_key(tmp_path):
+    cache = ResultCache(tmp_path)
+    suite = ExpectationSuite().add(
+        "expect_column_value_to_be_in_reference", "Scheme ID", SCHEMES, "id"
+    )
+    first = suite.compile().validate(MEMBERS, cache=cache)
+    assert first.validation_results[0].fail_rows == 3
+    more_schemes = pl.concat([SCHEMES, pl.DataFrame({"id": [4], "section": ["A"]})])
+    second = (
+        ExpectationSuite()
+        .add("expect_column_value_to_be_in_reference", "Scheme ID", more_schemes, "id")
+        .compile()
+        .validate(MEMBERS, cache=cache)
+    )
+    assert not second.metrics[0].cache_hit, "Expected a changed reference to miss"
+    assert second.validation_results[0].fail_rows == 1
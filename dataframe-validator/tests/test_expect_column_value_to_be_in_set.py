@@ -1,4 +1,6 @@
 import polars as pl
+import pytest
+from dataframe_validator import ExpectationSuite, ResultCache
 from dataframe_validator.polars_validator import PolarsDataFrameValidator
 
 
@@ -44,3 +46,70 @@ def test_expect_column_value_to_be_in_set_fail_many():
     )
     assert len(validator.validation_results) == 1, "Expected 1 validation results"
     assert len(validator.validation_fails) == 3, "Expected 3 validation failure"
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["Active", "Retired", "Active"],
+        frozenset({"Active", "Retired"}),
+        pl.Series(["Active", "Retired"]),
+    ],
+)
+@pytest.mark.parametrize(
+    "dtype", [pl.String, pl.Categorical, pl.Enum(["Active", "Deferred", "Retired"])]
+)
+def test_expect_column_value_to_be_in_set_value_set(values, dtype):
+    df = pl.DataFrame(
+        {"status": ["Active", "Deferred", None, "Retired"]},
+        schema={"status": dtype},
+    )
+    validator = PolarsDataFrameValidator(df)
+    validator.expect_column_value_to_be_in_set("status", values)
+    assert validator.fail_indices[0].to_list() == [1], (
+        "Expected only 'Deferred' to fail, nulls pass"
+    )
+
+
+def test_expect_column_value_to_be_in_set_built_once_per_suite():
+    suite = (
+        ExpectationSuite()
+        .add("expect_column_value_to_be_in_set", "b", {4, 5})
+        .compile()
+    )
+    fail_expr = suite.expectations[0].fail_expr
+    for values in ([4, 5], [6, 7]):
+        validator = suite.validate(pl.DataFrame({"b": values}))
+        assert len(validator.validation_results) == 1
+        assert validator._expectations[0].fail_expr is fail_expr, (
+            "Expected the compiled value set to be reused"
+        )
+    assert validator.validation_results[0].fail_rows == 2
+    assert validator.validation_results[0].expectation_args == "values=[4, 5]"
+
+
+def test_expect_column_value_to_be_in_set_with_null_member():
+    df = pl.DataFrame({"status": ["Active", "Deferred", None, "Retired"]})
+    validator = PolarsDataFrameValidator(df)
+    validator.expect_column_value_to_be_in_set("status", {None, "Retired", "Active"})
+    assert validator.fail_indices[0].to_list() == [1]
+    assert validator.validation_results[0].expectation_args == (
+        "values=['Active', 'Retired', None]"
+    )
+
+
+def test_expect_column_value_to_be_in_set_large_set_args(tmp_path):
+    cache = ResultCache(tmp_path)
+    df = pl.DataFrame({"code": [0, 11, 12]})
+    validators = [
+        PolarsDataFrameValidator(df)
+        .with_cache(cache)
+        .expect_column_value_to_be_in_set("code", [*range(10), *last])
+        for last in ([10, 11], [11, 12])
+    ]
+    assert validators[0].validation_results[0].expectation_args == (
+        f"values_preview={list(range(10))}, value_count=12"
+    )
+    assert [v.validation_results[0].fail_rows for v in validators] == [1, 0], (
+        "Expected value sets with the same preview cached apart"
+    )
@@ -0,0 +1,64 @@
+import polars as pl
+import pytest
+from dataframe_validator import DataValidationError, ExpectationSuite
+from dataframe_validator.polars_validator import PolarsDataFrameValidator
+
+NINO = r"^[A-CEGHJ-PR-TW-Z]{2}\d{6}[A-D]$"
+
+
+def test_expect_column_value_to_match_regex_pass():
+    df = pl.DataFrame({"nino": ["AB123456C", "WX572792D", None]})
+    validator = PolarsDataFrameValidator(df)
+    validator.expect_column_value_to_match_regex("nino", NINO)
+    assert validator.is_valid, "Expected all values in column 'nino' to match"
+    assert len(validator.validation_fails) == 0, "Expected 0 validation failure"
+
+
+def test_expect_column_value_to_match_regex_fail():
+    df = pl.DataFrame({"nino": ["AB123456C", "ABC123", "ab123456c"]})
+    validator = PolarsDataFrameValidator(df)
+    validator.expect_column_value_to_match_regex("nino", NINO)
+    assert not validator.is_valid, "Expected 'ABC123' and 'ab123456c' not to match"
+    assert validator.validation_results[0].fail_rows == 2
+    assert validator.fail_indices[0].to_list() == [1, 2]
+
+
+def test_expect_column_value_to_match_regex_many_columns():
+    df = pl.DataFrame({f"id_{i}": [f"X{i}", "X1"] for i in range(40)})
+    columns = [f"id_{i}" for i in range(40)]
+    validator = PolarsDataFrameValidator(df, deferred=True)
+    validator.expect_column_value_to_match_regex(columns, r"^X\d$")
+    assert len(validator.validation_results) == 40, "Expected a result per column"
+    assert [r.column_name for r in validator.validation_results if not r.result] == [
+        f"id_{i}" for i in range(10, 40)
+    ]
+    assert {m.pass_id for m in validator.metrics} == {1}, "Expected a single pass"
+
+    suite = ExpectationSuite.model_validate(
+        {
+            "expectations": [
+                {
+                    "expectation": "expect_column_value_to_match_regex",
+                    "column_name": columns,
+                    "pattern": r"^X\d$",
+                }
+            ]
+        }
+    ).compile()
+    assert suite.validate(df).validation_results == validator.validation_results
+
+
+def test_expect_column_value_to_match_regex_not_string():
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    with pytest.raises(DataValidationError):
+        PolarsDataFrameValidator(df).expect_column_value_to_match_regex("a", r"\d")
+
+
+def test_expect_column_value_to_match_regex_missing_column():
+    df = pl.DataFrame({"nino": ["AB123456C"]})
+    with pytest.raises(pl.exceptions.ColumnNotFoundError, match="missing"):
+        PolarsDataFrameValidator(df).expect_column_value_to_match_regex("missing", NINO)
+    with pytest.raises(pl.exceptions.ColumnNotFoundError):
+        PolarsDataFrameValidator(df.lazy()).expect_column_value_length_greater_than(
+            "missing", 1
+        )
@@ -0,0 +1,75 @@
+import polars as pl
+import pytest
+from datetime import date
+from dataframe_validator import (
+    ExpectationSuite,
+    PolarsBatchValidator,
+    PolarsDataFrameValidator,
+    PolarsPartitionedValidator,
+    ValidationHistory,
+)
+
+KEY = ["Scheme ID", "Member ID", "Effective Date"]
+DATA = {
+    "Scheme ID": [1, 1, 1, 2, 1, 1],
+    "Member ID": [10, 10, 11, 10, 10, 11],
+    "Effective Date": [date(2024, 1, 1)] * 5 + [date(2024, 2, 1)],
+    "Status": ["Active", "Retired", "Active", "Active", "Deferred", "Active"],
+}
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_compound_key_duplicates(lazy):
+    df = pl.DataFrame(DATA)
+    validator = PolarsDataFrameValidator(
+        df.lazy() if lazy else df
+    ).expect_compound_columns_to_be_unique(KEY)
+    result = validator.validation_results[0]
+    assert not result.result, "Expected duplicate keys"
+    assert result.fail_rows == 3
+    assert result.column_name == "Scheme ID, Member ID, Effective Date"
+    groups = validator.duplicate_groups(0)
+    assert groups.columns == [*KEY, "count", "__row_index"]
+    assert groups.rows() == [(1, 10, date(2024, 1, 1), 3, [0, 1, 4])]
+
+
+def test_compound_key_unique():
+    validator = PolarsDataFrameValidator(
+        pl.DataFrame(DATA)
+    ).expect_compound_columns_to_be_unique(["Member ID", "Status"])
+    assert not validator.is_valid, "Expected (10, Active) to be duplicated"
+    validator = PolarsDataFrameValidator(
+        pl.DataFrame(DATA).slice(2)
+    ).expect_compound_columns_to_be_unique(KEY)
+    assert validator.is_valid
+    assert validator.duplicate_groups(0).is_empty()
+
+
+def test_compound_key_batches_within_memory_budget(tmp_path):
+    df = pl.DataFrame(DATA)
+    validator = PolarsBatchValidator(
+        lambda: df.iter_slices(2), memory_budget=1, spill_dir=tmp_path
+    ).expect_compound_columns_to_be_unique(KEY)
+    assert validator.validation_results[0].fail_rows == 3
+    assert validator.duplicate_groups(0)["count"].to_list() == [3]
+
+
+def test_compound_key_partitioned_and_history(tmp_path):
+    for i, part in enumerate(pl.DataFrame(DATA).iter_slices(3)):
+        part.write_parquet(tmp_path / f"part-{i}.parquet")
+    suite = (
+        ExpectationSuite()
+        .add("expect_compound_columns_to_be_unique", KEY)
+        .add("expect_column_to_contain_unique_values", "Status")
+    )
+    validator = suite.compile().apply(
+        PolarsPartitionedValidator(tmp_path / "*.parquet", max_workers=2)
+    )
+    assert validator.validation_results[0].fail_rows == 3
+    history = ValidationHistory(tmp_path / "history")
+    first = PolarsDataFrameValidator(pl.DataFrame(DATA).slice(0, 1))
+    first.with_history(history).expect_compound_columns_to_be_unique(KEY)
+    history.commit()
+    second = PolarsDataFrameValidator(pl.DataFrame(DATA).slice(3))
+    second.with_history(history).expect_compound_columns_to_be_unique(KEY)
+    assert second.validation_results[0].fail_rows == 1, "Expected key in history"
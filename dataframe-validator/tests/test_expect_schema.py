@@ -0,0 +1,77 @@
+import polars as pl
+from datetime import datetime
+from dataframe_validator import (
+    ExpectationSuite,
+    PolarsBatchValidator,
+    PolarsDataFrameValidator,
+    ResultCache,
+    SchemaDiff,
+)
+
+DATA = {
+    "a": [1, None, 3],
+    "b": ["x", "y", None],
+    "t": [datetime(2024, 1, 1)] * 3,
+}
+
+
+def test_expect_columns_to_exist_wide_frame():
+    df = pl.DataFrame({f"feature_{i}": [i] for i in range(5000)})
+    columns = [f"feature_{i}" for i in range(5001)]
+    validator = PolarsDataFrameValidator(df).expect_columns_to_exist(columns)
+    assert len(validator.validation_results) == 1, "Expected one result block"
+    assert validator.validation_results[0].fail_rows == 1
+    assert validator.observed[0].missing == ["feature_5000"]
+
+
+def test_expect_schema_pass():
+    validator = PolarsDataFrameValidator(pl.DataFrame(DATA)).expect_schema(
+        {"a": pl.Int64, "b": "String", "t": pl.Datetime},
+        strict_order=True,
+        allow_extra_columns=False,
+    )
+    assert validator.is_valid, "Expected the schema to match"
+    assert validator.validation_results[0].fail_rows == 0
+
+
+def test_expect_schema_fail():
+    validator = PolarsDataFrameValidator(pl.DataFrame(DATA).lazy()).expect_schema(
+        {"b": str, "a": pl.Int32, "q": None},
+        strict_order=True,
+        allow_extra_columns=False,
+        not_null=["a", "q"],
+    )
+    assert not validator.is_valid
+    assert validator.observed[0] == SchemaDiff(
+        missing=["q"],
+        unexpected=["t"],
+        mismatched_types={"a": "Int64"},
+        out_of_order=True,
+        null_counts={"a": 1},
+    )
+    assert validator.validation_results[0].fail_rows == 4
+
+
+def test_expect_schema_not_null_across_batches():
+    df = pl.DataFrame(DATA)
+    validator = PolarsBatchValidator(
+        lambda: df.iter_slices(1), key_columns=[]
+    ).expect_schema({"a": int, "b": str}, not_null=True)
+    assert validator.observed[0].null_counts == {"a": 1, "b": 1}
+    assert validator.projection == ["a", "b"], "Expected only schema columns read"
+
+
+def test_schema_expectations_in_suite_and_cache(tmp_path):
+    suite = (
+        ExpectationSuite()
+        .add("expect_columns_to_exist", ["a", "b", "c"])
+        .add("expect_schema", {"t": "Datetime"}, not_null=["t"])
+        .compile()
+    )
+    cache = ResultCache(tmp_path)
+    first = suite.validate(pl.DataFrame(DATA), cache=cache)
+    assert not first.is_valid
+    second = suite.validate(pl.DataFrame(DATA), cache=cache)
+    assert all(m.cache_hit for m in second.metrics), "Expected results from cache"
+    assert second.observed == first.observed
+    assert [r.result for r in second.validation_results] == [False, True]
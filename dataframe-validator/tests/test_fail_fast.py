@@ -0,0 +1,123 @@
+import polars as pl
+import pytest
+from dataframe_validator import (
+    DataValidationError,
+    ExpectationSuite,
+    PolarsBatchValidator,
+    PolarsDataFrameValidator,
+)
+
+
+def test_fail_fast_orders_by_cost():
+    validator = (
+        PolarsDataFrameValidator(
+            pl.LazyFrame({"id": [1, 2, 2], "status": ["a", "b", "c"]})
+        )
+        .with_fail_fast()
+        .expect_column_to_contain_unique_values("id")
+        .expect_column_value_to_be_in_set("status", ["a", "b"])
+        .expect_column_to_contain_approximately_unique_values("status")
+        .expect_column_to_exist("id")
+        .expect_column_value_greater_than("id", 0)
+    )
+    results = validator.results
+    assert results["position"].to_list() == [0, 1, 2, 3, 4], (
+        "Expected results in the order recorded"
+    )
+    assert results["pass_id"].to_list() == [None, 2, None, 1, 2], (
+        "Expected schema checks, then row predicates, then stop"
+    )
+    assert validator.skipped == [0, 2]
+    assert validator.validation_results[0].result is None
+    assert len(validator.metrics) == 5
+    with pytest.raises(
+        DataValidationError, match="failed for 1 expectations, 2 skipped"
+    ):
+        validator.throw_error_if_invalid()
+
+
+def test_failed_schema_check_skips_scans():
+    validator = (
+        PolarsDataFrameValidator(pl.LazyFrame({"id": [1, 1]}))
+        .with_fail_fast()
+        .expect_column_to_contain_unique_values("id")
+        .expect_column_to_exist("missing")
+    )
+    assert validator.skipped == [0]
+    assert sum(m.rows_scanned for m in validator.metrics) == 0, "Expected no scan"
+
+
+def test_fail_fast_threshold():
+    validator = (
+        PolarsDataFrameValidator(pl.LazyFrame({"id": [1, 1], "status": ["a", "c"]}))
+        .with_fail_fast(max_failures=2)
+        .expect_column_to_contain_unique_values("id")
+        .expect_column_value_to_be_in_set("status", ["a"])
+    )
+    assert validator.skipped == [], "Expected every tier evaluated below 2 failures"
+    assert (~validator.results["result"]).sum() == 2
+    with pytest.raises(ValueError):
+        PolarsDataFrameValidator(pl.LazyFrame({"id": [1]})).with_fail_fast(0)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [{"a": [1, 2], "b": ["w", "x"]}, {"a": [], "b": []}],
+    ids=["passes", "empty"],
+)
+def test_fail_fast_without_failures(data):
+    validator = (
+        PolarsDataFrameValidator(
+            pl.LazyFrame(data, schema={"a": pl.Int64, "b": pl.String})
+        )
+        .with_fail_fast()
+        .expect_column_to_contain_unique_values("a")
+        .expect_column_value_to_be_in_set("b", ["w", "x"])
+        .expect_column_to_exist("a")
+    )
+    assert validator.is_valid
+    assert validator.skipped == [], "Expected nothing skipped"
+
+
+def test_fail_fast_eager_and_batched(capsys):
+    eager = (
+        PolarsDataFrameValidator(pl.DataFrame({"id": [1, 1], "status": ["c", "a"]}))
+        .with_fail_fast()
+        .expect_column_value_to_be_in_set("status", ["a"])
+        .expect_column_to_exist("id")
+        .expect_column_to_contain_unique_values("id")
+    )
+    assert eager.deferred, "Expected fail fast to defer evaluation"
+    assert eager.results["pass_id"].to_list() == [2, 1, None], (
+        "Expected the schema check evaluated first"
+    )
+    assert eager.skipped == [2], "Expected uniqueness skipped after a failure"
+    collected = []
+    df = pl.DataFrame({"id": [1, 2, 2, 3], "status": ["a", "a", "b", "c"]})
+    batched = (
+        PolarsBatchValidator(lambda: df.iter_slices(2))
+        .with_fail_fast()
+        .add_metrics_hook(collected.append)
+        .expect_column_to_contain_unique_values("id")
+        .expect_column_value_to_be_in_set("status", ["a", "b"])
+        .expect_column_to_exist("id")
+    )
+    assert batched.skipped == [0]
+    assert [m.position for m in collected] == [1, 2], (
+        "Expected hooks only for evaluated expectations"
+    )
+    batched.show_results()
+    assert "⏭️" in capsys.readouterr().out
+
+
+def test_suite_max_failures():
+    suite = (
+        ExpectationSuite()
+        .add("expect_column_to_contain_unique_values", "id")
+        .add("expect_column_value_to_be_in_set", "status", ["a"])
+        .add("expect_column_to_exist", "id")
+        .compile()
+    )
+    df = pl.DataFrame({"id": [1, 1], "status": ["a", "c"]})
+    assert suite.validate(df, max_failures=1).skipped == [0]
+    assert suite.validate(df).skipped == []
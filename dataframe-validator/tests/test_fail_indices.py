@@ -0,0 +1,65 @@
+import polars as pl
+from dataframe_validator import PolarsDataFrameValidator
+import pytest
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+def test_fail_indices(lazy):
+    frame = pl.DataFrame({"id": [3, 1, 1, None], "status": ["a", None, "c", "c"]})
+    validator = (
+        PolarsDataFrameValidator(frame.lazy() if lazy else frame)
+        .expect_column_to_exist("id")
+        .expect_column_to_contain_unique_values("id")
+        .expect_column_value_to_be_in_set("status", ["a", "b"])
+        .expect_column_value_greater_than("id", 0)
+    )
+    assert list(validator.fail_indices) == [1, 2], (
+        "Expected failures for 2 expectations"
+    )
+    assert validator.fail_indices[1].to_list() == [1, 2]
+    assert validator.fail_indices[2].to_list() == [2, 3], "Expected nulls to pass"
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        pl.DataFrame({"id": [1, 2]}),
+        pl.DataFrame({"id": []}, schema={"id": pl.Int64}),
+    ],
+    ids=["passes", "empty"],
+)
+def test_no_fail_indices(frame):
+    validator = (
+        PolarsDataFrameValidator(frame)
+        .expect_column_to_contain_unique_values("id")
+        .expect_column_value_greater_than("id", 0)
+    )
+    assert validator.fail_indices == {}, "Expected no failing rows kept"
+    assert validator.validation_fails.is_empty()
+
+
+def test_validation_fails_gathered_from_indices():
+    validator = (
+        PolarsDataFrameValidator(
+            pl.LazyFrame({"id": [1, 2, 2], "status": ["a", "c", "a"]})
+        )
+        .expect_column_to_contain_unique_values("id")
+        .expect_column_value_to_be_in_set("status", ["a"])
+    )
+    fails = validator.validation_fails
+    assert fails.columns == ["expectation_name", "expectation_args", "id", "status"]
+    assert fails["expectation_name"].to_list() == [
+        "expect_column_to_contain_unique_values",
+        "expect_column_to_contain_unique_values",
+        "expect_column_value_to_be_in_set",
+    ]
+    assert fails["status"].to_list() == ["c", "a", "c"]
+    assert validator.validation_fails is fails, "Expected failing rows to be cached"
+
+
+def test_validation_fails_refreshed_after_new_failures():
+    validator = PolarsDataFrameValidator(pl.DataFrame({"id": [1, 1, 2]}))
+    validator.expect_column_to_contain_unique_values("id")
+    assert len(validator.validation_fails) == 2, "Expected 2 validation failure rows"
+    validator.expect_column_value_greater_than("id", 1)
+    assert len(validator.validation_fails) == 4, "Expected 4 validation failure rows"
@@ -0,0 +1,73 @@
+import polars as pl
+from dataframe_validator import PolarsDataFrameValidator, ValidatorDataFrame
+import pytest
+
+DATA = {"a": list(range(100)), "b": [1] * 100}
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame(DATA), pl.LazyFrame(DATA)])
+def test_max_fail_rows_keeps_exact_counts(frame):
+    validator = (
+        PolarsDataFrameValidator(frame, max_fail_rows=5)
+        .expect_column_value_greater_than("a", 49)
+        .expect_column_to_contain_unique_values("b")
+    )
+    assert [result.fail_rows for result in validator.validation_results] == [50, 100]
+    assert validator.fail_indices[0].to_list() == [0, 1, 2, 3, 4]
+    assert len(validator.validation_fails) == 10, "Expected 10 validation failure rows"
+
+
+def test_max_total_fail_rows():
+    validator = (
+        PolarsDataFrameValidator(pl.DataFrame(DATA), max_fail_rows=5, max_total_fail_rows=8)
+        .expect_column_value_greater_than("a", 49)
+        .expect_column_to_contain_unique_values("b")
+        .expect_column_value_to_be_in_set("b", [0])
+    )
+    assert [result.fail_rows for result in validator.validation_results] == [50, 100, 100]
+    assert [len(index) for index in validator.fail_indices.values()] == [5, 3]
+    assert len(validator.validation_fails) == 8, "Expected 8 validation failure rows"
+
+
+def test_random_fail_sample():
+    validator = PolarsDataFrameValidator(
+        pl.DataFrame(DATA), max_fail_rows=10, fail_sample="random"
+    ).expect_column_value_greater_than("a", 49)
+    sample = validator.fail_indices[0].to_list()
+    assert len(sample) == 10, "Expected 10 sampled failures"
+    assert sample == sorted(sample), "Expected sampled failures in row order"
+    assert all(index < 50 for index in sample), "Expected only failing rows to be sampled"
+    assert sample != list(range(10)), "Expected a sample rather than the first rows"
+
+
+def test_random_fail_sample_with_max_total_fail_rows():
+    validator = (
+        PolarsDataFrameValidator(
+            pl.DataFrame(DATA),
+            deferred=True,
+            max_total_fail_rows=13,
+            fail_sample="random",
+        )
+        .expect_column_value_greater_than("a", 4)
+        .expect_column_to_contain_unique_values("b")
+    )
+    first, second = validator.fail_indices.values()
+    assert first.to_list() == [0, 1, 2, 3, 4]
+    sample = (
+        PolarsDataFrameValidator(
+            pl.DataFrame(DATA), max_fail_rows=8, fail_sample="random"
+        )
+        .expect_column_to_contain_unique_values("b")
+        .fail_indices[0]
+    )
+    assert second.to_list() == sample.to_list(), (
+        "Expected the rows left under the total to be sampled like max_fail_rows"
+    )
+    assert second.to_list() != list(range(8)), "Expected a sample, not the first rows"
+
+
+def test_validator_frame_max_fail_rows():
+    df = ValidatorDataFrame(DATA, max_fail_rows=1)
+    df.expect_column_to_contain_unique_values("b")
+    assert df.validation_results[0].fail_rows == 100
+    assert len(df.validation_fails) == 1, "Expected 1 validation failure row"
@@ -0,0 +1,68 @@
+import polars as pl
+from dataframe_validator import (
+    PolarsBatchValidator,
+    PolarsDataFrameValidator,
+    ValidationHistory,
+)
+
+
+def validate(df, history):
+    return (
+        PolarsDataFrameValidator(df)
+        .with_history(history)
+        .expect_column_to_contain_unique_values("id")
+        .expect_column_to_contain_unique_values("name")
+    )
+
+
+def test_batch_duplicating_history_fails(tmp_path):
+    history = ValidationHistory(tmp_path)
+    first = validate(pl.DataFrame({"id": [1, 2, 3], "name": list("abc")}), history)
+    assert first.is_valid, "Expected first batch to pass"
+    history.commit()
+    assert history.rows == 3
+
+    second = validate(pl.DataFrame({"id": [4, 2, 5], "name": list("xbz")}), history)
+    assert not second.is_valid, "Expected key from history to fail"
+    assert second.fail_indices[0].to_list() == [1], "Expected row 1 to fail"
+    assert second.fail_indices[1].to_list() == [1], "Expected each key set checked"
+
+
+def test_duplicates_within_batch_fail(tmp_path):
+    history = ValidationHistory(tmp_path)
+    batch = validate(pl.DataFrame({"id": [1, 1, 2], "name": list("abc")}), history)
+    assert batch.fail_indices[0].to_list() == [0, 1]
+
+
+def test_rollback_discards_batch(tmp_path):
+    history = ValidationHistory(tmp_path)
+    validate(pl.DataFrame({"id": [1, 2], "name": list("ab")}), history)
+    history.rollback()
+    history.commit()
+    assert history.rows == 0, "Expected rolled back batch not to be committed"
+    batch = validate(pl.DataFrame({"id": [1, 2], "name": list("ab")}), history)
+    assert batch.is_valid
+
+
+def test_history_persists_and_compacts(tmp_path):
+    history = ValidationHistory(tmp_path, max_runs=1)
+    for start in range(0, 30, 10):
+        batch = pl.DataFrame({"id": range(start, start + 10)}, schema={"id": pl.Int64})
+        validator = (
+            PolarsBatchValidator(lambda batch=batch: batch.iter_slices(3))
+            .with_history(history)
+            .expect_column_to_contain_unique_values("id")
+        )
+        assert validator.is_valid
+        history.commit()
+
+    reloaded = ValidationHistory(tmp_path)
+    assert reloaded.rows == 30
+    assert len(list(tmp_path.glob("keys-*.arrow"))) == 1, "Expected runs merged"
+    batch = pl.DataFrame({"id": [5, 30, None, None]}, schema={"id": pl.Int64})
+    validator = (
+        PolarsDataFrameValidator(batch)
+        .with_history(reloaded)
+        .expect_column_to_contain_unique_values("id")
+    )
+    assert validator.fail_indices[0].to_list() == [0, 2, 3]
@@ -0,0 +1,41 @@
+import polars as pl
+from dataframe_validator import PolarsDataFrameValidator, ValidatorDataFrame
+
+
+def test_lazy_frame_defaults_to_deferred_streaming():
+    lf = pl.LazyFrame({"a": [1, 2, 2], "b": ["x", "y", "z"]})
+    validator = PolarsDataFrameValidator(lf)
+    assert validator.deferred and validator.streaming
+    validator.expect_column_to_exist("a").expect_column_to_contain_unique_values("a")
+    assert len(validator._pending) == 2, "Expected 2 pending expectations"
+    assert not validator.is_valid
+    assert validator.validation_results[1].fail_rows == 2
+    assert len(validator.validation_fails) == 2, "Expected 2 validation failure rows"
+
+
+def test_scan_csv(tmp_path):
+    path = tmp_path / "members.csv"
+    pl.DataFrame({"id": [1, 2, 3], "status": ["Active", "Retired", "Inactive"]}).write_csv(path)
+    validator = (
+        PolarsDataFrameValidator(pl.scan_csv(path))
+        .expect_column_to_contain_unique_values("id")
+        .expect_column_value_to_be_in_set("status", ["Active", "Retired"])
+        .expect_column_value_length_greater_than("status", 0)
+    )
+    assert [result.result for result in validator.validation_results] == [True, False, True]
+    assert validator.validation_fails["status"].to_list() == ["Inactive"]
+
+
+def test_lazy_frame_eager_mode():
+    lf = pl.LazyFrame({"a": [1, 2, 3]})
+    validator = PolarsDataFrameValidator(lf, deferred=False)
+    validator.expect_column_value_greater_than("a", 1)
+    assert len(validator._pending) == 0, "Expected expectation to be evaluated"
+    assert validator.validation_results[0].fail_rows == 1
+
+
+def test_validator_frame_from_lazy_frame():
+    df = ValidatorDataFrame(pl.LazyFrame({"a": [1, 2, 3]}))
+    df.expect_column_to_contain_unique_values("a")
+    assert df.is_valid
+    assert df.height == 3
@@ -0,0 +1,51 @@
+import polars as pl
+from dataframe_validator import ExpectationMetrics, PolarsDataFrameValidator
+
+
+def test_eager_metrics_per_expectation():
+    collected = []
+    validator = (
+        PolarsDataFrameValidator(pl.DataFrame({"a": [1, 2, 2, 4]}))
+        .add_metrics_hook(collected.append)
+        .expect_column_to_exist("a")
+        .expect_column_to_contain_unique_values("a")
+        .expect_column_value_greater_than("a", 1)
+    )
+    assert collected == validator.metrics, "Expected hook called for each expectation"
+    assert [m.pass_id for m in validator.metrics] == [1, 2, 3]
+    assert [m.rows_scanned for m in validator.metrics] == [0, 4, 4]
+    assert all(m.pass_expectations == 1 for m in validator.metrics)
+    assert all(m.wall_seconds >= 0 and m.cpu_seconds >= 0 for m in validator.metrics)
+
+
+def test_deferred_metrics_shared_by_pass():
+    validator = (
+        PolarsDataFrameValidator(pl.LazyFrame({"a": [1, 2], "b": ["w", "z"]}))
+        .expect_column_to_contain_unique_values("a")
+        .expect_column_value_to_be_in_set("b", ["w", "x"])
+    )
+    metrics = validator.metrics
+    assert len(metrics) == 2, "Expected metrics for every expectation"
+    assert all(isinstance(m, ExpectationMetrics) for m in metrics)
+    assert {m.pass_id for m in metrics} == {1}
+    assert {m.pass_expectations for m in metrics} == {2}
+    assert len({m.wall_seconds for m in metrics}) == 1
+
+
+def test_metrics_of_empty_frame_and_no_expectations():
+    collected = []
+    validator = PolarsDataFrameValidator(
+        pl.DataFrame({"a": []}, schema={"a": pl.Int64})
+    ).add_metrics_hook(collected.append)
+    assert validator.metrics == [], "Expected no metrics without expectations"
+    validator.expect_column_to_contain_unique_values("a")
+    assert [m.rows_scanned for m in validator.metrics] == [0]
+    assert collected == validator.metrics
+
+
+def test_show_results_profile(capsys):
+    PolarsDataFrameValidator(pl.DataFrame({"a": [1, 1]})).expect_column_to_exist(
+        "a"
+    ).show_results(profile=True)
+    output = capsys.readouterr().out
+    assert "pass_id" in output, "Expected metrics columns in the results table"
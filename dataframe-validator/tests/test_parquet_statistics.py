@@ -0,0 +1,83 @@
+from datetime import date
+import polars as pl
+import pytest
+from dataframe_validator import PolarsDataFrameValidator, PolarsPartitionedValidator
+
+pytest.importorskip("pyarrow")
+
+DATA = {
+    "id": range(100),
+    "joined": [date(2000, 1, 1 + i % 28) for i in range(100)],
+}
+
+
+def write(tmp_path, df: pl.DataFrame, name="data.parquet") -> str:
+    path = str(tmp_path / name)
+    df.write_parquet(path, row_group_size=10)
+    return path
+
+
+def test_statistics_match_scan(tmp_path):
+    path = write(tmp_path, pl.DataFrame(DATA))
+    expected, validator = (
+        validator.expect_column_value_greater_than("id", 45)
+        .expect_column_value_greater_than("id", -1)
+        .expect_column_value_greater_than("joined", date(1999, 1, 1))
+        .expect_column_to_contain_unique_values("id")
+        .expect_column_value_to_be_between("id", 15, 200)
+        .expect_column_value_to_be_between("joined", date(2000, 1, 2), date(2000, 2, 1))
+        for validator in [
+            PolarsDataFrameValidator(pl.scan_parquet(path)),
+            PolarsDataFrameValidator.from_parquet(path),
+        ]
+    )
+    assert validator.validation_results == expected.validation_results
+    assert validator.fail_indices[0].to_list() == list(range(46))
+    assert validator.validation_fails.equals(expected.validation_fails)
+
+
+def test_only_ambiguous_row_groups_read(tmp_path):
+    path = write(tmp_path, pl.DataFrame(DATA))
+    validator = (
+        PolarsDataFrameValidator.from_parquet(path, max_fail_rows=3)
+        .expect_column_value_greater_than("id", 45)
+        .expect_column_value_greater_than("joined", date(1999, 1, 1))
+    )
+    assert validator.validation_results[0].fail_rows == 46
+    assert validator.fail_indices[0].to_list() == [0, 1, 2]
+    rows = [metrics.rows_scanned for metrics in validator.metrics]
+    assert rows == [10, 10], "Expected only the row group containing 45 read"
+
+
+def test_nulls_and_files_in_order(tmp_path):
+    first = write(tmp_path, pl.DataFrame({"id": [None] * 10 + [5] * 10}), "a.parquet")
+    second = write(tmp_path, pl.DataFrame({"id": [1, 9] * 10}), "b.parquet")
+    validator = PolarsPartitionedValidator(
+        [first, second], max_workers=1
+    ).expect_column_value_greater_than("id", 4)
+    assert validator.validation_results[0].fail_rows == 10
+    assert validator.fail_indices[0].to_list() == list(range(20, 40, 2))
+    assert validator.metrics[0].rows_scanned == 20
+
+
+@pytest.mark.parametrize(
+    "value, fail_rows",
+    [(-1, 0), (100, 100)],
+    ids=["all pass", "all fail"],
+)
+def test_decided_by_statistics_alone(tmp_path, value, fail_rows):
+    path = write(tmp_path, pl.DataFrame(DATA))
+    validator = PolarsDataFrameValidator.from_parquet(
+        path
+    ).expect_column_value_greater_than("id", value)
+    assert validator.validation_results[0].fail_rows == fail_rows
+    assert validator.metrics[0].rows_scanned == 0, "Expected no row group read"
+
+
+def test_empty_file(tmp_path):
+    path = write(tmp_path, pl.DataFrame(DATA).clear())
+    validator = PolarsDataFrameValidator.from_parquet(
+        path
+    ).expect_column_value_greater_than("id", 45)
+    assert validator.is_valid
+    assert validator.validation_fails.is_empty()
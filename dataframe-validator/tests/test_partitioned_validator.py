@@ -0,0 +1,84 @@
+import os
+import polars as pl
+from concurrent.futures import ThreadPoolExecutor
+from dataframe_validator import PolarsDataFrameValidator, PolarsPartitionedValidator
+import pytest
+
+
+def write_partitions(df: pl.DataFrame, size: int, path) -> list[str]:
+    files = []
+    for i, part in enumerate(df.iter_slices(size)):
+        files.append(str(path / f"part-{i:03}.parquet"))
+        part.write_parquet(files[-1])
+    return files
+
+
+@pytest.mark.parametrize("size", [3, 100])
+def test_partitions_match_single_frame(tmp_path, size, keyed_frame, expect_keys):
+    write_partitions(keyed_frame, size, tmp_path)
+    partitioned = expect_keys(
+        PolarsPartitionedValidator(tmp_path, max_workers=2, shuffle_partitions=4)
+    ).expect_column_to_contain_approximately_unique_values("status", 0.5)
+    expected = expect_keys(
+        PolarsDataFrameValidator(keyed_frame)
+    ).expect_column_to_contain_approximately_unique_values("status", 0.5)
+    assert partitioned.validation_results == expected.validation_results
+    assert partitioned.validation_fails.equals(expected.validation_fails)
+
+
+def test_empty_and_passing_partitions(tmp_path, keyed_frame, expect_keys):
+    df = keyed_frame.filter(pl.col("status") != "c").unique("id", keep="none")
+    files = [
+        *write_partitions(df, 2, tmp_path),
+        str(tmp_path / "part-empty.parquet"),
+    ]
+    df.clear().write_parquet(files[-1])
+    validator = expect_keys(PolarsPartitionedValidator(files, max_workers=2))
+    assert validator.is_valid
+    assert validator.metrics[1].rows_scanned == df.height
+    assert validator.validation_fails.is_empty()
+
+
+def test_fail_rows_sampled_across_partitions(tmp_path):
+    df = pl.DataFrame({"id": list(range(20)) * 2})
+    files = write_partitions(df, 10, tmp_path)
+    validator = PolarsPartitionedValidator(
+        files, max_workers=2, max_fail_rows=5
+    ).expect_column_to_contain_unique_values("id")
+    assert validator.validation_results[0].fail_rows == 40
+    assert validator.fail_indices[0].to_list() == [0, 1, 2, 3, 4]
+
+
+def test_no_files_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        PolarsPartitionedValidator(tmp_path / "*.parquet")
+
+
+def test_worker_thread_pool_size(tmp_path, monkeypatch, keyed_frame):
+    paths = write_partitions(keyed_frame, 2, tmp_path)
+    validator = PolarsPartitionedValidator(paths, max_workers=2)
+    monkeypatch.delenv("POLARS_MAX_THREADS", raising=False)
+    monkeypatch.setattr(os, "cpu_count", lambda: 6)
+    with validator._pool() as pool:
+        assert pool.submit(pl.thread_pool_size).result() == 3, (
+            "Expected each worker to get its share of the cores"
+        )
+    assert "POLARS_MAX_THREADS" not in os.environ, "Expected the variable restored"
+
+
+def test_concurrent_pools_keep_their_thread_pool_size(tmp_path, monkeypatch):
+    monkeypatch.setenv("POLARS_MAX_THREADS", "5")
+    monkeypatch.setattr(os, "cpu_count", lambda: 6)
+    pl.DataFrame({"a": [1]}).write_parquet(tmp_path / "part.parquet")
+
+    def sizes(max_workers):
+        validator = PolarsPartitionedValidator(tmp_path, max_workers=max_workers)
+        with validator._pool() as pool:
+            futures = [pool.submit(pl.thread_pool_size) for _ in range(4)]
+            return {future.result() for future in futures}
+
+    with ThreadPoolExecutor(2) as threads:
+        assert list(threads.map(sizes, [2, 3])) == [{3}, {2}], (
+            "Expected every worker of each pool to get its own share"
+        )
+    assert os.environ["POLARS_MAX_THREADS"] == "5", "Expected the variable restored"
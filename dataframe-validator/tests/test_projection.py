@@ -0,0 +1,77 @@
+import polars as pl
+from dataframe_validator import (
+    ExpectationSuite,
+    PolarsBatchValidator,
+    PolarsDataFrameValidator,
+)
+
+DATA = {
+    "id": [1, 2, 2, 4],
+    "status": ["a", "b", "c", "a"],
+    "joined": [5, 6, 7, 8],
+    "born": [1, 2, 9, 3],
+    "unused": ["w", "x", "y", "z"],
+}
+
+
+def test_projection_from_expectations():
+    validator = (
+        PolarsDataFrameValidator(pl.LazyFrame(DATA), key_columns=["id"])
+        .expect_column_to_exist("missing")
+        .expect_column_value_to_be_in_set("status", ["a", "b"])
+        .expect_column_a_greater_than_column_b("joined", "born")
+    )
+    assert validator.projection == ["id", "missing", "status", "joined", "born"]
+    assert validator.validation_fails.columns == [
+        "expectation_name",
+        "expectation_args",
+        "id",
+        "status",
+        "joined",
+        "born",
+    ], "Expected only key and referenced columns"
+    assert PolarsDataFrameValidator(pl.LazyFrame(DATA)).projection is None
+
+
+def test_projection_without_expectations_or_with_key_columns_checked():
+    validator = PolarsDataFrameValidator(pl.LazyFrame(DATA), key_columns=["id"])
+    assert validator.projection == ["id"], "Expected only the key columns"
+    validator.expect_column_to_contain_unique_values("id")
+    assert validator.projection == ["id"], "Expected columns listed once"
+    assert validator.validation_fails.columns == [
+        "expectation_name",
+        "expectation_args",
+        "id",
+    ]
+
+
+def test_batches_read_projected_columns(tmp_path):
+    path = tmp_path / "data.parquet"
+    pl.DataFrame(DATA).write_parquet(path)
+    validator, expected = (
+        validator.expect_column_value_to_be_in_set(
+            "status", ["a", "b"]
+        ).expect_column_a_greater_than_column_b("joined", "born")
+        for validator in [
+            PolarsBatchValidator.from_parquet(path, batch_size=2, key_columns=[]),
+            PolarsDataFrameValidator(pl.DataFrame(DATA)),
+        ]
+    )
+    assert validator.validation_results == expected.validation_results
+    assert "unused" not in next(iter(validator._read_batches(project=True))).columns
+    assert validator.validation_fails.equals(
+        expected.validation_fails.drop("id", "unused")
+    )
+
+
+def test_suite_project_skips_missing_columns():
+    suite = (
+        ExpectationSuite()
+        .add("expect_column_to_exist", "missing")
+        .add("expect_column_a_greater_than_column_b", "joined", "born")
+        .compile()
+    )
+    assert suite.columns == ["missing", "joined", "born"]
+    lf = suite.project(pl.LazyFrame(DATA), key_columns=["id"])
+    assert lf.collect_schema().names() == ["id", "joined", "born"]
+    assert not suite.validate(lf).validation_results[0].result
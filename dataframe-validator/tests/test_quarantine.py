@@ -0,0 +1,75 @@
+import polars as pl
+import pytest
+from dataframe_validator import (
+    PolarsBatchValidator,
+    PolarsDataFrameValidator,
+    QuarantineManifest,
+    ValidatorDataFrame,
+)
+
+DATA = {
+    "id": [1, 2, 2, 4, 5, 6],
+    "status": ["a", "b", "x", "a", "y", "a"],
+}
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda df: PolarsDataFrameValidator(df),
+        lambda df: PolarsDataFrameValidator(df.lazy()),
+        lambda df: ValidatorDataFrame(df),
+        lambda df: PolarsBatchValidator(lambda: df.iter_slices(2)),
+    ],
+)
+@pytest.mark.parametrize("file_format", ["parquet", "ipc"])
+def test_quarantine_matches_validation_fails(tmp_path, make, file_format):
+    validator = (
+        make(pl.DataFrame(DATA))
+        .expect_column_to_contain_unique_values("id")
+        .expect_column_value_to_be_in_set("status", ["a", "b"])
+        .expect_column_value_greater_than("id", 0)
+    )
+    manifest = validator.write_quarantine(tmp_path, file_format)
+    assert manifest == QuarantineManifest.read(tmp_path)
+    assert [q.position for q in manifest.expectations] == [0, 1]
+    assert manifest.expectations[1].expectation_args == "values=['a', 'b']"
+    expected = validator.validation_fails.drop("expectation_name", "expectation_args")
+    quarantined = pl.concat(
+        manifest.scan(tmp_path, q.position).collect() for q in manifest.expectations
+    )
+    assert quarantined.columns == ["__row_index", "id", "status"]
+    assert quarantined.drop("__row_index").equals(expected), "Expected same rows"
+    assert quarantined["__row_index"].to_list() == [1, 2, 2, 4]
+
+
+def test_quarantine_metadata_and_rewrite(tmp_path):
+    df = pl.DataFrame(DATA)
+    PolarsDataFrameValidator(df).expect_column_value_to_be_in_set(
+        "status", ["a", "b"]
+    ).write_quarantine(tmp_path)
+    (file,) = (tmp_path / "0000_expect_column_value_to_be_in_set").iterdir()
+    metadata = pl.read_parquet_metadata(file)
+    assert "values=['a', 'b']" in metadata["dataframe_validator.expectation"]
+
+    fixed = df.with_columns(status=pl.lit("a"))
+    manifest = (
+        PolarsDataFrameValidator(fixed)
+        .expect_column_value_to_be_in_set("status", ["a", "b"])
+        .write_quarantine(tmp_path)
+    )
+    assert manifest.expectations == [], "Expected nothing quarantined"
+    assert not file.parent.exists(), "Expected previous quarantine removed"
+
+
+def test_quarantine_bounded_by_max_fail_rows(tmp_path):
+    df = pl.DataFrame({"id": [1] * 10})
+    manifest = (
+        PolarsDataFrameValidator(df.lazy(), max_fail_rows=3)
+        .expect_column_to_contain_unique_values("id")
+        .write_quarantine(tmp_path)
+    )
+    (quarantined,) = manifest.expectations
+    assert (quarantined.fail_rows, quarantined.rows) == (10, 3)
+    rows = manifest.scan(tmp_path, 0).collect()
+    assert rows["__row_index"].to_list() == [0, 1, 2]
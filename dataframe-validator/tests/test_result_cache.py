@@ -0,0 +1,130 @@
+import polars as pl
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from dataframe_validator import (
+    ExpectationSuite,
+    PolarsBatchValidator,
+    PolarsDataFrameValidator,
+    ResultCache,
+    file_fingerprint,
+)
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pl.DataFrame({"a": [1, 2, 2, None], "b": ["w", "x", "y", None]}),
+        pl.DataFrame({"a": [1, 2], "b": ["w", "x"]}),
+        pl.DataFrame({"a": [], "b": []}, schema={"a": pl.Int64, "b": pl.String}),
+    ],
+    ids=["fails", "passes", "empty"],
+)
+def test_cache_hit_returns_stored_results(tmp_path, df):
+    cache = ResultCache(tmp_path)
+    first, second = (
+        PolarsDataFrameValidator(df)
+        .with_cache(cache)
+        .expect_column_to_contain_unique_values("a")
+        .expect_column_value_to_be_in_set("b", ["w", "x"])
+        .expect_column_to_contain_approximately_unique_values("b")
+        for _ in range(2)
+    )
+    assert not any(m.cache_hit for m in first.metrics)
+    assert all(m.cache_hit for m in second.metrics), "Expected results from cache"
+    assert second.validation_results == first.validation_results
+    assert second.fail_indices.keys() == first.fail_indices.keys()
+    assert second.validation_fails.equals(first.validation_fails)
+    assert second.observed[2] == first.observed[2], "Expected the sketch stored"
+
+
+def test_cache_miss_on_changed_data_or_expectations(tmp_path):
+    cache = ResultCache(tmp_path)
+    suite = ExpectationSuite().add("expect_column_to_contain_unique_values", "a")
+    compiled = suite.compile()
+    df = pl.DataFrame({"a": [1, 2, 2]})
+    compiled.validate(df, cache=cache)
+    changed = pl.DataFrame({"a": [1, 2, 3]})
+    validator = compiled.validate(changed, cache=cache)
+    assert validator.is_valid, "Expected changed data to be validated again"
+    assert not validator.metrics[0].cache_hit
+    reordered = df.reverse()
+    assert not compiled.validate(reordered, cache=cache).metrics[0].cache_hit
+    validator = (
+        suite.add("expect_column_to_exist", "a").compile().validate(df, cache=cache)
+    )
+    assert not validator.metrics[0].cache_hit
+
+
+def test_file_fingerprint(tmp_path):
+    path = tmp_path / "data.parquet"
+    pl.DataFrame({"a": [1, 2, 2]}).write_parquet(path)
+    cache = ResultCache(tmp_path / "cache")
+    for _ in range(2):
+        validator = (
+            PolarsDataFrameValidator(pl.scan_parquet(path))
+            .with_cache(cache, fingerprint=file_fingerprint(path))
+            .expect_column_to_contain_unique_values("a")
+        )
+        validator._resolve()
+    assert all(m.cache_hit for m in validator.metrics)
+    pl.DataFrame({"a": [1, 2]}).write_parquet(path)
+    validator = (
+        PolarsDataFrameValidator(pl.scan_parquet(path))
+        .with_cache(cache, fingerprint=file_fingerprint(path))
+        .expect_column_to_contain_unique_values("a")
+    )
+    assert validator.is_valid, "Expected a changed file to be validated again"
+
+
+def test_batch_validator_cache(tmp_path):
+    cache = ResultCache(tmp_path)
+    df = pl.DataFrame({"a": [1, 2, 2, 4], "b": ["w", "x", "y", "z"]})
+    for _ in range(2):
+        validator = (
+            PolarsBatchValidator(lambda: df.iter_slices(2))
+            .with_cache(cache)
+            .expect_column_to_contain_unique_values("a")
+            .expect_column_to_contain_approximately_unique_values("b")
+        )
+        validator._resolve()
+    assert all(m.cache_hit for m in validator.metrics)
+    assert validator.fail_indices[0].to_list() == [1, 2]
+
+
+def test_size_based_eviction(tmp_path):
+    cache = ResultCache(tmp_path, max_bytes=0)
+    PolarsDataFrameValidator(pl.DataFrame({"a": [1]})).with_cache(
+        cache
+    ).expect_column_to_exist("a")
+    assert list(tmp_path.iterdir()) == [], "Expected entries past max_bytes evicted"
+
+
+def test_cache_entry_from_older_version_is_a_miss(tmp_path):
+    cache = ResultCache(tmp_path)
+    pl.DataFrame(
+        {
+            "result": [True],
+            "fail_rows": [0],
+            "observed": [None],
+            "fail_indices": [None],
+        },
+        schema_overrides={"observed": pl.String, "fail_indices": pl.List(pl.Int64)},
+    ).write_parquet(tmp_path / "old.parquet")
+    assert cache.get("old") is None, "Expected an entry without observed_type missed"
+
+
+def test_threads_storing_the_same_key(tmp_path):
+    cache = ResultCache(tmp_path)
+    df = pl.DataFrame({"a": range(10_000)})
+
+    def validate(_):
+        return (
+            PolarsDataFrameValidator(df)
+            .with_cache(cache)
+            .expect_column_to_contain_unique_values("a")
+            .is_valid
+        )
+
+    with ThreadPoolExecutor(8) as pool:
+        assert all(pool.map(validate, range(32))), "Expected no temp file collision"
+    assert len(list(tmp_path.iterdir())) == 1
@@ -0,0 +1,66 @@
+import polars as pl
+import pytest
+from dataframe_validator import DataValidationError, PolarsDataFrameValidator
+from dataframe_validator.results import RESULT_SCHEMA
+
+
+def test_results_frame():
+    validator = (
+        PolarsDataFrameValidator(
+            pl.DataFrame({"a": [1, 2, 2, None], "b": ["w", "z", "x", None]})
+        )
+        .expect_column_to_exist("a")
+        .expect_column_to_contain_unique_values("a")
+        .expect_column_value_to_be_in_set("b", ["w", "x"])
+    )
+    results = validator.results
+    assert results.schema == RESULT_SCHEMA, "Expected a row per expectation"
+    assert results["position"].to_list() == [0, 1, 2]
+    assert results["result"].to_list() == [True, False, False]
+    assert results["fail_rows"].to_list() == [None, 2, 1]
+    assert results["pass_id"].to_list() == [1, 2, 3]
+    assert results["expectation_args"][2] == "values=['w', 'x']"
+
+
+def test_results_without_expectations_or_rows():
+    assert PolarsDataFrameValidator(pl.DataFrame({"a": [1]})).results.equals(
+        pl.DataFrame(schema=RESULT_SCHEMA)
+    ), "Expected an empty table without expectations"
+    validator = PolarsDataFrameValidator(
+        pl.DataFrame({"a": []}, schema={"a": pl.Int64})
+    ).expect_column_value_greater_than("a", 0)
+    assert validator.results["result"].to_list() == [True]
+    assert validator.results["fail_rows"].to_list() == [0]
+
+
+def test_models_built_on_demand():
+    validator = (
+        PolarsDataFrameValidator(pl.LazyFrame({"a": [1, 1], "b": ["w", "w"]}))
+        .expect_column_to_contain_unique_values("a")
+        .expect_column_value_to_be_in_set("b", ["w"])
+    )
+    assert validator._results.frame.is_empty(), "Expected deferred evaluation"
+    results = validator.validation_results
+    assert [result.fail_rows for result in results] == [2, 0]
+    assert validator.validation_results[0] is results[0], "Expected models reused"
+    validator.expect_column_to_contain_unique_values("b")
+    assert len(validator.validation_results) == 3, "Expected new results appended"
+    assert [m.position for m in validator.metrics] == [0, 1, 2]
+
+
+def test_vectorized_reporting(capsys):
+    validator = (
+        PolarsDataFrameValidator(pl.DataFrame({"a": [1, 1], "b": [2, 0]}))
+        .expect_column_to_contain_unique_values("a")
+        .expect_column_value_greater_than("b", 1)
+        .expect_column_to_exist("b")
+    )
+    assert not validator.is_valid
+    with pytest.raises(DataValidationError, match="failed for 2 expectations"):
+        validator.throw_error_if_invalid()
+    validator.show_results()
+    output = capsys.readouterr().out
+    assert "❌" in output and "✅" in output
+    assert PolarsDataFrameValidator(pl.DataFrame({"a": [1]})).is_valid, (
+        "Expected no expectations to be valid"
+    )
@@ -0,0 +1,107 @@
+import json
+import polars as pl
+from dataframe_validator import (
+    DataValidationError,
+    ExpectationSuite,
+    PolarsBatchValidator,
+    PolarsDataFrameValidator,
+)
+import pytest
+
+SPEC = {
+    "name": "test",
+    "expectations": [
+        {"expectation": "expect_column_to_exist", "column_name": "a"},
+        {"expectation": "expect_column_to_contain_unique_values", "column_name": "a"},
+        {
+            "expectation": "expect_column_value_to_be_in_set",
+            "column_name": "b",
+            "values": ["w", "x"],
+        },
+    ],
+}
+
+
+def expected_validator(df):
+    return (
+        PolarsDataFrameValidator(df)
+        .expect_column_to_exist("a")
+        .expect_column_to_contain_unique_values("a")
+        .expect_column_value_to_be_in_set("b", ["w", "x"])
+    )
+
+
+def test_python_suite_matches_chained_expectations():
+    suite = (
+        ExpectationSuite(name="test")
+        .add("expect_column_to_exist", "a")
+        .add("expect_column_to_contain_unique_values", column_name="a")
+        .add("expect_column_value_to_be_in_set", "b", ["w", "x"])
+    )
+    assert suite == ExpectationSuite.model_validate(SPEC)
+    compiled = suite.compile()
+    for df in [
+        pl.DataFrame({"a": [1, 2, 2], "b": ["w", None, "y"]}),
+        pl.DataFrame({"a": [1, 2], "b": ["w", "x"]}),
+        pl.DataFrame({"a": [], "b": []}, schema={"a": pl.Int64, "b": pl.String}),
+    ]:
+        assert (
+            compiled.validate(df).validation_results
+            == expected_validator(df).validation_results
+        )
+
+
+def test_suite_from_json(tmp_path):
+    path = tmp_path / "suite.json"
+    path.write_text(json.dumps(SPEC))
+    assert ExpectationSuite.from_json(path) == ExpectationSuite.model_validate(SPEC)
+
+
+def test_suite_from_yaml(tmp_path):
+    pytest.importorskip("yaml")
+    yaml_path = tmp_path / "suite.yaml"
+    yaml_path.write_text(
+        "name: test\n"
+        "expectations:\n"
+        "  - expectation: expect_column_to_exist\n"
+        "    column_name: a\n"
+        "  - expectation: expect_column_to_contain_unique_values\n"
+        "    column_name: a\n"
+        "  - expectation: expect_column_value_to_be_in_set\n"
+        "    column_name: b\n"
+        "    values: [w, x]\n"
+    )
+    assert ExpectationSuite.from_yaml(yaml_path) == ExpectationSuite.model_validate(
+        SPEC
+    )
+
+
+def test_suite_applied_to_batch_validator():
+    df = pl.DataFrame({"a": [1, 2, 3, 1, 5], "b": ["w", "x", "y", "x", "z"]})
+    compiled = ExpectationSuite.model_validate(SPEC).compile()
+    validator = compiled.apply(PolarsBatchValidator(lambda: df.iter_slices(2)))
+    assert validator.validation_results == expected_validator(df).validation_results
+
+
+@pytest.mark.parametrize(
+    "expectation",
+    [
+        {"expectation": "expect_column_to_be_blue", "column_name": "a"},
+        {"expectation": "show_results"},
+        {"expectation": "expect_column_to_exist", "column": "a"},
+    ],
+)
+def test_invalid_suite(expectation):
+    with pytest.raises(ValueError):
+        ExpectationSuite(expectations=[expectation]).compile()
+
+
+def test_suite_preconditions_checked_per_frame():
+    compiled = (
+        ExpectationSuite()
+        .add("expect_column_value_length_greater_than", "b", 0)
+        .compile()
+    )
+    assert compiled.validate(pl.DataFrame({"b": ["w", None]})).is_valid
+    with pytest.raises(DataValidationError):
+        compiled.validate(pl.DataFrame({"b": [1, 2]}))
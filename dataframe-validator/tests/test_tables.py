@@ -0,0 +1,133 @@
+import asyncio
+import threading
+import time
+import polars as pl
+import pytest
+from dataframe_validator import (
+    DataValidationError,
+    ExpectationSuite,
+    PolarsDataFrameValidator,
+    validate_tables,
+    validate_tables_async,
+)
+from dataframe_validator.tables import MemoryBudget, estimated_bytes
+
+SUITE = (
+    ExpectationSuite()
+    .add("expect_column_to_contain_unique_values", "id")
+    .add("expect_column_value_to_be_in_set", "status", ["a", "b"])
+    .compile()
+)
+
+
+@pytest.fixture
+def tables(tmp_path, keyed_frame):
+    keyed_frame.write_parquet(tmp_path / "table.parquet")
+    keyed_frame.write_csv(tmp_path / "table.csv")
+    return {
+        "frame": (keyed_frame, SUITE),
+        "lazy": (keyed_frame.lazy(), SUITE),
+        "parquet": (str(tmp_path / "table.parquet"), SUITE),
+        "csv": (tmp_path / "table.csv", SUITE),
+        "valid": (valid_frame(keyed_frame), SUITE),
+    }
+
+
+def valid_frame(keyed_frame):
+    return keyed_frame.filter(pl.col("status") != "c").unique("id", keep="none")
+
+
+def expected_results(name, keyed_frame):
+    df = valid_frame(keyed_frame) if name == "valid" else keyed_frame
+    return SUITE.apply(PolarsDataFrameValidator(df)).validation_results
+
+
+def test_validate_tables(tables, keyed_frame):
+    validators = validate_tables(tables, max_workers=2)
+    assert list(validators) == ["frame", "lazy", "parquet", "csv", "valid"], (
+        "Expected validators in the order of the tables"
+    )
+    for name, validator in validators.items():
+        assert validator.validation_results == expected_results(name, keyed_frame)
+    assert [validator.is_valid for validator in validators.values()] == [
+        False,
+        False,
+        False,
+        False,
+        True,
+    ]
+    empty = validate_tables({"empty": (keyed_frame.clear(), SUITE)})["empty"]
+    assert empty.is_valid, "Expected an empty table to pass"
+
+
+def test_validate_tables_async(tables, keyed_frame):
+    validators = asyncio.run(validate_tables_async(tables))
+    for name, validator in validators.items():
+        assert validator.validation_results == expected_results(name, keyed_frame)
+    assert asyncio.run(validate_tables_async({})) == {}
+
+
+def test_validate_tables_options(tables):
+    suite = (
+        ExpectationSuite()
+        .add("expect_column_to_contain_unique_values", "id")
+        .add("expect_column_value_to_be_in_set", "status", ["a"])
+        .compile()
+    )
+    validators = validate_tables(
+        {name: (source, suite) for name, (source, _) in tables.items()},
+        max_memory_bytes=1,
+        max_failures=1,
+    )
+    assert all(validator.skipped == [0] for validator in validators.values()), (
+        "Expected keyword arguments passed to the suite"
+    )
+    suite = ExpectationSuite().add("expect_column_value_length_greater_than", "id", 0)
+    with pytest.raises(DataValidationError):
+        validate_tables({"ids": (pl.DataFrame({"id": [1]}), suite.compile())})
+
+
+def test_memory_budget():
+    budget = MemoryBudget(max_bytes=10)
+    running, peak = [], []
+    lock = threading.Lock()
+
+    def run(nbytes):
+        with budget.reserve(nbytes):
+            with lock:
+                running.append(nbytes)
+                peak.append(sum(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(nbytes)
+
+    threads = [threading.Thread(target=run, args=(n,)) for n in [6, 6, 4, 20]]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(peak) == 20, "Expected a table over budget to run alone"
+    assert sorted(peak)[-2] <= 10, "Expected other tables to fit in the budget"
+
+
+def test_lazy_frames_reserve_the_whole_budget(tmp_path):
+    df = pl.DataFrame({"a": [1, 2]})
+    df.write_parquet(tmp_path / "a.parquet")
+    assert estimated_bytes(df) == df.estimated_size()
+    assert estimated_bytes(tmp_path / "a.parquet") > 0
+    assert estimated_bytes(df.lazy()) is None, "Expected a LazyFrame size unknown"
+
+    budget = MemoryBudget(max_bytes=10)
+    started = []
+
+    def run_lazy():
+        with budget.reserve(None):
+            started.append(budget._reserved)
+
+    with budget.reserve(1):
+        thread = threading.Thread(target=run_lazy)
+        thread.start()
+        thread.join(0.05)
+        assert started == [], "Expected a LazyFrame to wait for the running table"
+    thread.join()
+    assert started == [10], "Expected the whole budget reserved"
@@ -0,0 +1,218 @@
+import inspect
+import io
+import polars as pl
+import pytest
+from datetime import date
+from dataframe_validator import ValidatorDataFrame
+from dataframe_validator.polars_validator_frame import TRANSFORMATIONS
+
+
+def test_wraps_without_copying():
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    validator = ValidatorDataFrame(df, max_fail_rows=1)
+    np = pytest.importorskip("numpy")
+    assert np.shares_memory(validator["a"].to_numpy(), df["a"].to_numpy()), (
+        "Expected the column buffers to be shared"
+    )
+    validator.insert_column(0, pl.Series("c", [0, 0, 0]))
+    validator[0, "a"] = 10
+    assert df.equals(pl.DataFrame({"a": [1, 2, 3]})), (
+        "Expected the source frame unchanged"
+    )
+    assert validator.max_fail_rows == 1
+
+
+def test_from_arrow():
+    pytest.importorskip("pyarrow")
+    df = pl.DataFrame({"id": [1, 1, None]})
+    validator = ValidatorDataFrame.from_arrow(df.to_arrow())
+    assert not validator.expect_column_to_contain_unique_values("id").is_valid
+    assert validator.equals(df)
+
+
+def test_transformations_keep_expectations():
+    df = (
+        ValidatorDataFrame(
+            {"id": [1, 2, 2, 4], "status": ["a", "b", "c", "d"]}, max_fail_rows=1
+        )
+        .expect_column_to_contain_unique_values("id")
+        .expect_column_value_to_be_in_set("status", ["a", "b", "c"])
+    )
+    assert not df.is_valid
+    filtered = df.filter(pl.col("id") != 4).with_columns(c=pl.col("id") * 2)
+    assert isinstance(filtered, ValidatorDataFrame)
+    assert filtered.max_fail_rows == 1, "Expected the options kept"
+    assert [r.result for r in filtered.validation_results] == [False, True], (
+        "Expected the expectations evaluated against the filtered frame"
+    )
+    assert filtered.unique("id").is_valid
+    assert filtered.validation_fails["c"].to_list() == [4], (
+        "Expected failing rows from the transformed frame"
+    )
+    selected = df.select("status").head(3)
+    assert [r.result for r in selected.validation_results] == [None, True]
+    assert selected.skipped == [0], (
+        "Expected expectations on dropped columns reported as skipped"
+    )
+    assert len(df.validation_results) == 2, "Expected the source unchanged"
+
+
+def test_transformations_keep_schema_expectations():
+    df = (
+        ValidatorDataFrame({"a": [1, 2, 3]})
+        .expect_column_to_exist("missing")
+        .expect_schema({"a": pl.String})
+        .expect_column_value_greater_than("a", 0)
+    )
+    for frame in (df, df.filter(pl.col("a") > 1), df.select(b="a")):
+        assert not frame.is_valid, "Expected failed schema checks kept"
+        assert [r.result for r in frame.validation_results][:2] == [False, False]
+    assert df.select(b="a").skipped == [2]
+    validate = pl.DataFrame({"a": [1, 2, 3]}).validate
+    assert not validate.expect_column_to_exist("zzz").head(2).is_valid
+
+
+def frame_methods() -> dict:
+    """A call of every public DataFrame method returning a frame"""
+    return {
+        "approx_n_unique": lambda df: df.select("a").approx_n_unique(),
+        "bottom_k": lambda df: df.bottom_k(2, by="a"),
+        "cast": lambda df: df.cast({"a": pl.Int32}),
+        "clear": lambda df: df.clear(),
+        "clone": lambda df: df.clone(),
+        "corr": lambda df: df.select("a", "f").corr(),
+        "count": lambda df: df.count(),
+        "describe": lambda df: df.describe(),
+        "deserialize": lambda df: type(df).deserialize(io.BytesIO(df.serialize())),
+        "drop": lambda df: df.drop("f"),
+        "drop_nans": lambda df: df.drop_nans(),
+        "drop_nulls": lambda df: df.drop_nulls(),
+        "explode": lambda df: df.explode("l"),
+        "extend": lambda df: df.extend(df.clone()),
+        "fill_nan": lambda df: df.fill_nan(0),
+        "fill_null": lambda df: df.fill_null(strategy="forward"),
+        "filter": lambda df: df.filter(pl.col("a") > 1),
+        "gather": lambda df: df.gather([0, 2]),
+        "gather_every": lambda df: df.gather_every(2),
+        "head": lambda df: df.head(2),
+        "hstack": lambda df: df.hstack([pl.Series("c", [0, 0, 0, 0])]),
+        "insert_column": lambda df: df.insert_column(0, pl.Series("c", [0] * 4)),
+        "interpolate": lambda df: df.select("a", "f").interpolate(),
+        "join": lambda df: df.join(df.select("a", "b"), on="a"),
+        "join_asof": lambda df: df.join_asof(df.select("t", "b"), on="t"),
+        "join_where": lambda df: df.join_where(
+            df.select(x="a"), pl.col("a") > pl.col("x")
+        ),
+        "limit": lambda df: df.limit(2),
+        "map_columns": lambda df: df.map_columns("a", lambda s: s * 2),
+        "map_rows": lambda df: df.select("a").map_rows(lambda row: row[0] * 2),
+        "match_to_schema": lambda df: df.match_to_schema(df.schema),
+        "max": lambda df: df.max(),
+        "mean": lambda df: df.select("a", "f").mean(),
+        "median": lambda df: df.select("a", "f").median(),
+        "melt": lambda df: df.melt(id_vars="a", value_vars="b"),
+        "merge_sorted": lambda df: df.select("a").merge_sorted(df.select("a"), key="a"),
+        "min": lambda df: df.min(),
+        "null_count": lambda df: df.null_count(),
+        "pivot": lambda df: df.pivot(
+            "b", index="a", values="f", aggregate_function="first"
+        ),
+        "product": lambda df: df.select("a", "f").product(),
+        "quantile": lambda df: df.select("a", "f").quantile(0.5),
+        "rechunk": lambda df: df.rechunk(),
+        "remove": lambda df: df.remove(pl.col("a") > 1),
+        "rename": lambda df: df.rename({"a": "x"}),
+        "replace_column": lambda df: df.replace_column(0, pl.Series("x", [0] * 4)),
+        "reverse": lambda df: df.reverse(),
+        "sample": lambda df: df.sample(2, seed=0),
+        "select": lambda df: df.select("a"),
+        "select_seq": lambda df: df.select_seq("a"),
+        "set_sorted": lambda df: df.set_sorted("a"),
+        "shift": lambda df: df.shift(1),
+        "shrink_to_fit": lambda df: df.shrink_to_fit(),
+        "slice": lambda df: df.slice(1, 2),
+        "sort": lambda df: df.sort("b"),
+        "sql": lambda df: df.sql("SELECT a FROM self"),
+        "std": lambda df: df.select("a", "f").std(),
+        "sum": lambda df: df.select("a", "f").sum(),
+        "tail": lambda df: df.tail(2),
+        "to_dummies": lambda df: df.to_dummies("b"),
+        "top_k": lambda df: df.top_k(2, by="a"),
+        "transpose": lambda df: df.select("a").transpose(),
+        "unique": lambda df: df.unique(),
+        "unnest": lambda df: df.unnest("s"),
+        "unpivot": lambda df: df.unpivot("b", index="a"),
+        "unstack": lambda df: df.select("a").unstack(step=2),
+        "update": lambda df: df.update(df.select("b", a=pl.lit(0)), on="b"),
+        "upsample": lambda df: df.select("t", "a").upsample("t", every="1d"),
+        "var": lambda df: df.select("a", "f").var(),
+        "vstack": lambda df: df.vstack(df),
+        "with_columns": lambda df: df.with_columns(c=1),
+        "with_columns_seq": lambda df: df.with_columns_seq(c=pl.lit(1)),
+        "with_row_count": lambda df: df.with_row_count(),
+        "with_row_index": lambda df: df.with_row_index(),
+    }
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_every_method_returning_a_frame():
+    names = [
+        name
+        for name, method in inspect.getmembers(pl.DataFrame, callable)
+        if not name.startswith("_")
+        and inspect.signature(method).return_annotation == "DataFrame"
+    ]
+    calls = frame_methods()
+    assert set(names) <= set(calls), "Expected a call of every method"
+    for name in names:
+        df = (
+            ValidatorDataFrame(
+                {
+                    "a": [1, 2, 2, 4],
+                    "f": [0.5, float("nan"), None, 2.0],
+                    "b": ["w", "x", "y", "z"],
+                    "t": [date(2024, 1, day) for day in (1, 2, 4, 8)],
+                    "l": [[1], [2, 3], [], [4]],
+                },
+                deferred=True,
+            )
+            .with_columns(s=pl.struct(c="b"))
+            .expect_column_to_exist("a")
+            .expect_column_value_greater_than("a", 1)
+        )
+        result = calls[name](df)
+        if name in ("extend", "insert_column", "replace_column"):
+            assert result is df, f"Expected {name} to change the frame in place"
+        elif name in TRANSFORMATIONS:
+            assert isinstance(result, ValidatorDataFrame), name
+            assert len(result.validation_results) == 2, name
+        else:
+            assert type(result) is pl.DataFrame, f"Expected {name} a plain frame"
+
+
+def test_validate_namespace():
+    df = pl.DataFrame({"id": [1, 2, 2]})
+    df.validate.expect_column_to_exist("id")
+    df.validate.expect_column_to_contain_unique_values("id")
+    assert [r.result for r in df.validate.validation_results] == [True, False], (
+        "Expected expectations chained on the namespace to accumulate"
+    )
+    assert df.validate.filter(pl.col("id") != 2).validate.is_valid
+    assert pl.DataFrame({"id": [1, 1]}).validate.is_valid, (
+        "Expected a namespace per frame"
+    )
+
+
+def test_duplicate_groups_and_orphaned_keys():
+    df = (
+        ValidatorDataFrame({"id": [1, 2, 2, 4], "status": ["a", "b", "c", "d"]})
+        .expect_compound_columns_to_be_unique(["id"])
+        .expect_column_value_to_be_in_reference(
+            "status", pl.DataFrame({"status": ["a", "b"]})
+        )
+    )
+    assert df.duplicate_groups(0).rows() == [(2, 2, [1, 2])]
+    assert df.orphaned_keys(1).rows() == [("c", 1, [2]), ("d", 1, [3])]
+    filtered = df.filter(pl.col("status") != "c")
+    assert filtered.duplicate_groups(0).is_empty(), "Expected the filtered frame"
+    assert filtered.orphaned_keys(1).rows() == [("d", 1, [2])]
@@ -0,0 +1,230 @@
+"""
+Vectorised synthetic member data generation.
+
+Generates the same schema as generate_members.py with NumPy and Polars rather
+than one Faker call per value, so 100M rows take minutes instead of days.
+Names and titles are drawn with Faker's en_US weights. Output is seeded and
+written in chunks, so it is reproducible and never held in memory at once.
+
+    python generate_members_fast.py --rows 1e8 --output members --format parquet
+"""
+
+import argparse
+import numpy as np
+import polars as pl
+from dataclasses import dataclass, fields
+from datetime import date, timedelta
+from faker.providers.person.en_US import Provider
+from math import gcd
+from pathlib import Path
+from typing import Iterator, Literal
+
+YEAR = 365
+EPOCH = date(1970, 1, 1).toordinal()
+
+NINO_PREFIXES = [
+    a + b
+    for a in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    if a not in "DFIQUV"
+    for b in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    if b not in "DFIOQUV" and a + b not in ["GB", "NK", "TN", "ZZ", "NT", "KN", "BG"]
+]
+NINO_SPACE = len(NINO_PREFIXES) * 10**6 * 4
+# Multiplier permuting member IDs into distinct NINOs that look random
+NINO_MULTIPLIER = 2_654_435_761
+assert gcd(NINO_MULTIPLIER, NINO_SPACE) == 1
+
+STATUSES = ["Active", "Retired", "Deferred"]
+
+
+@dataclass
+class ErrorRates:
+    """Fraction of rows given each kind of bad data"""
+
+    null_gender: float = 0.001
+    duplicate_nino: float = 0.001
+    invalid_nino: float = 0.001
+    invalid_status: float = 0.001
+    dob_after_joining: float = 0.001
+    duplicate_member_id: float = 0.0
+
+    @classmethod
+    def none(cls) -> "ErrorRates":
+        return cls(**{field.name: 0.0 for field in fields(cls)})
+
+
+def weighted(options: dict[str, float]) -> tuple[pl.Series, np.ndarray]:
+    """Values and normalised weights of a Faker weighted dict"""
+    weights = np.fromiter(options.values(), dtype=np.float64)
+    return pl.Series(list(options)), weights / weights.sum()
+
+
+FORENAMES = {
+    "Male": weighted(Provider.first_names_male),
+    "Female": weighted(Provider.first_names_female),
+}
+TITLES = {
+    "Male": weighted(Provider.prefixes_male),
+    "Female": weighted(Provider.prefixes_female),
+}
+SURNAMES = weighted(Provider.last_names)
+
+
+def generate_ni_numbers(member_ids: np.ndarray) -> pl.Series:
+    """
+    Generate fake UK National Insurance Numbers, distinct for distinct member IDs
+    """
+    code = member_ids * NINO_MULTIPLIER % NINO_SPACE
+    return pl.select(
+        pl.concat_str(
+            pl.Series(NINO_PREFIXES).gather(code // (4 * 10**6)),
+            pl.Series(code // 4 % 10**6).cast(pl.String).str.zfill(6),
+            pl.Series(list("ABCD")).gather(code % 4),
+        )
+    ).to_series()
+
+
+def generate_members(
+    rows: int,
+    start: int = 0,
+    seed: int = 0,
+    errors: ErrorRates | None = None,
+    as_of: date | None = None,
+) -> pl.DataFrame:
+    """Members `start + 1` to `start + rows`
+
+    The same arguments always give the same members, so chunks can be
+    generated independently of each other.
+    """
+    rng = np.random.default_rng([seed, start])
+    today = (as_of or date.today()).toordinal() - EPOCH
+    member_ids = np.arange(start + 1, start + rows + 1, dtype=np.int64)
+    male = rng.random(rows) < 0.5
+
+    def choice(options: tuple[pl.Series, np.ndarray]) -> pl.Series:
+        values, weights = options
+        return values.gather(rng.choice(len(values), rows, p=weights))
+
+    def by_gender(options: dict[str, tuple[pl.Series, np.ndarray]]) -> pl.Series:
+        return pl.select(
+            pl.when(pl.lit(male))
+            .then(choice(options["Male"]))
+            .otherwise(choice(options["Female"]))
+        ).to_series()
+
+    dob = today - rng.integers(18 * YEAR, 110 * YEAR, rows)
+    joining_span = np.minimum(75 * YEAR, today - dob - 18 * YEAR)
+    joined = dob + 18 * YEAR + rng.integers(0, joining_span + 1)
+    died = rng.random(rows) < 0.1
+    death = joined + rng.integers(0, today - joined + 1)
+
+    members = pl.DataFrame(
+        {
+            "Member ID": member_ids,
+            "Gender": pl.Series(["Female", "Male"]).gather(male.astype(np.int8)),
+            "Title": by_gender(TITLES),
+            "Forename": by_gender(FORENAMES),
+            "Surname": choice(SURNAMES),
+            "Nino": generate_ni_numbers(member_ids),
+            "Date Of Birth": dob,
+            "Joining Date": joined,
+            "Date Of Death": pl.Series(death).set(pl.Series(~died), None),
+            "Status": pl.Series(STATUSES).gather(rng.integers(0, 3, rows)),
+        }
+    ).with_columns(
+        pl.col("Date Of Birth", "Joining Date", "Date Of Death").cast(pl.Date)
+    )
+    return introduce_errors(members, rng, errors or ErrorRates())
+
+
+def introduce_errors(
+    members: pl.DataFrame, rng: np.random.Generator, errors: ErrorRates
+) -> pl.DataFrame:
+    """Introduce some bad data, each kind into `rate` of the rows on average"""
+
+    def rows(rate: float) -> np.ndarray:
+        count = min(rng.binomial(members.height, rate), members.height)
+        return rng.choice(members.height, count, replace=False)
+
+    def duplicated(column: str, rate: float) -> pl.Series:
+        ix = rows(rate)
+        source = rng.integers(0, members.height, len(ix))
+        return members[column].scatter(ix, members[column].gather(source))
+
+    dob_rows = rows(errors.dob_after_joining)
+    return members.with_columns(
+        # Duplicate Member ID
+        duplicated("Member ID", errors.duplicate_member_id),
+        # No gender marker
+        members["Gender"].scatter(rows(errors.null_gender), None),
+        # Duplicate Nino, then invalid Nino
+        duplicated("Nino", errors.duplicate_nino).scatter(
+            rows(errors.invalid_nino), "ABC123"
+        ),
+        # Invalid Status
+        members["Status"].scatter(rows(errors.invalid_status), "Inactive"),
+        # DOB > Join Date
+        members["Date Of Birth"].scatter(
+            dob_rows, members["Joining Date"].gather(dob_rows) + timedelta(days=1)
+        ),
+    )
+
+
+def iter_members(
+    rows: int, chunk_rows: int = 1_000_000, **kwargs
+) -> Iterator[pl.DataFrame]:
+    """Generate `rows` members in chunks of `chunk_rows`"""
+    for start in range(0, rows, chunk_rows):
+        yield generate_members(min(chunk_rows, rows - start), start=start, **kwargs)
+
+
+def write_members(
+    output: str | Path,
+    rows: int,
+    chunk_rows: int = 1_000_000,
+    file_format: Literal["parquet", "csv"] = "parquet",
+    **kwargs,
+) -> list[Path]:
+    """Write `rows` members to `output` as one file per chunk"""
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i, chunk in enumerate(iter_members(rows, chunk_rows, **kwargs)):
+        paths.append(output / f"part-{i:05}.{file_format}")
+        if file_format == "csv":
+            chunk.write_csv(paths[-1])
+        else:
+            chunk.write_parquet(paths[-1])
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=float, default=1e6)
+    parser.add_argument("--chunk-rows", type=float, default=1e6)
+    parser.add_argument("--format", choices=["parquet", "csv"], default="parquet")
+    parser.add_argument("--output", default="members")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--as-of", type=date.fromisoformat, help="Defaults to today")
+    for field in fields(ErrorRates):
+        parser.add_argument(
+            f"--{field.name.replace('_', '-')}", type=float, default=field.default
+        )
+    args = parser.parse_args()
+
+    paths = write_members(
+        args.output,
+        int(args.rows),
+        int(args.chunk_rows),
+        args.format,
+        seed=args.seed,
+        as_of=args.as_of,
+        errors=ErrorRates(
+            **{field.name: getattr(args, field.name) for field in fields(ErrorRates)}
+        ),
+    )
+    print(f"Wrote {int(args.rows)} members to {len(paths)} files in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,54 +1,74 @@
 from dataframe_validator import (
-    PolarsDataFrameValidator,
+    ExpectationSuite,
     DataValidationError,
+    ResultCache,
 )
 import polars as pl
 from pathlib import Path
 
-customers = pl.read_csv(Path(__file__).parent / "pension_scheme_members.csv")
+customers = pl.scan_csv(Path(__file__).parent / "pension_scheme_members.csv")
+
+# Failing rows are reported with these and the columns the suite reads
+KEY_COLUMNS = ["Member ID"]
+
+# Compiled once, applied on every call
+members_suite = (
+    ExpectationSuite(name="members")
+    .add("expect_column_to_exist", "Member ID")
+    .add("expect_column_to_contain_unique_values", "Member ID")
+    .add("expect_column_to_contain_unique_values", "Nino")
+    .add("expect_column_value_to_match_regex", "Nino", r"^[A-Z]{2}\d{6}[A-D]$")
+    .add("expect_column_value_to_be_in_set", "Status", ["Active", "Retired", "Deferred"])
+    .compile()
+)
 
 def validate_members(
-    members: pl.DataFrame,
+    members: pl.DataFrame | pl.LazyFrame,
     show_results: bool = True,
     show_fails: bool = False,
     quarantine: bool = False,
     throw: bool = False,
+    cache: ResultCache | None = None,
 ) -> bool:
     """Returns True if the Members DataFrame passes all validation checks, False otherwise"""
-    validator = (
-        PolarsDataFrameValidator(members)
-        .expect_column_to_exist("Member ID")
-        .expect_column_to_contain_unique_values("Member ID")
-        .expect_column_to_contain_unique_values("Nino")
-        .expect_column_value_to_be_in_set("Status", ["Active", "Retired", "Deferred"])
+    validator = members_suite.validate(
+        members,
+        cache=cache,
+        key_columns=KEY_COLUMNS,
+        # Only gatekeeping, stop at the first failure, cheapest checks first
+        max_failures=1 if throw else None,
     )
     if show_results:
         validator.show_results()
     if show_fails:
         validator.show_failures()
     if quarantine:
-        output_path = Path(__file__).parent / "fail_pension_scheme_members.csv"
-        validator.validation_fails.write_csv(output_path)
+        # One directory of Parquet files per failed expectation, see quarantine.json
+        validator.write_quarantine(Path(__file__).parent / "quarantine")
     if throw:
         validator.throw_error_if_invalid()
 
     return validator.is_valid
 
 
-# Run the validator and see results
-is_valid = validate_members(customers, show_results=True, show_fails=True, quarantine=True,)
-print(f"Members dataframe is{' ' if is_valid else ' not '}valid")
+if __name__ == "__main__":
+    # Unchanged data is only validated once across the calls below
+    cache = ResultCache(Path(__file__).parent / ".validation_cache")
 
+    # Run the validator and see results
+    is_valid = validate_members(customers, show_results=True, show_fails=True, quarantine=True, cache=cache)
+    print(f"Members dataframe is{' ' if is_valid else ' not '}valid")
 
-# Run the validator, see results and quarantine the failed rows
-validate_members(customers, quarantine=True)
 
-# Run the validator and throw an error if invalid
-try:
-    validate_members(
-        customers, quarantine=True, throw=True, show_results=False, show_fails=False
-    )
-except DataValidationError as err:
-    print("Caught the error")
-    print(err)
-    # Do something with the error, eg stop pipeline execution
+    # Run the validator, see results and quarantine the failed rows
+    validate_members(customers, quarantine=True, cache=cache)
+
+    # Run the validator and throw an error if invalid
+    try:
+        validate_members(
+            customers, quarantine=True, throw=True, show_results=False, show_fails=False, cache=cache
+        )
+    except DataValidationError as err:
+        print("Caught the error")
+        print(err)
+        # Do something with the error, eg stop pipeline execution
@@ -1,32 +1,39 @@
-from dataframe_validator import (
-    ValidatorDataFrame,
-)
+from dataframe_validator import ExpectationSuite
 import polars as pl
 from pathlib import Path
 
-df = pl.read_csv(Path(__file__).parent / "pension_scheme_members.csv")
-#df = df.filter(pl.col("Status") == "Retired")#.select(pl.exclude("Surname"))
+members_suite = (
+    ExpectationSuite(name="members")
+    .add(
+        "expect_columns_to_exist",
+        [
+            "Member ID",
+            "Gender",
+            "Title",
+            "Forename",
+            "Surname",
+            "Nino",
+            "Date Of Birth",
+            "Joining Date",
+        ],
+    )
+    .add("expect_column_to_contain_unique_values", "Member ID")
+    .add("expect_column_to_contain_unique_values", "Nino")
+    .add("expect_column_value_to_be_in_set", "Status", ["Active", "Retired", "Deferred"])
+    .add("expect_column_a_greater_than_column_b", "Joining Date", "Date Of Birth")
+    .compile()
+)
+
+# Only the columns the suite reads are loaded
+lf = members_suite.project(pl.scan_csv(Path(__file__).parent / "pension_scheme_members.csv"))
+#lf = lf.filter(pl.col("Status") == "Retired")#.select(pl.exclude("Surname"))
 
-df = ValidatorDataFrame(df)
+df = lf.collect(engine="streaming")
 
 with pl.Config(tbl_cols=len(df.columns)):
     print(df.head(10))
 
-(
-    df
-    .expect_column_to_exist("Member ID")
-    .expect_column_to_exist("Gender")
-    .expect_column_to_exist("Title")
-    .expect_column_to_exist("Forename")
-    .expect_column_to_exist("Surname")
-    .expect_column_to_exist("Nino")
-    .expect_column_to_exist("Date Of Birth")
-    .expect_column_to_exist("Joining Date")
-    .expect_column_to_contain_unique_values("Member ID")
-    .expect_column_to_contain_unique_values("Nino")
-    .expect_column_value_to_be_in_set("Status", ["Active", "Retired", "Deferred"])
-    .expect_column_a_greater_than_column_b("Joining Date","Date Of Birth")
-    .show_results()
-    .show_failures()
-)
-
+# The validate namespace wraps the frame without copying it, and keeps the
+# expectations through transformations
+members_suite.apply(df.validate).show_results()
+df.validate.filter(pl.col("Status") == "Active").show_results().show_failures()